@@ -5,9 +5,20 @@ from collections.abc import Callable, Sequence
 from pathlib import Path
 from typing import Literal
 
+from minesweeper.ai.registry import CHAINS, StrategyRegistry, load_chain, parse_chain
+from minesweeper.ai.strategy import AIStrategy
 from minesweeper.app import App
 from minesweeper.domain.tile import Tile
-from minesweeper.domain.types import AI_ONLY, HYBRID, PLAYER_ONLY, Coord, GameConfig, GameMode, TileState
+from minesweeper.domain.types import (
+    AI_ONLY,
+    HYBRID,
+    PLAYER_ONLY,
+    RENDERERS,
+    Coord,
+    GameConfig,
+    GameMode,
+    TileState,
+)
 from minesweeper.external.runtime import STOP_REASONS
 
 ExternalMode = Literal["external"]
@@ -38,16 +49,61 @@ def build_parser() -> argparse.ArgumentParser:
         default=defaults.font_size_px,
         help="UI font size in pixels",
     )
+    parser.add_argument(
+        "--strategy-workers",
+        type=int,
+        default=defaults.strategy_workers,
+        help="Evaluate local AI strategies speculatively on this many threads",
+    )
+    parser.add_argument(
+        "--max-fps",
+        type=int,
+        default=defaults.max_fps,
+        help="Render local games at most this many times per second",
+    )
+    parser.add_argument(
+        "--turbo",
+        action="store_true",
+        help="Let the local AI play as fast as it can instead of one batch per frame",
+    )
+    parser.add_argument(
+        "--renderer",
+        choices=RENDERERS,
+        default=defaults.renderer,
+        help="Draw local games in a pygame window, as text in the terminal, or not at all",
+    )
+    parser.add_argument(
+        "--games",
+        type=int,
+        help="Stop local games after this many finished games",
+    )
+    parser.add_argument(
+        "--strategies",
+        help=(
+            "Comma-separated strategy names to run in order, or a preset chain "
+            f"({', '.join(CHAINS)})"
+        ),
+    )
+    parser.add_argument(
+        "--strategies-file",
+        type=Path,
+        help="Read the strategy chain from a file with one name per line",
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
-        help="Print external runtime progress and stop reasons",
+        help="Print runtime progress, stop reasons and per-strategy stats at session end",
     )
     parser.add_argument(
         "--debug-captures",
         type=Path,
         help="Write temporary raw external screenshots to the given directory",
     )
+    parser.add_argument(
+        "--classification-memo",
+        type=Path,
+        help="Keep external tile classifications in this directory, one file per calibration",
+    )
     return parser
 
 
@@ -66,6 +122,7 @@ def main(argv: Sequence[str] | None = None) -> int:
     parser = build_parser()
     args = parser.parse_args(list(argv) if argv is not None else None)
     mode = parse_mode(args.mode)
+    chain = _parse_strategies(parser, args)
 
     if mode == "external":
         from minesweeper.external import run as run_external
@@ -73,21 +130,31 @@ def main(argv: Sequence[str] | None = None) -> int:
         run_external(
             output=print if args.verbose else None,
             debug_capture_dir=args.debug_captures,
+            classification_memo_dir=args.classification_memo,
+            strategies=None if chain is None else StrategyRegistry().chain(chain),
         )
         return 0
 
     if mode == "browser-dom":
         if args.debug_captures is not None:
             parser.error("--debug-captures is not supported with --mode browser-dom")
+        if args.classification_memo is not None:
+            parser.error("--classification-memo is not supported with --mode browser-dom")
 
         try:
-            reason = _run_browser_dom(output=print if args.verbose else None)
+            reason = _run_browser_dom(
+                output=print if args.verbose else None,
+                strategies=None if chain is None else StrategyRegistry().chain(chain),
+            )
         except OSError as exc:
             parser.error(f"browser-dom HTTP bridge could not bind: {exc}")
         if reason == STOP_REASONS.board_refresh_failed_after_retry:
             parser.error("browser-dom mode requires a connected extension session")
         return 0
 
+    if args.renderer != "pygame" and mode != AI_ONLY:
+        parser.error(f"--renderer {args.renderer} has no input and requires --mode ai")
+
     try:
         config = GameConfig(
             width=args.width,
@@ -95,14 +162,36 @@ def main(argv: Sequence[str] | None = None) -> int:
             num_mines=args.mines,
             tile_size_px=args.tile_size,
             font_size_px=args.font_size,
+            strategy_workers=args.strategy_workers,
+            max_fps=args.max_fps,
+            ai_turbo=args.turbo,
+            renderer=args.renderer,
+            max_games=args.games,
+            strategies=chain,
         )
     except ValueError as exc:
         parser.error(str(exc))
 
-    App(config, mode).run()
+    App(config, mode, output=print if args.verbose else None).run()
     return 0
 
 
+def _parse_strategies(parser: argparse.ArgumentParser, args: argparse.Namespace) -> tuple[str, ...] | None:
+    if args.strategies is not None and args.strategies_file is not None:
+        parser.error("pass either --strategies or --strategies-file, not both")
+
+    try:
+        if args.strategies_file is not None:
+            return load_chain(args.strategies_file)
+        if args.strategies is not None:
+            return parse_chain(args.strategies)
+    except OSError as exc:
+        parser.error(f"could not read strategy chain: {exc}")
+    except ValueError as exc:
+        parser.error(str(exc))
+    return None
+
+
 class _BrowserDomReader:
     def __init__(self) -> None:
         self.width = 0
@@ -154,6 +243,7 @@ def _run_browser_dom(
     executor_factory: Callable[[str, Callable[[object], None]], object] | None = None,
     app_factory: Callable[..., object] | None = None,
     session_id: str = "browser-dom",
+    strategies: Sequence[AIStrategy] | None = None,
 ) -> str:
     if bridge_factory is None:
         from minesweeper.external.browser.bridge.server import BrowserBridgeServer
@@ -187,6 +277,7 @@ def _run_browser_dom(
             board_reader=board_reader,
             executor=executor,
             output=output,
+            strategies=strategies,
         )
         return app.run()
     finally:
@@ -1,6 +1,11 @@
 from dataclasses import dataclass, field
-from typing import Mapping, Sequence
+from functools import cached_property
+from types import MappingProxyType
+from typing import AbstractSet, Mapping, Sequence
 
+from minesweeper.ai.constraint import Constraint
+from minesweeper.ai.coord_set import CoordSet
+from minesweeper.ai.probability import ProbabilityMap, compute_probability_map
 from minesweeper.domain.board import BoardView
 from minesweeper.domain.types import Coord, TileState
 
@@ -12,17 +17,84 @@ class AnalyzedBoard:
 
     grid: Mapping[Coord, int] = field(default_factory=dict)
     frontier: Sequence[Coord] = field(default_factory=list)
-    unknown_coords: frozenset[Coord] = field(default_factory=frozenset)
-    flagged_coords: frozenset[Coord] = field(default_factory=frozenset)
+    unknown_coords: CoordSet = field(default_factory=lambda: CoordSet(0, 0))
+    flagged_coords: CoordSet = field(default_factory=lambda: CoordSet(0, 0))
     total_mines: int = 0
+    width: int = 0
+    height: int = 0
+
+    def __post_init__(self) -> None:
+        # Plain sets are accepted for convenience and stored as CoordSets.
+        unknown: AbstractSet[Coord] = self.unknown_coords
+        flagged: AbstractSet[Coord] = self.flagged_coords
+        if isinstance(unknown, CoordSet) and isinstance(flagged, CoordSet):
+            return
+
+        coords = [*self.grid, *unknown, *flagged]
+        origin = Coord(min([0, *(coord.x for coord in coords)]), min([0, *(coord.y for coord in coords)]))
+        width = max([self.width, *(coord.x + 1 for coord in coords)]) - origin.x
+        height = max([self.height, *(coord.y + 1 for coord in coords)]) - origin.y
+        if not isinstance(unknown, CoordSet):
+            object.__setattr__(self, "unknown_coords", CoordSet.from_coords(width, height, unknown, origin))
+        if not isinstance(flagged, CoordSet):
+            object.__setattr__(self, "flagged_coords", CoordSet.from_coords(width, height, flagged, origin))
+
+    @cached_property
+    def frontier_constraints(self) -> Mapping[Coord, Constraint]:
+        constraints: dict[Coord, Constraint] = {}
+        for coord in self.frontier:
+            value = self.grid.get(coord)
+            if value is None:
+                continue
+
+            unknowns = frozenset(self.unknown_coords.neighbors_in(coord))
+            flagged = self.flagged_coords.count_neighbors(coord)
+            constraints[coord] = Constraint(unknowns=unknowns, mines_needed=value - flagged)
+
+        return MappingProxyType(constraints)
+
+    @cached_property
+    def constraints(self) -> tuple[Constraint, ...]:
+        return tuple(
+            constraint
+            for constraint in self.frontier_constraints.values()
+            if constraint.unknowns
+        )
+
+    @cached_property
+    def probability_map(self) -> ProbabilityMap:
+        return compute_probability_map(self)
 
 
 class Analyzer:
+    """
+    Builds an AnalyzedBoard per board state.
+
+    Boards that expose a `version` counter get their last analysis back
+    while the version is unchanged, so cached products such as the
+    probability map are computed once per state and shared by every caller.
+    """
+
+    def __init__(self) -> None:
+        self._last: tuple[BoardView, int, AnalyzedBoard] | None = None
+
     def analyze(self, board: BoardView) -> AnalyzedBoard:
+        version = getattr(board, "version", None)
+        if version is not None and self._last is not None:
+            last_board, last_version, last_analysis = self._last
+            if last_board is board and last_version == version:
+                return last_analysis
+
+        analysis = self._analyze(board)
+        if version is not None:
+            self._last = (board, version, analysis)
+        return analysis
+
+    def _analyze(self, board: BoardView) -> AnalyzedBoard:
         grid: dict[Coord, int] = {}
         frontier: list[Coord] = []
-        unknown_coords: set[Coord] = set()
-        flagged_coords: set[Coord] = set()
+        unknown_flags = bytearray(board.width * board.height)
+        flagged_flags = bytearray(board.width * board.height)
 
         for x in range(board.width):
             for y in range(board.height):
@@ -31,16 +103,17 @@ class Analyzer:
 
                 if tile.state == TileState.FLAGGED:
                     grid[coord] = AnalyzedBoard.FLAGGED
-                    flagged_coords.add(coord)
+                    flagged_flags[x * board.height + y] = 1
                     continue
 
                 if tile.state == TileState.HIDDEN:
                     grid[coord] = AnalyzedBoard.UNKNOWN
-                    unknown_coords.add(coord)
+                    unknown_flags[x * board.height + y] = 1
                     continue
 
                 grid[coord] = tile.adjacent_mines
 
+        unknown_coords = CoordSet(board.width, board.height, unknown_flags)
         for x in range(board.width):
             for y in range(board.height):
                 coord = Coord(x, y)
@@ -48,16 +121,15 @@ class Analyzer:
                 if value <= 0:
                     continue
 
-                if any(
-                    neighbor in unknown_coords
-                    for neighbor in coord.neighbors()
-                ):
+                if unknown_coords.count_neighbors(coord):
                     frontier.append(coord)
 
         return AnalyzedBoard(
             grid=grid,
             frontier=frontier,
-            unknown_coords=frozenset(unknown_coords),
-            flagged_coords=frozenset(flagged_coords),
+            unknown_coords=unknown_coords,
+            flagged_coords=CoordSet(board.width, board.height, flagged_flags),
             total_mines=board.num_mines,
+            width=board.width,
+            height=board.height,
         )
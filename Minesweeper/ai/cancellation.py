@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+
+class StrategyCancelled(Exception):
+    """Raised inside a strategy call once its runner has dropped the result."""
+
+
+_cancel_event: ContextVar[threading.Event | None] = ContextVar("strategy_cancel_event", default=None)
+
+
+def raise_if_cancelled() -> None:
+    """
+    Stop the current strategy call if it was cancelled.
+
+    Long-running searches call this every so often. Outside a call started
+    under `cancellable` it does nothing, so direct callers are unaffected.
+    """
+    event = _cancel_event.get()
+    if event is not None and event.is_set():
+        raise StrategyCancelled
+
+
+@contextmanager
+def cancellable(event: threading.Event) -> Iterator[None]:
+    """Make `raise_if_cancelled` in this thread honour `event` for the duration of the block."""
+    token = _cancel_event.set(event)
+    try:
+        yield
+    finally:
+        _cancel_event.reset(token)
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Set
+from typing import Any, TypeGuard, TypeVar
+
+from minesweeper.domain.types import Coord
+
+T = TypeVar("T")
+
+
+class CoordSet(Set[Coord]):
+    """
+    Immutable set of board coordinates stored as one flag byte per tile.
+
+    Tiles are indexed column-major from `origin`, so iteration yields
+    coordinates in the same order as `sorted()`. Membership is a single
+    byte lookup, and set algebra between sets of the same board shape runs
+    over the packed flags instead of hashing `Coord` tuples. Algebra with
+    any other set, including a `CoordSet` of another shape, returns a plain
+    `frozenset`, exactly as a `frozenset` operand would.
+    """
+
+    __slots__ = ("_width", "_height", "_origin", "_flags", "_count")
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        flags: bytes | bytearray | None = None,
+        origin: Coord = Coord(0, 0),
+    ) -> None:
+        if width < 0 or height < 0:
+            raise ValueError(f"invalid board shape {width}x{height}")
+        if flags is None:
+            flags = bytes(width * height)
+        elif len(flags) != width * height:
+            raise ValueError(f"expected {width * height} flags for a {width}x{height} board, got {len(flags)}")
+
+        self._width = width
+        self._height = height
+        self._origin = origin
+        self._flags = bytes(flags)
+        self._count = self._flags.count(1)
+
+    @classmethod
+    def from_coords(
+        cls,
+        width: int,
+        height: int,
+        coords: Iterable[Coord],
+        origin: Coord = Coord(0, 0),
+    ) -> CoordSet:
+        flags = bytearray(width * height)
+        for coord in coords:
+            x = coord[0] - origin.x
+            y = coord[1] - origin.y
+            if not (0 <= x < width and 0 <= y < height):
+                raise ValueError(f"{coord} is outside the {width}x{height} board at {origin}")
+            flags[x * height + y] = 1
+        return cls(width, height, flags, origin)
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @property
+    def height(self) -> int:
+        return self._height
+
+    @property
+    def origin(self) -> Coord:
+        return self._origin
+
+    def __contains__(self, coord: object) -> bool:
+        if not isinstance(coord, tuple) or len(coord) != 2:
+            return False
+        x, y = coord
+        if not isinstance(x, int) or not isinstance(y, int):
+            return False
+        x -= self._origin.x
+        y -= self._origin.y
+        return 0 <= x < self._width and 0 <= y < self._height and self._flags[x * self._height + y] == 1
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[Coord]:
+        flags = self._flags
+        height = self._height
+        origin_x, origin_y = self._origin
+        index = flags.find(1)
+        while index >= 0:
+            x, y = divmod(index, height)
+            yield Coord(origin_x + x, origin_y + y)
+            index = flags.find(1, index + 1)
+
+    def __repr__(self) -> str:
+        return f"CoordSet({self._width}x{self._height}, {sorted(self)!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if self._same_shape(other):
+            return self._flags == other._flags
+        return super().__eq__(other)
+
+    def __hash__(self) -> int:
+        # Equal to a frozenset holding the same coordinates, so it must hash like one.
+        return self._hash()
+
+    def __le__(self, other: Set[Any]) -> bool:
+        if self._same_shape(other):
+            return self._packed() & ~other._packed() == 0
+        return super().__le__(other)
+
+    def __and__(self, other: Set[Any]) -> CoordSet | frozenset[Coord]:
+        if self._same_shape(other):
+            return self._unpack(self._packed() & other._packed())
+        return frozenset(self) & _as_frozenset(other)
+
+    __rand__ = __and__
+
+    def __or__(self, other: Set[T]) -> CoordSet | frozenset[Coord | T]:
+        if self._same_shape(other):
+            return self._unpack(self._packed() | other._packed())
+        return frozenset(self) | _as_frozenset(other)
+
+    __ror__ = __or__
+
+    def __sub__(self, other: Set[Any]) -> CoordSet | frozenset[Coord]:
+        if self._same_shape(other):
+            return self._unpack(self._packed() & ~other._packed())
+        return frozenset(self) - _as_frozenset(other)
+
+    def __rsub__(self, other: Set[T]) -> frozenset[T]:
+        return _as_frozenset(other) - frozenset(self)
+
+    def __xor__(self, other: Set[T]) -> CoordSet | frozenset[Coord | T]:
+        if self._same_shape(other):
+            return self._unpack(self._packed() ^ other._packed())
+        return frozenset(self) ^ _as_frozenset(other)
+
+    __rxor__ = __xor__
+
+    def isdisjoint(self, other: Iterable[Any]) -> bool:
+        if self._same_shape(other):
+            return self._packed() & other._packed() == 0
+        return super().isdisjoint(other)
+
+    def without(self, *coords: Coord) -> CoordSet:
+        flags = bytearray(self._flags)
+        for coord in coords:
+            x = coord.x - self._origin.x
+            y = coord.y - self._origin.y
+            if 0 <= x < self._width and 0 <= y < self._height:
+                flags[x * self._height + y] = 0
+        return CoordSet(self._width, self._height, flags, self._origin)
+
+    def neighbors_in(self, coord: Coord) -> list[Coord]:
+        """The members among `coord.neighbors()`, in that order."""
+        origin_x, origin_y = self._origin
+        x = coord.x - origin_x
+        y = coord.y - origin_y
+        width = self._width
+        height = self._height
+        flags = self._flags
+        found: list[Coord] = []
+        for nx in (x - 1, x, x + 1):
+            if not 0 <= nx < width:
+                continue
+            column = nx * height
+            for ny in (y - 1, y, y + 1):
+                if 0 <= ny < height and (nx != x or ny != y) and flags[column + ny]:
+                    found.append(Coord(origin_x + nx, origin_y + ny))
+        return found
+
+    def count_neighbors(self, coord: Coord) -> int:
+        x = coord.x - self._origin.x
+        y = coord.y - self._origin.y
+        width = self._width
+        height = self._height
+        flags = self._flags
+        count = 0
+        for nx in (x - 1, x, x + 1):
+            if not 0 <= nx < width:
+                continue
+            column = nx * height
+            for ny in (y - 1, y, y + 1):
+                if 0 <= ny < height and (nx != x or ny != y):
+                    count += flags[column + ny]
+        return count
+
+    @classmethod
+    def _from_iterable(cls, coords: Iterable[Any]) -> frozenset[Any]:
+        return frozenset(coords)
+
+    def _same_shape(self, other: object) -> TypeGuard[CoordSet]:
+        return (
+            isinstance(other, CoordSet)
+            and other._width == self._width
+            and other._height == self._height
+            and other._origin == self._origin
+        )
+
+    def _packed(self) -> int:
+        # Each flag byte is 0 or 1, so bitwise operations on the packed
+        # integer keep every byte 0 or 1.
+        return int.from_bytes(self._flags, "little")
+
+    def _unpack(self, packed: int) -> CoordSet:
+        return CoordSet(self._width, self._height, packed.to_bytes(len(self._flags), "little"), self._origin)
+
+
+def _as_frozenset(values: Iterable[T]) -> frozenset[T]:
+    return values if isinstance(values, frozenset) else frozenset(values)
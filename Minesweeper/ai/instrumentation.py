@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+
+from minesweeper.ai.analyzer import AnalyzedBoard
+from minesweeper.ai.strategy import AIStrategy
+from minesweeper.domain.move import Move
+
+
+@dataclass(frozen=True)
+class StrategyStats:
+    name: str
+    calls: int = 0
+    hits: int = 0
+    moves: int = 0
+    total_seconds: float = 0.0
+    p50_seconds: float = 0.0
+    p99_seconds: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.calls if self.calls else 0.0
+
+    def describe(self) -> str:
+        return (
+            f"{self.name}: {self.calls} calls, {self.hit_rate:.1%} hit rate, "
+            f"{self.moves} moves, total {self.total_seconds * 1000:.1f} ms, "
+            f"p50 {self.p50_seconds * 1000:.3f} ms, p99 {self.p99_seconds * 1000:.3f} ms"
+        )
+
+
+@dataclass
+class _StrategyTally:
+    calls: int = 0
+    hits: int = 0
+    moves: int = 0
+    total_seconds: float = 0.0
+    samples: deque[float] = field(default_factory=lambda: deque(maxlen=StrategyProfiler.SAMPLE_LIMIT))
+
+
+def _percentile(ordered: Sequence[float], fraction: float) -> float:
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+class StrategyProfiler:
+    """
+    Records latency and hit rate for every `find_moves` call it measures.
+
+    Counts and totals are exact; percentiles are taken over the most recent
+    `SAMPLE_LIMIT` calls per strategy so long sessions stay bounded. Safe to
+    share with a speculative `StrategyRunner`.
+    """
+
+    SAMPLE_LIMIT = 10_000
+
+    def __init__(self, clock: Callable[[], float] | None = None) -> None:
+        self._clock = clock or time.perf_counter
+        self._lock = threading.Lock()
+        self._tallies: dict[str, _StrategyTally] = {}
+
+    def measure(self, strategy: AIStrategy, analysis: AnalyzedBoard) -> Sequence[Move]:
+        started = self._clock()
+        moves = strategy.find_moves(analysis)
+        self.record(strategy.name, self._clock() - started, len(moves))
+        return moves
+
+    def record(self, name: str, seconds: float, move_count: int) -> None:
+        with self._lock:
+            tally = self._tallies.get(name)
+            if tally is None:
+                tally = _StrategyTally()
+                self._tallies[name] = tally
+
+            tally.calls += 1
+            tally.hits += move_count > 0
+            tally.moves += move_count
+            tally.total_seconds += seconds
+            tally.samples.append(seconds)
+
+    def stats(self) -> list[StrategyStats]:
+        """Per-strategy statistics in the order strategies were first measured."""
+        with self._lock:
+            snapshot = [
+                (name, tally.calls, tally.hits, tally.moves, tally.total_seconds, sorted(tally.samples))
+                for name, tally in self._tallies.items()
+            ]
+
+        return [
+            StrategyStats(
+                name=name,
+                calls=calls,
+                hits=hits,
+                moves=moves,
+                total_seconds=total_seconds,
+                p50_seconds=_percentile(ordered, 0.50),
+                p99_seconds=_percentile(ordered, 0.99),
+            )
+            for name, calls, hits, moves, total_seconds, ordered in snapshot
+        ]
+
+    def report_lines(self) -> list[str]:
+        stats = self.stats()
+        if not stats:
+            return []
+        return ["Strategy stats:", *(f"  {entry.describe()}" for entry in stats)]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._tallies.clear()
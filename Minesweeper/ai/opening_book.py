@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import argparse
+import json
+import random
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from math import sqrt
+from pathlib import Path
+
+from minesweeper.ai.analyzer import AnalyzedBoard
+from minesweeper.domain.types import PRESETS, Coord, GameConfig
+
+BOOK_DIR = Path(__file__).resolve().parent.parent / "resources" / "openings"
+
+
+def state_key(revealed: Iterable[tuple[Coord, int]]) -> str:
+    return ";".join(
+        f"{coord.x},{coord.y},{value}"
+        for coord, value in sorted(revealed, key=lambda item: (item[0].x, item[0].y))
+    )
+
+
+def book_path(width: int, height: int, num_mines: int, root: Path = BOOK_DIR) -> Path:
+    return root / f"{width}x{height}-{num_mines}.json"
+
+
+@dataclass(frozen=True)
+class OpeningBook:
+    """Best early clicks for one board configuration, keyed by revealed state."""
+
+    width: int
+    height: int
+    num_mines: int
+    moves: Mapping[str, Coord] = field(default_factory=dict)
+
+    def move_for(self, analysis: AnalyzedBoard) -> Coord | None:
+        revealed = [
+            (coord, value)
+            for coord, value in analysis.grid.items()
+            if value >= 0
+        ]
+        coord = self.moves.get(state_key(revealed))
+        if coord is None or coord not in analysis.unknown_coords:
+            return None
+        return coord
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "width": self.width,
+                "height": self.height,
+                "num_mines": self.num_mines,
+                "moves": {key: [coord.x, coord.y] for key, coord in sorted(self.moves.items())},
+            },
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_json(cls, text: str) -> OpeningBook:
+        payload = json.loads(text)
+        return cls(
+            width=payload["width"],
+            height=payload["height"],
+            num_mines=payload["num_mines"],
+            moves={key: Coord(x, y) for key, (x, y) in payload["moves"].items()},
+        )
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(self.to_json(), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: Path) -> OpeningBook:
+        return cls.from_json(path.read_text(encoding="utf-8"))
+
+
+SHORTLIST = 5
+CONFIDENCE_Z = 1.96
+
+
+@dataclass
+class _ClickTally:
+    samples: int = 0
+    openings: int = 0
+    deaths: int = 0
+
+    def record(self, is_mine: bool, adjacent_mines: int) -> None:
+        self.samples += 1
+        if is_mine:
+            self.deaths += 1
+        elif adjacent_mines == 0:
+            self.openings += 1
+
+    def lower_bound(self) -> float:
+        """
+        Wilson lower bound on the chance of reaching an opening before a mine.
+
+        A safe non-opening click is treated as "guess again from the same
+        spot", so that chance is openings / (openings + deaths). Ranking by
+        the lower bound keeps a tile that got lucky in a handful of samples
+        from beating one that opened reliably in hundreds.
+        """
+        decisive = self.openings + self.deaths
+        if decisive == 0:
+            return 0.0
+        rate = self.openings / decisive
+        z2 = CONFIDENCE_Z * CONFIDENCE_Z
+        centre = rate + z2 / (2 * decisive)
+        margin = CONFIDENCE_Z * sqrt(rate * (1 - rate) / decisive + z2 / (4 * decisive * decisive))
+        return (centre - margin) / (1 + z2 / decisive)
+
+    def opening_rate(self) -> float:
+        return self.openings / self.samples if self.samples else 0.0
+
+
+class _Layouts:
+    """
+    Mine layouts of seeded games, as cell indices in the engine's order.
+
+    Mirrors `Board` (the same `sample` call over the same x-major cell
+    order) and the first-click relocation in `Game`, without building
+    either, so thousands of games per book entry stay cheap.
+    """
+
+    def __init__(self, config: GameConfig) -> None:
+        self.config = config
+        self.coords = [Coord(x, y) for x in range(config.width) for y in range(config.height)]
+        index = {coord: position for position, coord in enumerate(self.coords)}
+        self.neighbors = [
+            [index[neighbor] for neighbor in coord.neighbors() if neighbor in index]
+            for coord in self.coords
+        ]
+
+    def mines(self, seed: int) -> set[int]:
+        return set(random.Random(seed).sample(range(len(self.coords)), self.config.num_mines))
+
+    def after_first_click(self, mines: set[int], click: int) -> set[int]:
+        if click not in mines:
+            return mines
+        target = next(cell for cell in range(len(self.coords)) if cell not in mines)
+        return (mines - {click}) | {target}
+
+    def counts(self, mines: set[int]) -> list[int]:
+        counts = [0] * len(self.coords)
+        for mine in mines:
+            for neighbor in self.neighbors[mine]:
+                counts[neighbor] += 1
+        return counts
+
+    def first_click_tallies(self, seeds: Iterable[int], cells: Iterable[int]) -> dict[int, _ClickTally]:
+        tallies = {cell: _ClickTally() for cell in cells}
+        for seed in seeds:
+            mines = self.mines(seed)
+            counts = self.counts(mines)
+            for cell, tally in tallies.items():
+                if cell in mines:
+                    # The engine moves a mine out from under the first click,
+                    # which can change that click's own count.
+                    moved = self.after_first_click(mines, cell)
+                    tally.record(False, sum(neighbor in moved for neighbor in self.neighbors[cell]))
+                else:
+                    tally.record(False, counts[cell])
+        return tallies
+
+    def follow_up_boards(self, seeds: Iterable[int], click: int) -> dict[int, list[tuple[set[int], list[int]]]]:
+        """Layouts after the first click, grouped by the value it revealed."""
+        buckets: dict[int, list[tuple[set[int], list[int]]]] = {}
+        for seed in seeds:
+            mines = self.after_first_click(self.mines(seed), click)
+            counts = self.counts(mines)
+            if counts[click] != 0:
+                buckets.setdefault(counts[click], []).append((mines, counts))
+        return buckets
+
+    def follow_up_tallies(
+        self,
+        boards: Sequence[tuple[set[int], list[int]]],
+        cells: Iterable[int],
+    ) -> dict[int, _ClickTally]:
+        tallies = {cell: _ClickTally() for cell in cells}
+        for mines, counts in boards:
+            for cell, tally in tallies.items():
+                tally.record(cell in mines, counts[cell])
+        return tallies
+
+    def corners(self) -> list[int]:
+        return [cell for cell, neighbors in enumerate(self.neighbors) if len(neighbors) <= 3]
+
+
+def build_opening_book(
+    config: GameConfig,
+    games: int = 4000,
+    seed: int = 0,
+    min_samples: int = 200,
+    holdout_games: int | None = None,
+) -> OpeningBook:
+    """
+    Simulate seeded games to pick the first click and the follow-up click.
+
+    The follow-up is chosen per value revealed by the first click, for every
+    value seen in at least `min_samples` games. Each choice is made in two
+    steps: the `SHORTLIST` best tiles by lower confidence bound over `games`
+    seeded games, plus every corner, are re-scored on `holdout_games`
+    (default: as many again) further seeds, and the best of those wins.
+    """
+    layouts = _Layouts(config)
+    holdout_games = games if holdout_games is None else holdout_games
+    training = range(seed, seed + games)
+    holdout = range(seed + games, seed + games + holdout_games)
+    cells = range(len(layouts.coords))
+
+    first_click = _choose(
+        layouts,
+        layouts.first_click_tallies(training, cells),
+        lambda shortlist: layouts.first_click_tallies(holdout, shortlist),
+    )
+    moves: dict[str, Coord] = {state_key([]): layouts.coords[first_click]}
+
+    training_buckets = layouts.follow_up_boards(training, first_click)
+    holdout_buckets = layouts.follow_up_boards(holdout, first_click)
+    follow_up_cells = [cell for cell in cells if cell != first_click]
+    for value, boards in sorted(training_buckets.items()):
+        if len(boards) < min_samples or value not in holdout_buckets:
+            continue
+
+        held_out = holdout_buckets[value]
+        choice = _choose(
+            layouts,
+            layouts.follow_up_tallies(boards, follow_up_cells),
+            lambda shortlist: layouts.follow_up_tallies(held_out, shortlist),
+        )
+        moves[state_key([(layouts.coords[first_click], value)])] = layouts.coords[choice]
+
+    return OpeningBook(
+        width=config.width,
+        height=config.height,
+        num_mines=config.num_mines,
+        moves=moves,
+    )
+
+
+def _choose(
+    layouts: _Layouts,
+    training: Mapping[int, _ClickTally],
+    score_holdout: Callable[[Sequence[int]], Mapping[int, _ClickTally]],
+) -> int:
+    def rank(tallies: Mapping[int, _ClickTally], cell: int) -> tuple[float, float, int, int, int]:
+        # Fewer neighbours (corners, then edges) and then the lowest
+        # coordinates break ties, so equal tiles pick the same way every build.
+        coord = layouts.coords[cell]
+        tally = tallies[cell]
+        return (tally.lower_bound(), tally.opening_rate(), -len(layouts.neighbors[cell]), -coord.x, -coord.y)
+
+    ordered = sorted(training, key=lambda cell: rank(training, cell), reverse=True)
+    shortlist = ordered[:SHORTLIST] + [cell for cell in layouts.corners() if cell in training]
+    shortlist = list(dict.fromkeys(shortlist))
+    held_out = score_holdout(shortlist)
+    return max(shortlist, key=lambda cell: rank(held_out, cell))
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m minesweeper.ai.opening_book")
+    parser.add_argument("--preset", choices=sorted(PRESETS), help="Standard board configuration")
+    parser.add_argument("--width", type=int, help="Board width for a custom configuration")
+    parser.add_argument("--height", type=int, help="Board height for a custom configuration")
+    parser.add_argument("--mines", type=int, help="Mine count for a custom configuration")
+    parser.add_argument("--games", type=int, default=4000, help="Simulated games to shortlist each click")
+    parser.add_argument(
+        "--holdout-games",
+        type=int,
+        help="Further simulated games to check the shortlist on (default: as many as --games)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="First simulation seed")
+    parser.add_argument("--output-dir", type=Path, default=BOOK_DIR, help="Directory for book files")
+    args = parser.parse_args(list(argv) if argv is not None else None)
+
+    if args.preset is not None:
+        config = PRESETS[args.preset]
+    elif None in (args.width, args.height, args.mines):
+        parser.error("pass --preset or all of --width, --height and --mines")
+    else:
+        try:
+            config = GameConfig(width=args.width, height=args.height, num_mines=args.mines)
+        except ValueError as exc:
+            parser.error(str(exc))
+
+    book = build_opening_book(config, games=args.games, seed=args.seed, holdout_games=args.holdout_games)
+    path = book_path(config.width, config.height, config.num_mines, args.output_dir)
+    book.save(path)
+    print(f"Wrote {len(book.moves)} opening entries to {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
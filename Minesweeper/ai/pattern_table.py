@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import argparse
+import random
+import struct
+from array import array
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import NamedTuple
+
+from minesweeper.ai.analyzer import AnalyzedBoard, Analyzer
+from minesweeper.ai.constraint import Constraint
+from minesweeper.ai.strategies.probability_solver import ProbabilitySolver
+from minesweeper.ai.strategies.unit_propagation import (
+    ComponentSearch,
+    UnitPropagationSolver,
+    split_components,
+)
+from minesweeper.domain.move import Move
+from minesweeper.domain.types import PRESETS, ActionType, Coord, GameConfig, GamePhase
+from minesweeper.engine.game import Game
+
+TABLE_PATH = Path(__file__).resolve().parent.parent / "resources" / "patterns.bin"
+
+# Window cell alphabet, four bits per cell.
+UNKNOWN = 9
+FLAG = 10
+CLEAR = 11  # revealed border number or off-board: never a mine, never a constraint
+_BITS = 4
+_MAGIC = b"MSPT"
+
+
+class WindowShape(NamedTuple):
+    """A window whose interior cells have their whole neighbourhood inside it."""
+
+    width: int
+    height: int
+
+    @property
+    def size(self) -> int:
+        return self.width * self.height
+
+    def is_interior(self, dx: int, dy: int) -> bool:
+        return 0 < dx < self.width - 1 and 0 < dy < self.height - 1
+
+
+WINDOW_SHAPES: tuple[WindowShape, ...] = (
+    WindowShape(4, 4),
+    WindowShape(5, 3),
+    WindowShape(3, 5),
+)
+
+
+class WindowDeduction(NamedTuple):
+    safe_mask: int
+    mine_mask: int
+
+    def pack(self) -> int:
+        return self.safe_mask | (self.mine_mask << 16)
+
+    @classmethod
+    def unpack(cls, packed: int) -> WindowDeduction:
+        return cls(packed & 0xFFFF, packed >> 16)
+
+
+def window_origin(anchor: Coord) -> Coord:
+    """Top-left cell of the window whose first interior cell is `anchor`."""
+    return Coord(anchor.x - 1, anchor.y - 1)
+
+
+def _window_cells(shape: WindowShape) -> tuple[tuple[int, int, int, bool], ...]:
+    return tuple(
+        (dx, dy, _BITS * (dy * shape.width + dx), shape.is_interior(dx, dy))
+        for dy in range(shape.height)
+        for dx in range(shape.width)
+    )
+
+
+_WINDOW_CELLS = {shape: _window_cells(shape) for shape in WINDOW_SHAPES}
+
+
+def encode_window(analysis: AnalyzedBoard, shape: WindowShape, anchor: Coord) -> int:
+    cells = _WINDOW_CELLS.get(shape) or _window_cells(shape)
+    grid = analysis.grid
+    left = anchor.x - 1
+    top = anchor.y - 1
+    key = 0
+    for dx, dy, shift, interior in cells:
+        value = grid.get(Coord(left + dx, top + dy))
+        if value is None:
+            symbol = CLEAR
+        elif value < 0:
+            symbol = UNKNOWN if value == AnalyzedBoard.UNKNOWN else FLAG
+        elif interior:
+            symbol = value
+        else:
+            symbol = CLEAR
+        key |= symbol << shift
+    return key
+
+
+def decode_window(shape: WindowShape, key: int) -> list[int]:
+    return [(key >> (_BITS * index)) & 0xF for index in range(shape.size)]
+
+
+def solve_window(shape: WindowShape, key: int) -> WindowDeduction:
+    symbols = decode_window(shape, key)
+    constraints: list[Constraint] = []
+    for dy in range(1, shape.height - 1):
+        for dx in range(1, shape.width - 1):
+            value = symbols[dy * shape.width + dx]
+            if value > 8:
+                continue
+
+            unknowns: set[Coord] = set()
+            flags = 0
+            for neighbor in Coord(dx, dy).neighbors():
+                symbol = symbols[neighbor.y * shape.width + neighbor.x]
+                if symbol == UNKNOWN:
+                    unknowns.add(neighbor)
+                elif symbol == FLAG:
+                    flags += 1
+            if unknowns:
+                constraints.append(Constraint(frozenset(unknowns), value - flags))
+
+    safe_mask = 0
+    mine_mask = 0
+    for component in split_components(constraints):
+        deductions = ComponentSearch(component, max_search_nodes=1 << 16).solve()
+        for coord in deductions.safes:
+            safe_mask |= 1 << (coord.y * shape.width + coord.x)
+        for coord in deductions.mines:
+            mine_mask |= 1 << (coord.y * shape.width + coord.x)
+    return WindowDeduction(safe_mask, mine_mask)
+
+
+def deduced_coords(shape: WindowShape, anchor: Coord, mask: int) -> Iterator[Coord]:
+    origin = window_origin(anchor)
+    index = 0
+    while mask:
+        if mask & 1:
+            yield Coord(origin.x + index % shape.width, origin.y + index // shape.width)
+        mask >>= 1
+        index += 1
+
+
+class PatternTable:
+    """Packed `window key -> deduction` tables, one per window shape."""
+
+    def __init__(self, entries: dict[WindowShape, dict[int, int]] | None = None) -> None:
+        self._entries = entries if entries is not None else {shape: {} for shape in WINDOW_SHAPES}
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._entries.values())
+
+    def lookup(self, shape: WindowShape, key: int) -> WindowDeduction | None:
+        packed = self._entries.get(shape, {}).get(key)
+        return None if packed is None else WindowDeduction.unpack(packed)
+
+    def add(self, shape: WindowShape, key: int, deduction: WindowDeduction) -> None:
+        self._entries.setdefault(shape, {})[key] = deduction.pack()
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("wb") as handle:
+            handle.write(_MAGIC)
+            handle.write(struct.pack("<I", len(self._entries)))
+            for shape, entries in sorted(self._entries.items()):
+                keys = array("Q", sorted(entries))
+                values = array("I", (entries[key] for key in keys))
+                handle.write(struct.pack("<BBI", shape.width, shape.height, len(keys)))
+                handle.write(keys.tobytes())
+                handle.write(values.tobytes())
+
+    @classmethod
+    def load(cls, path: Path) -> PatternTable:
+        data = path.read_bytes()
+        if data[:4] != _MAGIC:
+            raise ValueError(f"{path} is not a pattern table")
+
+        (shape_count,) = struct.unpack_from("<I", data, 4)
+        offset = 8
+        entries: dict[WindowShape, dict[int, int]] = {}
+        for _index in range(shape_count):
+            width, height, count = struct.unpack_from("<BBI", data, offset)
+            offset += struct.calcsize("<BBI")
+            keys = array("Q")
+            keys.frombytes(data[offset : offset + count * keys.itemsize])
+            offset += count * keys.itemsize
+            values = array("I")
+            values.frombytes(data[offset : offset + count * values.itemsize])
+            offset += count * values.itemsize
+            entries[WindowShape(width, height)] = dict(zip(keys, values))
+        return cls(entries)
+
+
+def build_pattern_table(
+    configs: Sequence[GameConfig],
+    games: int = 50,
+    seed: int = 0,
+) -> PatternTable:
+    """
+    Harvest the windows that actually occur around frontier cells in
+    simulated games and solve each one exhaustively.
+
+    The full alphabet is far too large to enumerate, so the table covers
+    the windows real play produces; anything else is solved at runtime.
+    """
+    table = PatternTable()
+    analyzer = Analyzer()
+    for config in configs:
+        deducer = UnitPropagationSolver()
+        guesser = ProbabilitySolver()
+        for game_seed in range(seed, seed + games):
+            game = Game(config, random.Random(game_seed))
+            game.apply_move(Move(ActionType.REVEAL, Coord(config.width // 2, config.height // 2)))
+            while game.phase == GamePhase.IN_PROGRESS:
+                analysis = analyzer.analyze(game.board)
+                for anchor in analysis.frontier:
+                    for shape in WINDOW_SHAPES:
+                        key = encode_window(analysis, shape, anchor)
+                        if table.lookup(shape, key) is None:
+                            table.add(shape, key, solve_window(shape, key))
+
+                moves = deducer.find_moves(analysis) or guesser.find_moves(analysis)
+                if not game.apply_moves(moves).applied:
+                    break
+    return table
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m minesweeper.ai.pattern_table")
+    parser.add_argument("--games", type=int, default=50, help="Simulated games per preset")
+    parser.add_argument("--seed", type=int, default=0, help="First simulation seed")
+    parser.add_argument("--output", type=Path, default=TABLE_PATH, help="Table file to write")
+    args = parser.parse_args(list(argv) if argv is not None else None)
+
+    table = build_pattern_table(list(PRESETS.values()), games=args.games, seed=args.seed)
+    table.save(args.output)
+    print(f"Wrote {len(table)} window patterns to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from itertools import combinations
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+from minesweeper.ai.cancellation import raise_if_cancelled
+from minesweeper.ai.constraint import Constraint
+from minesweeper.domain.types import Coord
+
+if TYPE_CHECKING:
+    from minesweeper.ai.analyzer import AnalyzedBoard
+
+
+MAX_EXACT_TILES = 20
+# Assignments enumerated between checks for a cancelled strategy call.
+CANCEL_CHECK_INTERVAL = 1024
+
+
+@dataclass(frozen=True)
+class ProbabilityMap:
+    """
+    Mine probability of every unknown tile.
+
+    `enumerated` is True when the probabilities come from enumerating the
+    constrained tiles. Otherwise there were no constraints, too many
+    constrained tiles, or no consistent layout, and every unknown carries
+    the global mine density.
+    """
+
+    probabilities: Mapping[Coord, float] = field(default_factory=lambda: MappingProxyType({}))
+    enumerated: bool = False
+
+    def get(self, coord: Coord) -> float | None:
+        return self.probabilities.get(coord)
+
+    def safest(self) -> Coord | None:
+        if not self.probabilities:
+            return None
+        return min(self.probabilities.items(), key=lambda item: (item[1], item[0].x, item[0].y))[0]
+
+    def as_grid(self, width: int, height: int) -> list[list[float | None]]:
+        """Rows of probabilities, `None` where the tile is not unknown."""
+        return [
+            [self.probabilities.get(Coord(x, y)) for x in range(width)]
+            for y in range(height)
+        ]
+
+
+def compute_probability_map(
+    analysis: AnalyzedBoard,
+    max_exact_tiles: int = MAX_EXACT_TILES,
+) -> ProbabilityMap:
+    unknowns = sorted(analysis.unknown_coords)
+    if not unknowns:
+        return ProbabilityMap()
+
+    remaining_mines = analysis.total_mines - len(analysis.flagged_coords)
+    constraints = analysis.constraints
+    if constraints:
+        constrained_tiles = sorted({tile for constraint in constraints for tile in constraint.unknowns})
+        if len(constrained_tiles) <= max_exact_tiles:
+            constrained = set(constrained_tiles)
+            probabilities = _exact_probabilities(
+                constraints=constraints,
+                constrained_tiles=constrained_tiles,
+                unconstrained_tiles=[tile for tile in unknowns if tile not in constrained],
+                remaining_mines=remaining_mines,
+            )
+            if probabilities:
+                return ProbabilityMap(MappingProxyType(probabilities), enumerated=True)
+
+    density = remaining_mines / len(unknowns)
+    return ProbabilityMap(MappingProxyType(dict.fromkeys(unknowns, density)))
+
+
+def _exact_probabilities(
+    constraints: Sequence[Constraint],
+    constrained_tiles: list[Coord],
+    unconstrained_tiles: list[Coord],
+    remaining_mines: int,
+) -> dict[Coord, float]:
+    total_weight = 0
+    mine_weights = {tile: 0 for tile in constrained_tiles}
+    unconstrained_mine_weight = 0.0
+
+    max_local_mines = min(len(constrained_tiles), remaining_mines)
+    for local_mines in range(max_local_mines + 1):
+        for count, assignment_tuple in enumerate(combinations(constrained_tiles, local_mines)):
+            if not count % CANCEL_CHECK_INTERVAL:
+                raise_if_cancelled()
+            assignment = set(assignment_tuple)
+            if not _satisfies_constraints(assignment, constraints):
+                continue
+
+            mines_for_unconstrained = remaining_mines - local_mines
+            if not 0 <= mines_for_unconstrained <= len(unconstrained_tiles):
+                continue
+
+            weight = math.comb(len(unconstrained_tiles), mines_for_unconstrained)
+            total_weight += weight
+            for tile in assignment:
+                mine_weights[tile] += weight
+
+            if unconstrained_tiles:
+                unconstrained_mine_weight += (
+                    weight * mines_for_unconstrained / len(unconstrained_tiles)
+                )
+
+    if total_weight == 0:
+        return {}
+
+    probabilities = {
+        tile: mine_weights[tile] / total_weight for tile in constrained_tiles
+    }
+    if unconstrained_tiles:
+        unconstrained_probability = unconstrained_mine_weight / total_weight
+        for tile in unconstrained_tiles:
+            probabilities[tile] = unconstrained_probability
+
+    return probabilities
+
+
+def _satisfies_constraints(assignment: set[Coord], constraints: Sequence[Constraint]) -> bool:
+    return all(
+        sum(coord in assignment for coord in constraint.unknowns) == constraint.mines_needed
+        for constraint in constraints
+    )
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import importlib
+import random
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import NamedTuple
+
+from minesweeper.ai.strategy import AIStrategy
+
+
+class StrategySpec(NamedTuple):
+    """Where a strategy lives, so its module is only imported when a chain uses it."""
+
+    module: str
+    attribute: str
+    takes_rng: bool = False
+
+
+STRATEGIES: dict[str, StrategySpec] = {
+    "RandomExplorer": StrategySpec("minesweeper.ai.strategies.random_explorer", "RandomExplorer", takes_rng=True),
+    "OpeningBookExplorer": StrategySpec(
+        "minesweeper.ai.strategies.opening_book_explorer",
+        "OpeningBookExplorer",
+        takes_rng=True,
+    ),
+    "PatternDetector": StrategySpec("minesweeper.ai.strategies.pattern_detector", "PatternDetector"),
+    "ConstraintSubtractor": StrategySpec("minesweeper.ai.strategies.constraint_subtractor", "ConstraintSubtractor"),
+    "TransitiveMatcher": StrategySpec("minesweeper.ai.strategies.transitive_matcher", "TransitiveMatcher"),
+    "PatternTableMatcher": StrategySpec("minesweeper.ai.strategies.pattern_table_matcher", "PatternTableMatcher"),
+    "UnitPropagationSolver": StrategySpec("minesweeper.ai.strategies.unit_propagation", "UnitPropagationSolver"),
+    "EndgameSolver": StrategySpec("minesweeper.ai.strategies.endgame_solver", "EndgameSolver"),
+    "ProbabilitySolver": StrategySpec("minesweeper.ai.strategies.probability_solver", "ProbabilitySolver"),
+}
+
+DEFAULT_CHAIN: tuple[str, ...] = (
+    "OpeningBookExplorer",
+    "PatternDetector",
+    "ConstraintSubtractor",
+    "TransitiveMatcher",
+    "PatternTableMatcher",
+    "UnitPropagationSolver",
+    "EndgameSolver",
+    "ProbabilitySolver",
+)
+CHAINS: dict[str, tuple[str, ...]] = {
+    "default": DEFAULT_CHAIN,
+    "fast": (
+        "OpeningBookExplorer",
+        "PatternDetector",
+        "ConstraintSubtractor",
+        "UnitPropagationSolver",
+        "ProbabilitySolver",
+    ),
+}
+
+
+def parse_chain(text: str) -> tuple[str, ...]:
+    """
+    Resolve a chain preset name or a comma- or newline-separated list of
+    strategy names. `#` starts a comment.
+    """
+    names = [
+        name.strip()
+        for line in text.splitlines()
+        for name in line.split("#", 1)[0].split(",")
+        if name.strip()
+    ]
+    if len(names) == 1 and names[0] in CHAINS:
+        return CHAINS[names[0]]
+    return validate_chain(names)
+
+
+def load_chain(path: Path) -> tuple[str, ...]:
+    return parse_chain(path.read_text(encoding="utf-8"))
+
+
+def validate_chain(names: Iterable[str]) -> tuple[str, ...]:
+    chain = tuple(names)
+    if not chain:
+        raise ValueError("strategy chain must name at least one strategy")
+
+    unknown = [name for name in chain if name not in STRATEGIES]
+    if unknown:
+        raise ValueError(
+            f"unknown strategies: {', '.join(unknown)} "
+            f"(available: {', '.join(STRATEGIES)}; presets: {', '.join(CHAINS)})"
+        )
+    duplicates = sorted({name for name in chain if chain.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"strategies listed more than once: {', '.join(duplicates)}")
+    return chain
+
+
+class StrategyRegistry:
+    """
+    Builds strategy chains by name.
+
+    Each strategy is constructed on first use and the same instance is
+    returned afterwards, so its caches survive across games.
+    """
+
+    def __init__(self, rng: random.Random | None = None) -> None:
+        self._rng = rng or random.Random()
+        self._instances: dict[str, AIStrategy] = {}
+
+    def get(self, name: str) -> AIStrategy:
+        strategy = self._instances.get(name)
+        if strategy is None:
+            validate_chain([name])
+            spec = STRATEGIES[name]
+            factory = getattr(importlib.import_module(spec.module), spec.attribute)
+            strategy = factory(self._rng) if spec.takes_rng else factory()
+            self._instances[name] = strategy
+        return strategy
+
+    def chain(self, names: Sequence[str] = DEFAULT_CHAIN) -> list[AIStrategy]:
+        return [self.get(name) for name in validate_chain(names)]
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import NamedTuple
+
+from minesweeper.ai.analyzer import AnalyzedBoard
+from minesweeper.ai.cancellation import StrategyCancelled, cancellable
+from minesweeper.ai.instrumentation import StrategyProfiler, StrategyStats
+from minesweeper.ai.strategy import AIStrategy
+from minesweeper.domain.move import Move
+
+MoveFilter = Callable[[Sequence[Move]], Sequence[Move]]
+
+
+class StrategyResult(NamedTuple):
+    strategy: AIStrategy
+    moves: Sequence[Move]
+
+
+class StrategyRunner:
+    """
+    Evaluates a strategy chain and returns the first non-empty result.
+
+    With `max_workers` above one, strategies run on a thread pool over the
+    same `AnalyzedBoard` and results are still consumed strictly in chain
+    order. Speculation only starts when a strategy stalls: if it has not
+    returned within `SPECULATION_DELAY`, the next `max_workers - 1`
+    strategies are started alongside it. Most turns are settled by a cheap
+    strategy well inside that delay, so pure-Python strategies, which gain
+    nothing from sharing the GIL, cost no more than in sequential mode.
+    Once a result is found the rest of the turn is cancelled: calls that
+    have not started are dropped, and running ones stop at their next
+    `raise_if_cancelled`.
+
+    Strategies keep caches and memos between calls, so one instance never
+    runs twice at once: a strategy whose call from an earlier turn is still
+    winding down is not started again on the pool. If every strategy ahead
+    of it comes back empty, it runs on the calling thread once that call
+    has finished.
+
+    When a `profiler` is given, every strategy call that runs to completion
+    is timed and recorded, including speculative calls whose result is
+    dropped.
+    """
+
+    # Seconds a strategy may run before the ones after it are started speculatively.
+    SPECULATION_DELAY = 0.005
+
+    def __init__(self, max_workers: int = 1, profiler: StrategyProfiler | None = None) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self._max_workers = max_workers
+        self._profiler = profiler
+        self._pool: ThreadPoolExecutor | None = None
+        self._in_flight: dict[int, Future[Sequence[Move]]] = {}
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    @property
+    def profiler(self) -> StrategyProfiler | None:
+        return self._profiler
+
+    def first_result(
+        self,
+        strategies: Sequence[AIStrategy],
+        analysis: AnalyzedBoard,
+        accept: MoveFilter | None = None,
+    ) -> StrategyResult | None:
+        if self._max_workers == 1 or len(strategies) <= 1:
+            return self._sequential(strategies, analysis, accept)
+        return self._speculative(strategies, analysis, accept)
+
+    def strategy_stats(self) -> list[StrategyStats]:
+        return [] if self._profiler is None else self._profiler.stats()
+
+    def report_lines(self) -> list[str]:
+        return [] if self._profiler is None else self._profiler.report_lines()
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+        self._in_flight.clear()
+
+    def _sequential(
+        self,
+        strategies: Sequence[AIStrategy],
+        analysis: AnalyzedBoard,
+        accept: MoveFilter | None,
+    ) -> StrategyResult | None:
+        for strategy in strategies:
+            moves = self._accepted(self._find_moves(strategy, analysis), accept)
+            if moves:
+                return StrategyResult(strategy, moves)
+
+        return None
+
+    def _speculative(
+        self,
+        strategies: Sequence[AIStrategy],
+        analysis: AnalyzedBoard,
+        accept: MoveFilter | None,
+    ) -> StrategyResult | None:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self._max_workers,
+                thread_name_prefix="strategy",
+            )
+
+        cancel = threading.Event()
+        started: dict[int, Future[Sequence[Move]] | None] = {}
+        try:
+            for index, strategy in enumerate(strategies):
+                if index not in started:
+                    started[index] = self._start(strategy, analysis, cancel)
+                future = started[index]
+                if future is None:
+                    wait([self._in_flight[id(strategy)]])
+                    found = self._find_moves(strategy, analysis)
+                else:
+                    if not wait([future], timeout=self.SPECULATION_DELAY).done:
+                        for ahead in range(index + 1, min(index + self._max_workers, len(strategies))):
+                            if ahead not in started:
+                                started[ahead] = self._start(strategies[ahead], analysis, cancel)
+                    found = future.result()
+                moves = self._accepted(found, accept)
+                if moves:
+                    return StrategyResult(strategy, moves)
+        finally:
+            cancel.set()
+            for pending in started.values():
+                if pending is not None:
+                    pending.cancel()
+
+        return None
+
+    def _start(
+        self,
+        strategy: AIStrategy,
+        analysis: AnalyzedBoard,
+        cancel: threading.Event,
+    ) -> Future[Sequence[Move]] | None:
+        previous = self._in_flight.get(id(strategy))
+        if previous is not None and not previous.done():
+            return None
+        assert self._pool is not None
+        future = self._pool.submit(self._find_moves_until_cancelled, strategy, analysis, cancel)
+        self._in_flight[id(strategy)] = future
+        return future
+
+    def _find_moves(self, strategy: AIStrategy, analysis: AnalyzedBoard) -> Sequence[Move]:
+        if self._profiler is None:
+            return strategy.find_moves(analysis)
+        return self._profiler.measure(strategy, analysis)
+
+    def _find_moves_until_cancelled(
+        self,
+        strategy: AIStrategy,
+        analysis: AnalyzedBoard,
+        cancel: threading.Event,
+    ) -> Sequence[Move]:
+        with cancellable(cancel):
+            try:
+                return self._find_moves(strategy, analysis)
+            except StrategyCancelled:
+                return []
+
+    def _accepted(self, moves: Sequence[Move], accept: MoveFilter | None) -> list[Move]:
+        if accept is not None:
+            moves = accept(moves)
+        return list(moves)
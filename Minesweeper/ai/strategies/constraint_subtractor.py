@@ -2,7 +2,7 @@ from collections.abc import Sequence
 
 from minesweeper.ai.analyzer import AnalyzedBoard
 from minesweeper.domain.move import Move
-from minesweeper.domain.types import ActionType, Coord
+from minesweeper.domain.types import ActionType
 
 
 class ConstraintSubtractor:
@@ -12,8 +12,8 @@ class ConstraintSubtractor:
 
     def find_moves(self, analysis: AnalyzedBoard) -> Sequence[Move]:
         constraints = [
-            self._constraint_for(coord, analysis)
-            for coord in analysis.frontier
+            (constraint.unknowns, constraint.mines_needed)
+            for constraint in analysis.frontier_constraints.values()
         ]
         moves: list[Move] = []
         seen: set[Move] = set()
@@ -44,17 +44,3 @@ class ConstraintSubtractor:
                             moves.append(move)
 
         return moves
-
-    def _constraint_for(
-        self,
-        coord: Coord,
-        analysis: AnalyzedBoard,
-    ) -> tuple[frozenset[Coord], int]:
-        value = analysis.grid[coord]
-        unknowns = frozenset(
-            neighbor for neighbor in coord.neighbors() if neighbor in analysis.unknown_coords
-        )
-        flagged = sum(
-            neighbor in analysis.flagged_coords for neighbor in coord.neighbors()
-        )
-        return unknowns, value - flagged
@@ -0,0 +1,184 @@
+from collections.abc import Sequence
+from itertools import combinations
+
+from minesweeper.ai.analyzer import AnalyzedBoard
+from minesweeper.ai.cancellation import raise_if_cancelled
+from minesweeper.ai.strategies.unit_propagation import SearchBudgetExceeded
+from minesweeper.domain.move import Move
+from minesweeper.domain.types import ActionType, Coord
+
+
+class EndgameSolver:
+    """
+    Exact play once only a few unknowns are left.
+
+    Enumerates every mine layout of the remaining unknowns that fits the
+    revealed numbers and the exact remaining mine count, then picks the
+    reveal with the highest probability of winning the game, not just of
+    surviving the next click. Each candidate's outcome is split by the
+    number it would reveal, and the win probability of every resulting
+    layout set is memoised so shared sub-positions are solved once.
+
+    Boards with more unknowns, or searches that exceed the node budget,
+    are left to the next strategy in the chain.
+    """
+
+    MAX_UNKNOWNS = 14
+    MAX_SEARCH_NODES = 20_000
+
+    def __init__(
+        self,
+        max_unknowns: int = MAX_UNKNOWNS,
+        max_search_nodes: int = MAX_SEARCH_NODES,
+    ) -> None:
+        self._max_unknowns = max_unknowns
+        self._max_search_nodes = max_search_nodes
+
+    @property
+    def name(self) -> str:
+        return "EndgameSolver"
+
+    def find_moves(self, analysis: AnalyzedBoard) -> Sequence[Move]:
+        unknowns = sorted(analysis.unknown_coords)
+        if not unknowns or len(unknowns) > self._max_unknowns:
+            return []
+
+        remaining_mines = analysis.total_mines - len(analysis.flagged_coords)
+        layouts = self._layouts(analysis, unknowns, remaining_mines)
+        if not layouts:
+            return []
+
+        certain = self._certain_moves(unknowns, layouts)
+        if certain:
+            return certain
+
+        index = unknowns.index
+        search = _EndgameSearch(
+            [
+                sum(1 << index(neighbor) for neighbor in analysis.unknown_coords.neighbors_in(coord))
+                for coord in unknowns
+            ],
+            self._max_search_nodes,
+        )
+        try:
+            best = search.best_reveal(frozenset(layouts))
+        except SearchBudgetExceeded:
+            return []
+
+        if best is None:
+            return []
+        return [Move(ActionType.REVEAL, unknowns[best])]
+
+    def _layouts(
+        self,
+        analysis: AnalyzedBoard,
+        unknowns: list[Coord],
+        remaining_mines: int,
+    ) -> list[int]:
+        if not 0 <= remaining_mines <= len(unknowns):
+            return []
+
+        positions = {coord: bit for bit, coord in enumerate(unknowns)}
+        rules = [
+            (sum(1 << positions[coord] for coord in constraint.unknowns), constraint.mines_needed)
+            for constraint in set(analysis.constraints)
+        ]
+        layouts: list[int] = []
+        for mines in combinations(range(len(unknowns)), remaining_mines):
+            layout = sum(1 << bit for bit in mines)
+            if all((layout & mask).bit_count() == needed for mask, needed in rules):
+                layouts.append(layout)
+        return layouts
+
+    def _certain_moves(self, unknowns: list[Coord], layouts: list[int]) -> list[Move]:
+        always = ~0
+        ever = 0
+        for layout in layouts:
+            always &= layout
+            ever |= layout
+
+        flags = [
+            Move(ActionType.FLAG, coord)
+            for bit, coord in enumerate(unknowns)
+            if always >> bit & 1
+        ]
+        reveals = [
+            Move(ActionType.REVEAL, coord)
+            for bit, coord in enumerate(unknowns)
+            if not ever >> bit & 1
+        ]
+        if not reveals and len(layouts) > 1:
+            return []
+        return flags + reveals
+
+
+class _EndgameSearch:
+    """
+    One win-probability search, so `EndgameSolver` keeps no per-call state
+    and one instance can serve overlapping calls.
+    """
+
+    def __init__(self, neighbor_masks: list[int], max_search_nodes: int) -> None:
+        self._neighbor_masks = neighbor_masks
+        self._max_search_nodes = max_search_nodes
+        self._memo: dict[frozenset[int], float] = {}
+        self._nodes = 0
+
+    def best_reveal(self, layouts: frozenset[int]) -> int | None:
+        best: int | None = None
+        best_probability = -1.0
+        for survival, bit, outcomes in self._candidates(layouts):
+            if survival <= best_probability:
+                break
+            probability = self._reveal_probability(layouts, outcomes)
+            if probability > best_probability:
+                best = bit
+                best_probability = probability
+        return best
+
+    def _win_probability(self, layouts: frozenset[int]) -> float:
+        if len(layouts) == 1:
+            return 1.0
+
+        cached = self._memo.get(layouts)
+        if cached is not None:
+            return cached
+
+        self._nodes += 1
+        if self._nodes > self._max_search_nodes:
+            raise SearchBudgetExceeded
+        raise_if_cancelled()
+
+        best = 0.0
+        for survival, _bit, outcomes in self._candidates(layouts):
+            # A reveal can never win more often than it survives, and the
+            # candidates come safest first.
+            if survival <= best:
+                break
+            best = max(best, self._reveal_probability(layouts, outcomes))
+
+        self._memo[layouts] = best
+        return best
+
+    def _reveal_probability(self, layouts: frozenset[int], outcomes: list[frozenset[int]]) -> float:
+        return sum(len(outcome) * self._win_probability(outcome) for outcome in outcomes) / len(layouts)
+
+    def _candidates(self, layouts: frozenset[int]) -> list[tuple[float, int, list[frozenset[int]]]]:
+        """Informative reveals as (survival, bit, layouts grouped by revealed number)."""
+        candidates: list[tuple[float, int, list[frozenset[int]]]] = []
+        for bit, neighbor_mask in enumerate(self._neighbor_masks):
+            tile = 1 << bit
+            outcomes: dict[int, list[int]] = {}
+            for layout in layouts:
+                if not layout & tile:
+                    outcomes.setdefault((layout & neighbor_mask).bit_count(), []).append(layout)
+
+            safe = sum(len(group) for group in outcomes.values())
+            if safe == 0 or (safe == len(layouts) and len(outcomes) == 1):
+                continue
+            candidates.append(
+                (safe / len(layouts), bit, [frozenset(group) for group in outcomes.values()])
+            )
+
+        candidates.sort(key=lambda candidate: (-candidate[0], candidate[1]))
+        return candidates
@@ -0,0 +1,156 @@
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import replace
+
+from minesweeper.ai.analyzer import AnalyzedBoard
+from minesweeper.ai.cancellation import raise_if_cancelled
+from minesweeper.ai.constraint import Constraint
+from minesweeper.ai.strategies.unit_propagation import ComponentSearch, split_components
+from minesweeper.domain.types import Coord
+
+
+class LookaheadGuesser:
+    """
+    Scores guess candidates by survival probability times expected progress.
+
+    For each candidate the guesser clones the analysis once per plausible
+    revealed number, runs the unit-propagation search on the clone, and
+    counts the safe tiles that reveal would force. Work is bounded by a
+    candidate limit, a risk margin over the safest tile, a per-call time
+    budget, and a memo of already-solved clone components.
+    """
+
+    MAX_CANDIDATES = 6
+    RISK_MARGIN = 0.05
+    TIME_BUDGET_MS = 50
+    MAX_SEARCH_NODES = 500
+    MEMO_LIMIT = 4096
+    MIN_OUTCOME_PROBABILITY = 1e-3
+
+    def __init__(
+        self,
+        max_candidates: int = MAX_CANDIDATES,
+        risk_margin: float = RISK_MARGIN,
+        time_budget_ms: int = TIME_BUDGET_MS,
+        max_search_nodes: int = MAX_SEARCH_NODES,
+        clock: Callable[[], float] | None = None,
+    ) -> None:
+        self._max_candidates = max_candidates
+        self._risk_margin = risk_margin
+        self._time_budget_seconds = time_budget_ms / 1000
+        self._max_search_nodes = max_search_nodes
+        self._clock = clock or time.perf_counter
+        self._memo: dict[frozenset[Constraint], int] = {}
+
+    def choose(
+        self,
+        analysis: AnalyzedBoard,
+        probabilities: Mapping[Coord, float],
+    ) -> Coord | None:
+        candidates = self._candidates(probabilities)
+        if not candidates:
+            return None
+
+        deadline = self._clock() + self._time_budget_seconds
+        best: tuple[float, float, int, int] | None = None
+        best_coord: Coord | None = None
+        for coord in candidates:
+            if self._clock() > deadline:
+                break
+            raise_if_cancelled()
+
+            survival = 1.0 - probabilities[coord]
+            score = survival * (1.0 + self._expected_progress(analysis, probabilities, coord))
+            key = (score, survival, -coord.x, -coord.y)
+            if best is None or key > best:
+                best = key
+                best_coord = coord
+
+        return best_coord
+
+    def _candidates(self, probabilities: Mapping[Coord, float]) -> list[Coord]:
+        ordered = sorted(
+            probabilities.items(),
+            key=lambda item: (item[1], item[0].x, item[0].y),
+        )
+        if not ordered:
+            return []
+
+        ceiling = ordered[0][1] + self._risk_margin
+        return [
+            coord
+            for coord, probability in ordered[: self._max_candidates]
+            if probability <= ceiling
+        ]
+
+    def _expected_progress(
+        self,
+        analysis: AnalyzedBoard,
+        probabilities: Mapping[Coord, float],
+        coord: Coord,
+    ) -> float:
+        unknown_neighbors = analysis.unknown_coords.neighbors_in(coord)
+        flagged = analysis.flagged_coords.count_neighbors(coord)
+
+        expected = 0.0
+        for hidden_mines, weight in enumerate(
+            self._mine_count_distribution(
+                [probabilities.get(neighbor, 0.0) for neighbor in unknown_neighbors]
+            )
+        ):
+            if weight < self.MIN_OUTCOME_PROBABILITY:
+                continue
+            expected += weight * self._forced_safe_count(
+                analysis,
+                coord,
+                flagged + hidden_mines,
+            )
+
+        return expected
+
+    def _mine_count_distribution(self, probabilities: list[float]) -> list[float]:
+        # Poisson-binomial over the neighbours, treating them as independent.
+        distribution = [1.0]
+        for probability in probabilities:
+            shifted = [0.0] * (len(distribution) + 1)
+            for count, weight in enumerate(distribution):
+                shifted[count] += weight * (1.0 - probability)
+                shifted[count + 1] += weight * probability
+            distribution = shifted
+        return distribution
+
+    def _forced_safe_count(self, analysis: AnalyzedBoard, coord: Coord, value: int) -> int:
+        clone = self._revealed_clone(analysis, coord, value)
+        touched = {
+            constraint
+            for source in [coord, *coord.neighbors()]
+            for constraint in [clone.frontier_constraints.get(source)]
+            if constraint is not None and constraint.unknowns
+        }
+        if not touched:
+            return 0
+
+        component = frozenset().union(
+            *(
+                component
+                for component in split_components(clone.constraints)
+                if not component.isdisjoint(touched)
+            )
+        )
+        cached = self._memo.get(component)
+        if cached is None:
+            cached = len(ComponentSearch(component, self._max_search_nodes).solve().safes)
+            if len(self._memo) >= self.MEMO_LIMIT:
+                self._memo.clear()
+            self._memo[component] = cached
+        return cached
+
+    def _revealed_clone(self, analysis: AnalyzedBoard, coord: Coord, value: int) -> AnalyzedBoard:
+        grid = dict(analysis.grid)
+        grid[coord] = value
+        return replace(
+            analysis,
+            grid=grid,
+            frontier=[*analysis.frontier, coord],
+            unknown_coords=analysis.unknown_coords.without(coord),
+        )
@@ -0,0 +1,53 @@
+import random
+from collections.abc import Callable, Sequence
+from pathlib import Path
+
+from minesweeper.ai.analyzer import AnalyzedBoard
+from minesweeper.ai.opening_book import BOOK_DIR, OpeningBook, book_path
+from minesweeper.ai.strategies.random_explorer import RandomExplorer
+from minesweeper.domain.move import Move
+from minesweeper.domain.types import ActionType
+
+BookKey = tuple[int, int, int]
+
+
+def _load_book(width: int, height: int, num_mines: int, root: Path) -> OpeningBook | None:
+    path = book_path(width, height, num_mines, root)
+    try:
+        return OpeningBook.load(path)
+    except (FileNotFoundError, ValueError, KeyError):
+        return None
+
+
+class OpeningBookExplorer(RandomExplorer):
+    """Random exploration that first consults a precomputed opening book."""
+
+    def __init__(
+        self,
+        rng: random.Random | None = None,
+        book_dir: Path = BOOK_DIR,
+        loader: Callable[[int, int, int, Path], OpeningBook | None] = _load_book,
+    ) -> None:
+        super().__init__(rng)
+        self._book_dir = book_dir
+        self._loader = loader
+        self._books: dict[BookKey, OpeningBook | None] = {}
+
+    @property
+    def name(self) -> str:
+        return "OpeningBookExplorer"
+
+    def find_moves(self, analysis: AnalyzedBoard) -> Sequence[Move]:
+        book = self._book_for(analysis)
+        if book is not None:
+            coord = book.move_for(analysis)
+            if coord is not None:
+                return [Move(ActionType.REVEAL, coord)]
+
+        return super().find_moves(analysis)
+
+    def _book_for(self, analysis: AnalyzedBoard) -> OpeningBook | None:
+        key = (analysis.width, analysis.height, analysis.total_mines)
+        if key not in self._books:
+            self._books[key] = self._loader(*key, self._book_dir)
+        return self._books[key]
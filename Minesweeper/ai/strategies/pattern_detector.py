@@ -2,7 +2,7 @@ from collections.abc import Sequence
 
 from minesweeper.ai.analyzer import AnalyzedBoard
 from minesweeper.domain.move import Move
-from minesweeper.domain.types import ActionType, Coord
+from minesweeper.domain.types import ActionType
 
 
 class PatternDetector:
@@ -14,27 +14,24 @@ class PatternDetector:
         moves: list[Move] = []
         seen: set[Move] = set()
 
-        for coord in analysis.frontier:
-            value = analysis.grid.get(coord)
-            if value is None or value <= 0:
+        for coord, constraint in analysis.frontier_constraints.items():
+            value = analysis.grid[coord]
+            if value <= 0:
                 continue
 
             unknown_neighbors = sorted(
-                (neighbor for neighbor in coord.neighbors() if neighbor in analysis.unknown_coords),
+                constraint.unknowns,
                 key=lambda candidate: (candidate.x, candidate.y),
             )
-            flagged_count = sum(
-                neighbor in analysis.flagged_coords for neighbor in coord.neighbors()
-            )
 
-            if unknown_neighbors and value == flagged_count:
+            if unknown_neighbors and constraint.mines_needed == 0:
                 for neighbor in unknown_neighbors:
                     move = Move(ActionType.REVEAL, neighbor)
                     if move not in seen:
                         seen.add(move)
                         moves.append(move)
 
-            if unknown_neighbors and value - flagged_count == len(unknown_neighbors):
+            if unknown_neighbors and constraint.mines_needed == len(unknown_neighbors):
                 for neighbor in unknown_neighbors:
                     move = Move(ActionType.FLAG, neighbor)
                     if move not in seen:
@@ -0,0 +1,83 @@
+from collections.abc import Callable, Sequence
+from pathlib import Path
+
+from minesweeper.ai.analyzer import AnalyzedBoard
+from minesweeper.ai.pattern_table import (
+    TABLE_PATH,
+    WINDOW_SHAPES,
+    PatternTable,
+    WindowDeduction,
+    WindowShape,
+    deduced_coords,
+    encode_window,
+    solve_window,
+)
+from minesweeper.domain.move import Move
+from minesweeper.domain.types import ActionType, Coord
+
+
+def _load_table(path: Path) -> PatternTable:
+    try:
+        return PatternTable.load(path)
+    except (FileNotFoundError, ValueError):
+        return PatternTable()
+
+
+class PatternTableMatcher:
+    """
+    Looks up the window around each frontier cell in a precompiled table of
+    exhaustively solved local patterns.
+
+    Windows missing from the shipped table are solved on first sight and
+    kept in a bounded runtime memo, so the per-cell cost stays a hash lookup.
+    """
+
+    MEMO_LIMIT = 8192
+
+    def __init__(
+        self,
+        table_path: Path = TABLE_PATH,
+        loader: Callable[[Path], PatternTable] = _load_table,
+    ) -> None:
+        self._table_path = table_path
+        self._loader = loader
+        self._table: PatternTable | None = None
+        self._memo: dict[tuple[WindowShape, int], WindowDeduction] = {}
+
+    @property
+    def name(self) -> str:
+        return "PatternTableMatcher"
+
+    def find_moves(self, analysis: AnalyzedBoard) -> Sequence[Move]:
+        safes: set[Coord] = set()
+        mines: set[Coord] = set()
+
+        for anchor, constraint in analysis.frontier_constraints.items():
+            if not constraint.unknowns:
+                continue
+
+            for shape in WINDOW_SHAPES:
+                deduction = self._deduction(shape, encode_window(analysis, shape, anchor))
+                safes.update(deduced_coords(shape, anchor, deduction.safe_mask))
+                mines.update(deduced_coords(shape, anchor, deduction.mine_mask))
+
+        return [
+            *(Move(ActionType.FLAG, coord) for coord in sorted(mines)),
+            *(Move(ActionType.REVEAL, coord) for coord in sorted(safes)),
+        ]
+
+    def _deduction(self, shape: WindowShape, key: int) -> WindowDeduction:
+        if self._table is None:
+            self._table = self._loader(self._table_path)
+
+        deduction = self._table.lookup(shape, key)
+        if deduction is not None:
+            return deduction
+
+        deduction = self._memo.get((shape, key))
+        if deduction is None:
+            deduction = solve_window(shape, key)
+            if len(self._memo) >= self.MEMO_LIMIT:
+                self._memo.clear()
+            self._memo[(shape, key)] = deduction
+        return deduction
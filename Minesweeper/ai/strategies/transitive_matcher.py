@@ -46,11 +46,7 @@ class TransitiveMatcher:
     ) -> Move | None:
         current_ctx = self._tile_context(current, analysis)
         neighbor_ctx = self._tile_context(neighbor, analysis)
-        possibilities = [
-            candidate
-            for candidate in neighbor.neighbors()
-            if candidate in analysis.unknown_coords
-        ]
+        possibilities = list(analysis.frontier_constraints[neighbor].unknowns)
 
         if self._matches_safe_pattern(neighbor_ctx, current_ctx):
             coord = self._directional_tile(current, neighbor, possibilities)
@@ -65,10 +61,12 @@ class TransitiveMatcher:
         return None
 
     def _tile_context(self, coord: Coord, analysis: AnalyzedBoard) -> _TileContext:
+        value = analysis.grid[coord]
+        constraint = analysis.frontier_constraints[coord]
         return _TileContext(
-            value=analysis.grid[coord],
-            flags_around=sum(candidate in analysis.flagged_coords for candidate in coord.neighbors()),
-            unknown_around=sum(candidate in analysis.unknown_coords for candidate in coord.neighbors()),
+            value=value,
+            flags_around=value - constraint.mines_needed,
+            unknown_around=len(constraint.unknowns),
         )
 
     def _matches_safe_pattern(self, neighbor: _TileContext, current: _TileContext) -> bool:
@@ -0,0 +1,211 @@
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+from minesweeper.ai.analyzer import AnalyzedBoard
+from minesweeper.ai.constraint import Constraint
+from minesweeper.domain.move import Move
+from minesweeper.domain.types import ActionType, Coord
+
+_UNASSIGNED = -1
+_SAFE = 0
+_MINE = 1
+
+
+@dataclass(frozen=True)
+class Deductions:
+    mines: frozenset[Coord] = field(default_factory=frozenset)
+    safes: frozenset[Coord] = field(default_factory=frozenset)
+
+
+class SearchBudgetExceeded(Exception):
+    """A bounded search ran out of nodes; callers fall back to a weaker answer."""
+
+
+def split_components(constraints: Sequence[Constraint]) -> list[frozenset[Constraint]]:
+    parents = list(range(len(constraints)))
+
+    def find(index: int) -> int:
+        while parents[index] != index:
+            parents[index] = parents[parents[index]]
+            index = parents[index]
+        return index
+
+    owners: dict[Coord, int] = {}
+    for index, constraint in enumerate(constraints):
+        for tile in constraint.unknowns:
+            owner = owners.setdefault(tile, index)
+            parents[find(owner)] = find(index)
+
+    groups: dict[int, set[Constraint]] = {}
+    for index, constraint in enumerate(constraints):
+        groups.setdefault(find(index), set()).add(constraint)
+
+    return [frozenset(group) for group in groups.values()]
+
+
+class ComponentSearch:
+    """DPLL over one connected group of frontier constraints."""
+
+    def __init__(self, constraints: frozenset[Constraint], max_search_nodes: int) -> None:
+        self._tiles = sorted(
+            {tile for constraint in constraints for tile in constraint.unknowns},
+            key=lambda coord: (coord.x, coord.y),
+        )
+        index = {tile: position for position, tile in enumerate(self._tiles)}
+        self._rules = [
+            (tuple(index[tile] for tile in constraint.unknowns), constraint.mines_needed)
+            for constraint in constraints
+        ]
+        self._watches: list[list[int]] = [[] for _tile in self._tiles]
+        for rule_index, (variables, _needed) in enumerate(self._rules):
+            for variable in variables:
+                self._watches[variable].append(rule_index)
+        self._max_search_nodes = max_search_nodes
+
+    def solve(self) -> Deductions:
+        base = [_UNASSIGNED] * len(self._tiles)
+        if not self._propagate(base, list(range(len(self._tiles)))):
+            return Deductions()
+
+        try:
+            model = self._search(base)
+        except SearchBudgetExceeded:
+            model = None
+        if model is None:
+            return Deductions()
+
+        observed: list[set[int]] = [set() for _tile in self._tiles]
+        self._observe(model, observed)
+
+        for variable in range(len(self._tiles)):
+            if base[variable] != _UNASSIGNED:
+                continue
+
+            for value in (_MINE, _SAFE):
+                if value in observed[variable]:
+                    continue
+
+                trial = base.copy()
+                trial[variable] = value
+                try:
+                    model = self._search(trial) if self._propagate(trial, [variable]) else None
+                except SearchBudgetExceeded:
+                    break
+
+                if model is not None:
+                    self._observe(model, observed)
+                    continue
+
+                # Conflict: every solution takes the other value, so learn it
+                # as a unit and let it propagate into the remaining tiles.
+                base[variable] = _SAFE if value == _MINE else _MINE
+                self._propagate(base, [variable])
+                break
+
+        return Deductions(
+            mines=frozenset(
+                tile for tile, value in zip(self._tiles, base) if value == _MINE
+            ),
+            safes=frozenset(
+                tile for tile, value in zip(self._tiles, base) if value == _SAFE
+            ),
+        )
+
+    def _propagate(self, assignment: list[int], pending: list[int]) -> bool:
+        while pending:
+            variable = pending.pop()
+            for rule_index in self._watches[variable]:
+                variables, needed = self._rules[rule_index]
+                mines = 0
+                open_variables: list[int] = []
+                for candidate in variables:
+                    value = assignment[candidate]
+                    if value == _MINE:
+                        mines += 1
+                    elif value == _UNASSIGNED:
+                        open_variables.append(candidate)
+
+                if mines > needed or mines + len(open_variables) < needed:
+                    return False
+                if not open_variables:
+                    continue
+
+                if mines == needed:
+                    fill = _SAFE
+                elif mines + len(open_variables) == needed:
+                    fill = _MINE
+                else:
+                    continue
+
+                for candidate in open_variables:
+                    assignment[candidate] = fill
+                    pending.append(candidate)
+
+        return True
+
+    def _search(self, assignment: list[int]) -> list[int] | None:
+        nodes = 0
+        stack = [assignment]
+        while stack:
+            nodes += 1
+            if nodes > self._max_search_nodes:
+                raise SearchBudgetExceeded
+
+            current = stack.pop()
+            try:
+                variable = current.index(_UNASSIGNED)
+            except ValueError:
+                return current
+
+            for value in (_MINE, _SAFE):
+                trial = current.copy()
+                trial[variable] = value
+                if self._propagate(trial, [variable]):
+                    stack.append(trial)
+
+        return None
+
+    def _observe(self, model: list[int], observed: list[set[int]]) -> None:
+        for variable, value in enumerate(model):
+            observed[variable].add(value)
+
+
+class UnitPropagationSolver:
+    MAX_SEARCH_NODES = 2000
+
+    def __init__(self, max_search_nodes: int = MAX_SEARCH_NODES) -> None:
+        self._max_search_nodes = max_search_nodes
+        self._cache: dict[frozenset[Constraint], Deductions] = {}
+
+    @property
+    def name(self) -> str:
+        return "UnitPropagationSolver"
+
+    def find_moves(self, analysis: AnalyzedBoard) -> Sequence[Move]:
+        mines: set[Coord] = set()
+        safes: set[Coord] = set()
+        cache: dict[frozenset[Constraint], Deductions] = {}
+
+        for component in split_components(analysis.constraints):
+            deductions = self._cache.get(component)
+            if deductions is None:
+                deductions = ComponentSearch(component, self._max_search_nodes).solve()
+            cache[component] = deductions
+            mines.update(deductions.mines)
+            safes.update(deductions.safes)
+
+        # Components that changed since the last call drop out of the cache here.
+        self._cache = cache
+
+        flags = [
+            Move(ActionType.FLAG, coord)
+            for coord in sorted(mines, key=self._sort_key)
+        ]
+        reveals = [
+            Move(ActionType.REVEAL, coord)
+            for coord in sorted(safes, key=self._sort_key)
+        ]
+        return flags + reveals
+
+    def _sort_key(self, coord: Coord) -> tuple[int, int]:
+        return (coord.x, coord.y)
@@ -1,16 +1,19 @@
 from __future__ import annotations
 
 import random
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
 
 import pygame
 
 from minesweeper.ai.analyzer import Analyzer
+from minesweeper.ai.instrumentation import StrategyProfiler, StrategyStats
+from minesweeper.ai.registry import DEFAULT_CHAIN, StrategyRegistry
+from minesweeper.ai.runner import StrategyRunner
 from minesweeper.ai.strategy import AIStrategy
-from minesweeper.ai.strategies.constraint_subtractor import ConstraintSubtractor
-from minesweeper.ai.strategies.pattern_detector import PatternDetector
-from minesweeper.ai.strategies.probability_solver import ProbabilitySolver
 from minesweeper.ai.strategies.random_explorer import RandomExplorer
-from minesweeper.ai.strategies.transitive_matcher import TransitiveMatcher
 from minesweeper.domain.move import Move
 from minesweeper.domain.types import (
     ActionType,
@@ -24,62 +27,235 @@ from minesweeper.domain.types import (
 )
 from minesweeper.engine.game import Game
 from minesweeper.engine.stats import GameResult, StatsTracker
-from minesweeper.ui.input import QuitEvent, StepAIEvent, TileClickEvent, ToggleAIEvent, poll_events
-from minesweeper.ui.renderer import PygameRenderer
+from minesweeper.ui.input import (
+    InputEvent,
+    QuitEvent,
+    StepAIEvent,
+    TileClickEvent,
+    ToggleAIEvent,
+    poll_events,
+)
+from minesweeper.ui.headless import NullRenderer, TextRenderer
+from minesweeper.ui.renderer import PygameRenderer, Renderer
 
 
 class App:
+    """
+    Runs a local game.
+
+    The loop is event driven: it blocks in `poll_events` until input
+    arrives or the next timed event is due. Timed events are the next
+    allowed frame (rendering is capped at `config.max_fps`) and a pending
+    restart after a finished game, so no step of the loop sleeps while
+    input is waiting.
+
+    In modes with an AI, the strategies run on a worker thread while the
+    loop draws whatever state is current. The worker analyses the board
+    under `_ai_wakeup`'s lock, runs the strategies without it and takes it
+    again to push the moves into the game, dropping them if the board
+    changed meanwhile. Outside turbo mode the worker plays at most one
+    batch per frame; in turbo mode it plays as fast as it can and restarts
+    finished games itself. An exception on the worker stops the loop and
+    is raised again from `run`.
+
+    `config.renderer` picks the pygame window, a text renderer or a null
+    renderer. The last two need no display; with the null renderer there
+    is nothing to watch, so the AI always plays in turbo mode.
+    """
+
+    IDLE_WAIT_MS = 500
+    CLICK_FEEDBACK_MS = 60
+
     def __init__(
         self,
         config: GameConfig | None = None,
         mode: GameMode = PLAYER_ONLY,
+        output: Callable[[str], None] | None = None,
     ) -> None:
         self._config = config or GameConfig()
         self._mode = mode
-        self._renderer = PygameRenderer(self._config)
+        self._output = output or (lambda _message: None)
+        self._renderer = self._create_renderer()
+        self._turbo = self._config.ai_turbo or self._config.renderer == "null"
         self._rng = random.Random()
         self._game = Game(self._config, self._rng)
         self._stats = StatsTracker()
         self._analyzer = Analyzer()
-        self._strategies: list[AIStrategy] = [
-            RandomExplorer(self._rng),
-            PatternDetector(),
-            ConstraintSubtractor(),
-            TransitiveMatcher(),
-            ProbabilitySolver(),
-        ]
+        self._strategies: list[AIStrategy] = StrategyRegistry(self._rng).chain(
+            self._config.strategies or DEFAULT_CHAIN
+        )
+        self._strategy_runner = StrategyRunner(
+            self._config.strategy_workers,
+            profiler=StrategyProfiler(),
+        )
         self._ai_active = mode == AI_ONLY
         self._is_evaluable = False
         self._running = True
+        self._ticks: Callable[[], int] = _monotonic_ms
+        self._frame_ms = 1000 // self._config.max_fps
+        self._needs_render = True
+        self._next_render_at = 0
+        self._next_ai_at = 0
+        self._restart_at: int | None = None
+        # Guards the game, stats and scheduling state shared with the AI worker.
+        self._ai_wakeup = threading.Condition()
+        self._ai_thread: threading.Thread | None = None
+        self._pending_steps = 0
+        self._main_waiting = False
+        self._ai_error: Exception | None = None
+        self._games_played = 0
+
+    @property
+    def games_played(self) -> int:
+        return self._games_played
+
+    @property
+    def strategy_stats(self) -> list[StrategyStats]:
+        return self._strategy_runner.strategy_stats()
 
     def run(self) -> None:
+        if self._mode.ai_enabled:
+            self._ai_thread = threading.Thread(target=self._ai_loop, name="minesweeper-ai", daemon=True)
+            self._ai_thread.start()
+
         while self._running:
-            step_ai = False
-            for event in poll_events(self._mode, self._renderer):
-                if isinstance(event, QuitEvent):
-                    self._running = False
-                elif isinstance(event, ToggleAIEvent):
-                    self._ai_active = not self._ai_active
-                elif isinstance(event, StepAIEvent):
-                    step_ai = True
-                elif isinstance(event, TileClickEvent):
-                    self._handle_tile_click(event)
-
-            if self._mode.ai_enabled and (self._ai_active or step_ai):
-                self._run_ai_turn()
-
-            self._renderer.render(
-                self._game.board,
-                self._stats.win_rate,
-                self._mode,
-                self._ai_active,
-            )
+            events = poll_events(self._mode, self._renderer, timeout_ms=self._wait_timeout(self._ticks()))
+            with self._exclusive():
+                self._handle_events(events)
+                now = self._ticks()
+                if self._needs_render and now >= self._next_render_at:
+                    self._renderer.render(
+                        self._game.board,
+                        self._stats.win_rate,
+                        self._mode,
+                        self._ai_active,
+                    )
+                    self._needs_render = False
+                    self._next_render_at = now + self._frame_ms
 
-            if self._game.phase in {GamePhase.WON, GamePhase.LOST}:
-                self._record_and_reset()
+                if self._game_over():
+                    if self._restart_at is None:
+                        self._restart_at = now + self._config.restart_delay_ms
+                    # The finished board must reach the screen before it is replaced.
+                    if now >= self._restart_at and not self._needs_render:
+                        self._record_and_reset()
 
+        if self._ai_thread is not None:
+            self._ai_thread.join()
+        self._strategy_runner.close()
+        if self._ai_error is not None:
+            pygame.quit()
+            raise self._ai_error
+        self._output(f"Played {self._games_played} games, win rate {self._stats.win_rate:.1%}")
+        for line in self._strategy_runner.report_lines():
+            self._output(line)
         pygame.quit()
 
+    def _create_renderer(self) -> Renderer:
+        if self._config.renderer == "text":
+            return TextRenderer()
+        if self._config.renderer == "null":
+            return NullRenderer()
+        return PygameRenderer(self._config)
+
+    @contextmanager
+    def _exclusive(self) -> Iterator[None]:
+        """Hold the game lock on the main thread, waking the AI worker afterwards."""
+        # A turbo worker re-takes the lock between turns; the flag makes it
+        # step aside until the main thread has had its turn.
+        self._main_waiting = True
+        with self._ai_wakeup:
+            self._main_waiting = False
+            yield
+            self._ai_wakeup.notify_all()
+
+    @contextmanager
+    def _released(self) -> Iterator[None]:
+        """Let go of the game lock held by the AI worker for the duration of the block."""
+        self._ai_wakeup.release()
+        try:
+            yield
+        finally:
+            self._ai_wakeup.acquire()
+
+    def _handle_events(self, events: Sequence[InputEvent]) -> None:
+        for event in events:
+            if isinstance(event, QuitEvent):
+                self._running = False
+                continue
+
+            self._needs_render = True
+            if isinstance(event, ToggleAIEvent):
+                self._ai_active = not self._ai_active
+                self._next_ai_at = 0
+            elif isinstance(event, StepAIEvent):
+                self._pending_steps += 1
+            elif isinstance(event, TileClickEvent):
+                self._handle_tile_click(event)
+
+    def _wait_timeout(self, now: int) -> int:
+        deadlines: list[int] = []
+        if self._needs_render or (self._mode.ai_enabled and (self._ai_active or self._pending_steps)):
+            # The worker changes the board behind the loop's back, so keep
+            # drawing at the frame rate while it plays.
+            deadlines.append(self._next_render_at)
+        if self._restart_at is not None:
+            deadlines.append(self._restart_at)
+        if not deadlines:
+            return self.IDLE_WAIT_MS
+        return max(0, min(min(deadlines) - now, self.IDLE_WAIT_MS))
+
+    def _ai_loop(self) -> None:
+        with self._ai_wakeup:
+            try:
+                while self._running:
+                    wait_ms = self._ai_step(self._ticks())
+                    if wait_ms > 0:
+                        self._ai_wakeup.wait(wait_ms / 1000)
+            except Exception as error:
+                # A dead worker would leave `run` waiting for moves forever.
+                self._ai_error = error
+                self._running = False
+
+    def _ai_step(self, now: int) -> int:
+        """
+        Run one turn of the AI worker with the lock held.
+
+        Returns how many milliseconds to wait before the next turn; a
+        notification from the main thread cuts the wait short.
+        """
+        if self._main_waiting:
+            return self.IDLE_WAIT_MS
+
+        if self._game_over():
+            if not (self._turbo and self._ai_active):
+                # The main thread shows the finished board and restarts after the delay.
+                return self.IDLE_WAIT_MS
+            self._record_and_reset()
+            return 0
+
+        stepping = self._pending_steps > 0
+        if stepping:
+            self._pending_steps -= 1
+        elif not self._ai_active:
+            return self.IDLE_WAIT_MS
+        elif now < self._next_ai_at:
+            return self._next_ai_at - now
+
+        pause_ms = self._run_ai_turn()
+        if pause_ms is None:
+            # The board changed while the strategies ran; try again on the new one.
+            if stepping:
+                self._pending_steps += 1
+            return 0
+        if not self._turbo:
+            pause_ms = max(pause_ms, self._frame_ms)
+        self._next_ai_at = now + pause_ms
+        return pause_ms
+
+    def _game_over(self) -> bool:
+        return self._game.phase in {GamePhase.WON, GamePhase.LOST}
+
     def _handle_tile_click(self, event: TileClickEvent) -> None:
         move = Move(event.action, event.coord)
         if event.action == ActionType.FLAG:
@@ -91,29 +267,42 @@ class App:
             self._game.apply_move(move)
         except ValueError:
             return
+        self._needs_render = True
 
-    def _run_ai_turn(self) -> None:
-        analysis = self._analyzer.analyze(self._game.board)
-        for strategy in self._strategies:
-            if isinstance(strategy, RandomExplorer) and self._has_revealed_zero():
-                continue
+    def _run_ai_turn(self) -> int | None:
+        """
+        Play one strategy batch; returns how long to pause before the next one, in ms.
 
-            moves = strategy.find_moves(analysis)
-            if not moves:
-                continue
+        Called with the lock held, which is released while the strategies
+        run on the snapshot taken by the analysis. Returns None without
+        moving when the board changed in the meantime.
+        """
+        board = self._game.board
+        version = getattr(board, "version", None)
+        analysis = self._analyzer.analyze(board)
+        strategies = self._strategies
+        if any(isinstance(strategy, RandomExplorer) for strategy in strategies) and self._has_revealed_zero():
+            strategies = [
+                strategy for strategy in strategies if not isinstance(strategy, RandomExplorer)
+            ]
 
-            if not isinstance(strategy, RandomExplorer):
-                self._is_evaluable = True
+        with self._released():
+            result = self._strategy_runner.first_result(strategies, analysis)
+        if self._game.board is not board or getattr(board, "version", None) != version:
+            return None
 
-            for move in moves:
-                try:
-                    self._game.apply_move(move)
-                except ValueError:
-                    return
+        if result is None:
+            # Nothing to do on this board; retry later instead of spinning.
+            return self.IDLE_WAIT_MS
 
-                if self._config.ai_click_feedback:
-                    pygame.time.delay(60)
-            return
+        if not isinstance(result.strategy, RandomExplorer):
+            self._is_evaluable = True
+
+        batch = self._game.apply_moves(result.moves)
+        self._needs_render = True
+        if self._config.ai_click_feedback and not self._turbo:
+            return self.CLICK_FEEDBACK_MS * len(batch.applied)
+        return 0
 
     def _has_revealed_zero(self) -> bool:
         for x in range(self._game.board.width):
@@ -131,11 +320,19 @@ class App:
                 is_evaluable=self._is_evaluable,
             )
         )
-        pygame.time.delay(self._config.restart_delay_ms)
+        self._games_played += 1
+        if self._config.max_games is not None and self._games_played >= self._config.max_games:
+            self._running = False
         self._game.reset(self._config)
+        self._restart_at = None
+        self._needs_render = True
         self._is_evaluable = False
         if self._mode == AI_ONLY:
             self._ai_active = True
 
 
+def _monotonic_ms() -> int:
+    return time.monotonic_ns() // 1_000_000
+
+
 __all__ = ["App", "GameConfig", "GameMode", "PLAYER_ONLY", "AI_ONLY"]
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+
+from minesweeper.ai.registry import CHAINS, StrategyRegistry, parse_chain
+from minesweeper.bench.corpus import CATEGORIES, CORPUS_PATH, generate_corpus, load_corpus, save_corpus
+from minesweeper.bench.solver import (
+    find_regressions,
+    load_results,
+    results_to_json,
+    run_benchmarks,
+)
+from minesweeper.bench.tournament import run_tournament
+from minesweeper.domain.types import PRESETS, GameConfig
+from minesweeper.engine.replay import save_recordings
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m minesweeper.bench")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    solver = commands.add_parser("solver", help="Time the analyzer and every strategy over the position corpus")
+    solver.add_argument("--corpus", type=Path, default=CORPUS_PATH, help="Position corpus to load")
+    solver.add_argument(
+        "--category",
+        action="append",
+        choices=CATEGORIES,
+        help="Only run positions of this category (repeatable)",
+    )
+    solver.add_argument(
+        "--strategies",
+        default="default",
+        help=f"Strategy names or a preset chain ({', '.join(CHAINS)}) to time",
+    )
+    solver.add_argument("--warmup", type=int, default=2, help="Untimed calls per target")
+    solver.add_argument("--repetitions", type=int, default=10, help="Timed calls per target")
+    solver.add_argument(
+        "--max-seconds",
+        type=float,
+        default=2.0,
+        help="Stop repeating a target once its timed calls exceed this",
+    )
+    solver.add_argument("--output", type=Path, help="Write JSON results here instead of stdout")
+    _add_compare_options(solver, "--baseline")
+
+    compare = commands.add_parser("compare", help="Compare two stored result files")
+    compare.add_argument("baseline", type=Path, help="Baseline results file")
+    compare.add_argument("current", type=Path, help="Current results file")
+    _add_compare_options(compare)
+
+    tournament = commands.add_parser(
+        "tournament",
+        help="Play strategy chains on the same seeded boards and compare win rates",
+    )
+    tournament.add_argument(
+        "--chain",
+        action="append",
+        required=True,
+        help=f"Strategy names or a preset chain ({', '.join(CHAINS)}); repeat, the first is the baseline",
+    )
+    tournament.add_argument("--preset", choices=sorted(PRESETS), default="expert", help="Standard board configuration")
+    tournament.add_argument("--width", type=int, help="Board width for a custom configuration")
+    tournament.add_argument("--height", type=int, help="Board height for a custom configuration")
+    tournament.add_argument("--mines", type=int, help="Mine count for a custom configuration")
+    tournament.add_argument("--games", type=int, default=200, help="Boards every chain plays")
+    tournament.add_argument("--seed", type=int, default=0, help="First board seed")
+    tournament.add_argument("--workers", type=int, help="Worker processes (defaults to every core)")
+    tournament.add_argument(
+        "--record-losses",
+        type=Path,
+        help="Write every lost game here as JSON Lines for `python -m minesweeper.replay`",
+    )
+
+    corpus = commands.add_parser("corpus", help="Regenerate the position corpus from seeded games")
+    corpus.add_argument("--games", type=int, default=20, help="Simulated games per preset")
+    corpus.add_argument("--seed", type=int, default=0, help="First simulation seed")
+    corpus.add_argument("--output", type=Path, default=CORPUS_PATH, help="Corpus file to write")
+    return parser
+
+
+def _add_compare_options(parser: argparse.ArgumentParser, baseline_flag: str | None = None) -> None:
+    if baseline_flag is not None:
+        parser.add_argument(baseline_flag, type=Path, help="Flag regressions against this results file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Median slowdown, as a fraction, that counts as a regression",
+    )
+    parser.add_argument(
+        "--min-delta-ms",
+        type=float,
+        default=0.1,
+        help="Ignore slowdowns smaller than this many milliseconds",
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(list(argv) if argv is not None else None)
+
+    if args.command == "corpus":
+        positions = generate_corpus(games=args.games, seed=args.seed)
+        save_corpus(positions, args.output)
+        print(f"Wrote {len(positions)} positions to {args.output}")
+        return 0
+
+    if args.command == "compare":
+        return _report_regressions(
+            load_results(args.baseline),
+            load_results(args.current),
+            args.threshold,
+            args.min_delta_ms,
+        )
+
+    if args.command == "tournament":
+        return _run_tournament(parser, args)
+
+    try:
+        chain = parse_chain(args.strategies)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    positions = load_corpus(args.corpus)
+    if args.category:
+        positions = [position for position in positions if position.category in args.category]
+
+    results = run_benchmarks(
+        positions,
+        strategies_factory=lambda: StrategyRegistry(random.Random(0)).chain(chain),
+        warmup=args.warmup,
+        repetitions=args.repetitions,
+        max_seconds=args.max_seconds,
+    )
+    text = results_to_json(results, positions, args.warmup, args.repetitions)
+    if args.output is None:
+        print(text)
+    else:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(text + "\n", encoding="utf-8")
+
+    if args.baseline is None:
+        return 0
+    current = {key: timing.median_ms for key, timing in results.items()}
+    return _report_regressions(load_results(args.baseline), current, args.threshold, args.min_delta_ms)
+
+
+def _run_tournament(parser: argparse.ArgumentParser, args: argparse.Namespace) -> int:
+    if len(args.chain) < 2:
+        parser.error("pass --chain at least twice")
+    for chain in args.chain:
+        try:
+            parse_chain(chain)
+        except ValueError as exc:
+            parser.error(str(exc))
+
+    custom = (args.width, args.height, args.mines)
+    if all(value is None for value in custom):
+        config = PRESETS[args.preset]
+    elif None in custom:
+        parser.error("pass all of --width, --height and --mines for a custom configuration")
+    else:
+        try:
+            config = GameConfig(width=args.width, height=args.height, num_mines=args.mines)
+        except ValueError as exc:
+            parser.error(str(exc))
+
+    result = run_tournament(
+        args.chain,
+        config,
+        games=args.games,
+        seed=args.seed,
+        workers=args.workers,
+        progress=lambda line: print(line, file=sys.stderr),
+    )
+    for line in result.report_lines():
+        print(line)
+    if args.record_losses is not None:
+        save_recordings(result.losses, args.record_losses)
+        print(f"Wrote {len(result.losses)} lost games to {args.record_losses}", file=sys.stderr)
+    return 0
+
+
+def _report_regressions(
+    baseline: dict[str, float],
+    current: dict[str, float],
+    threshold: float,
+    min_delta_ms: float,
+) -> int:
+    regressions = find_regressions(baseline, current, threshold, min_delta_ms)
+    for regression in regressions:
+        print(f"REGRESSION {regression.describe()}", file=sys.stderr)
+
+    missing = sorted(baseline.keys() - current.keys())
+    if missing:
+        print(f"{len(missing)} baseline benchmarks were not run", file=sys.stderr)
+    if not regressions:
+        print(f"No regressions across {len(baseline.keys() & current.keys())} benchmarks", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import json
+import random
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from minesweeper.ai.analyzer import AnalyzedBoard, Analyzer
+from minesweeper.ai.constraint import Constraint
+from minesweeper.ai.strategies.probability_solver import ProbabilitySolver
+from minesweeper.ai.strategies.unit_propagation import UnitPropagationSolver
+from minesweeper.domain.board import BoardView
+from minesweeper.domain.move import Move
+from minesweeper.domain.tile import Tile
+from minesweeper.domain.types import PRESETS, ActionType, Coord, GameConfig, GamePhase, TileState
+from minesweeper.engine.game import Game
+
+CORPUS_PATH = Path(__file__).resolve().parent.parent / "resources" / "bench" / "positions.json"
+CATEGORIES = ("early", "midgame", "endgame", "huge_frontier", "fifty_fifty")
+
+HIDDEN = "#"
+FLAG = "F"
+
+
+@dataclass(frozen=True)
+class Position:
+    """
+    One fixed board position, stored as text rows.
+
+    `#` is a hidden tile, `F` a flag and `0`-`8` a revealed number.
+    """
+
+    name: str
+    category: str
+    num_mines: int
+    rows: tuple[str, ...] = field(default_factory=tuple)
+
+    @property
+    def width(self) -> int:
+        return len(self.rows[0]) if self.rows else 0
+
+    @property
+    def height(self) -> int:
+        return len(self.rows)
+
+    def board(self) -> PositionBoard:
+        return PositionBoard(self)
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "name": self.name,
+            "category": self.category,
+            "num_mines": self.num_mines,
+            "rows": list(self.rows),
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, object]) -> Position:
+        raw_rows = payload.get("rows")
+        num_mines = payload.get("num_mines")
+        if not isinstance(raw_rows, list) or not isinstance(num_mines, int):
+            raise ValueError(f"position {payload.get('name')} needs a list of rows and an integer num_mines")
+        rows = tuple(str(row) for row in raw_rows)
+        if any(len(row) != len(rows[0]) for row in rows):
+            raise ValueError(f"position {payload['name']} has ragged rows")
+        return cls(
+            name=str(payload["name"]),
+            category=str(payload["category"]),
+            num_mines=num_mines,
+            rows=rows,
+        )
+
+    @classmethod
+    def from_board(cls, name: str, category: str, board: BoardView) -> Position:
+        return cls(
+            name=name,
+            category=category,
+            num_mines=board.num_mines,
+            rows=tuple(
+                "".join(_symbol(board.tile_at(Coord(x, y))) for x in range(board.width))
+                for y in range(board.height)
+            ),
+        )
+
+
+class PositionBoard:
+    """Read-only `BoardView` over a stored position."""
+
+    def __init__(self, position: Position) -> None:
+        self._position = position
+
+    @property
+    def width(self) -> int:
+        return self._position.width
+
+    @property
+    def height(self) -> int:
+        return self._position.height
+
+    @property
+    def num_mines(self) -> int:
+        return self._position.num_mines
+
+    def tile_at(self, coord: Coord) -> Tile:
+        if not (0 <= coord.x < self.width and 0 <= coord.y < self.height):
+            raise KeyError(coord)
+
+        symbol = self._position.rows[coord.y][coord.x]
+        if symbol == HIDDEN:
+            return Tile(coord, TileState.HIDDEN, False)
+        if symbol == FLAG:
+            return Tile(coord, TileState.FLAGGED, False)
+        return Tile(coord, TileState.REVEALED, False, int(symbol))
+
+
+def _symbol(tile: Tile) -> str:
+    if tile.state == TileState.FLAGGED:
+        return FLAG
+    if tile.state == TileState.REVEALED:
+        return str(tile.adjacent_mines)
+    return HIDDEN
+
+
+def load_corpus(path: Path = CORPUS_PATH) -> list[Position]:
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    return [Position.from_dict(entry) for entry in payload["positions"]]
+
+
+def save_corpus(positions: Iterable[Position], path: Path = CORPUS_PATH) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"positions": [position.to_dict() for position in positions]}
+    path.write_text(json.dumps(payload, indent=1) + "\n", encoding="utf-8")
+
+
+def categorize(analysis: AnalyzedBoard, safe_tiles: int) -> set[str]:
+    """Corpus categories a live position qualifies for; `huge_frontier` is ranked separately."""
+    revealed = sum(value >= 0 for value in analysis.grid.values())
+    remaining_safe = len(analysis.unknown_coords) - (analysis.total_mines - len(analysis.flagged_coords))
+    categories: set[str] = set()
+
+    if analysis.constraints and revealed <= safe_tiles // 5:
+        categories.add("early")
+    if safe_tiles * 2 // 5 <= revealed <= safe_tiles * 3 // 5:
+        categories.add("midgame")
+    if 0 < remaining_safe <= 8:
+        categories.add("endgame")
+    if _has_isolated_fifty_fifty(analysis.constraints):
+        categories.add("fifty_fifty")
+    return categories
+
+
+def _has_isolated_fifty_fifty(constraints: Sequence[Constraint]) -> bool:
+    # Numbers that see the same pair describe one constraint, not two.
+    distinct = set(constraints)
+    occurrences: dict[Coord, int] = {}
+    for constraint in distinct:
+        for coord in constraint.unknowns:
+            occurrences[coord] = occurrences.get(coord, 0) + 1
+
+    return any(
+        len(constraint.unknowns) == 2
+        and constraint.mines_needed == 1
+        and all(occurrences[coord] == 1 for coord in constraint.unknowns)
+        for constraint in distinct
+    )
+
+
+def generate_corpus(
+    presets: Mapping[str, GameConfig] = PRESETS,
+    games: int = 20,
+    seed: int = 0,
+) -> list[Position]:
+    """
+    Play seeded games with the deterministic solver chain and keep the first
+    position seen per category and preset, plus the widest frontier.
+    """
+    analyzer = Analyzer()
+    positions: list[Position] = []
+    for preset, config in presets.items():
+        deducer = UnitPropagationSolver()
+        guesser = ProbabilitySolver()
+        safe_tiles = config.width * config.height - config.num_mines
+        found: dict[str, Position] = {}
+        widest: tuple[int, Position] | None = None
+
+        for game_seed in range(seed, seed + games):
+            game = Game(config, random.Random(game_seed))
+            game.apply_move(Move(ActionType.REVEAL, Coord(config.width // 2, config.height // 2)))
+            while game.phase == GamePhase.IN_PROGRESS:
+                analysis = analyzer.analyze(game.board)
+                for category in categorize(analysis, safe_tiles) - set(found):
+                    found[category] = Position.from_board(f"{category}-{preset}", category, game.board)
+
+                frontier_size = len({coord for constraint in analysis.constraints for coord in constraint.unknowns})
+                if widest is None or frontier_size > widest[0]:
+                    widest = (
+                        frontier_size,
+                        Position.from_board(f"huge_frontier-{preset}", "huge_frontier", game.board),
+                    )
+
+                moves = deducer.find_moves(analysis) or guesser.find_moves(analysis)
+                if not game.apply_moves(moves).applied:
+                    break
+
+        if widest is not None:
+            found["huge_frontier"] = widest[1]
+        positions.extend(found[category] for category in CATEGORIES if category in found)
+
+    return positions
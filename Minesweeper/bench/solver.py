@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import json
+import platform
+import random
+import statistics
+import time
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import TypeVar
+
+from minesweeper.ai.analyzer import AnalyzedBoard, Analyzer
+from minesweeper.ai.registry import StrategyRegistry
+from minesweeper.ai.strategy import AIStrategy
+from minesweeper.bench.corpus import Position
+from minesweeper.domain.board import BoardView
+
+ANALYZE = "Analyzer.analyze"
+FORMAT_VERSION = 1
+
+T = TypeVar("T")
+
+
+def default_strategies() -> list[AIStrategy]:
+    return StrategyRegistry(random.Random(0)).chain()
+
+
+@dataclass(frozen=True)
+class Timing:
+    samples: int
+    min_ms: float
+    median_ms: float
+    mean_ms: float
+    max_ms: float
+
+    @classmethod
+    def from_seconds(cls, samples: Sequence[float]) -> Timing:
+        millis = [sample * 1000 for sample in samples]
+        return cls(
+            samples=len(millis),
+            min_ms=min(millis),
+            median_ms=statistics.median(millis),
+            mean_ms=statistics.fmean(millis),
+            max_ms=max(millis),
+        )
+
+    def to_dict(self) -> dict[str, int | float]:
+        return {
+            "samples": self.samples,
+            "min_ms": round(self.min_ms, 6),
+            "median_ms": round(self.median_ms, 6),
+            "mean_ms": round(self.mean_ms, 6),
+            "max_ms": round(self.max_ms, 6),
+        }
+
+
+@dataclass(frozen=True)
+class Regression:
+    key: str
+    baseline_ms: float
+    current_ms: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current_ms / self.baseline_ms if self.baseline_ms else float("inf")
+
+    def describe(self) -> str:
+        return f"{self.key}: {self.baseline_ms:.3f} ms -> {self.current_ms:.3f} ms ({self.ratio:.2f}x)"
+
+
+def time_call(
+    fn: Callable[[], object],
+    warmup: int,
+    repetitions: int,
+    max_seconds: float | None = None,
+    clock: Callable[[], float] = time.perf_counter,
+) -> list[float]:
+    """
+    Run `fn` `warmup` times untimed, then time up to `repetitions` calls.
+
+    Stops early, after at least one timed call, once the timed calls exceed
+    `max_seconds` so slow targets do not dominate the run.
+    """
+    return time_fresh_call(lambda: None, lambda _prepared: fn(), warmup, repetitions, max_seconds, clock)
+
+
+def time_fresh_call(
+    setup: Callable[[], T],
+    fn: Callable[[T], object],
+    warmup: int,
+    repetitions: int,
+    max_seconds: float | None = None,
+    clock: Callable[[], float] = time.perf_counter,
+) -> list[float]:
+    """
+    Like `time_call`, but every call gets its own `setup()` result.
+
+    `setup` runs untimed before each warmup and timed call, so targets
+    that cache per board or per instance are timed cold every time.
+    """
+    for _index in range(warmup):
+        fn(setup())
+
+    samples: list[float] = []
+    for _index in range(max(1, repetitions)):
+        prepared = setup()
+        started = clock()
+        fn(prepared)
+        samples.append(clock() - started)
+        if max_seconds is not None and sum(samples) >= max_seconds:
+            break
+    return samples
+
+
+def run_benchmarks(
+    positions: Iterable[Position],
+    strategies_factory: Callable[[], Sequence[AIStrategy]] = default_strategies,
+    warmup: int = 2,
+    repetitions: int = 10,
+    max_seconds: float | None = 2.0,
+    clock: Callable[[], float] = time.perf_counter,
+) -> dict[str, Timing]:
+    """
+    Time `Analyzer.analyze` and every strategy's `find_moves` per position.
+
+    Every call gets a fresh `Analyzer`, a fresh analysis and fresh
+    strategies from `strategies_factory`, so no timing is a cache hit
+    from an earlier repetition. The analyze timing includes deriving the
+    shared frontier constraints, so strategy timings measure only their
+    own work, as for every strategy after the first one in a chain.
+    """
+    names = [strategy.name for strategy in strategies_factory()]
+    results: dict[str, Timing] = {}
+    for position in positions:
+        board = position.board()
+        results[f"{position.name}/{ANALYZE}"] = Timing.from_seconds(
+            time_fresh_call(
+                Analyzer,
+                lambda analyzer: analyzer.analyze(board).constraints,
+                warmup,
+                repetitions,
+                max_seconds,
+                clock,
+            )
+        )
+
+        for index, name in enumerate(names):
+            results[f"{position.name}/{name}"] = Timing.from_seconds(
+                time_fresh_call(
+                    partial(_fresh_strategy_call, board, strategies_factory, index),
+                    _run_strategy,
+                    warmup,
+                    repetitions,
+                    max_seconds,
+                    clock,
+                )
+            )
+    return results
+
+
+def _fresh_strategy_call(
+    board: BoardView,
+    strategies_factory: Callable[[], Sequence[AIStrategy]],
+    index: int,
+) -> tuple[AIStrategy, AnalyzedBoard]:
+    analysis = Analyzer().analyze(board)
+    # Derive the shared constraints here, outside the strategy timing.
+    _ = analysis.constraints
+    return strategies_factory()[index], analysis
+
+
+def _run_strategy(prepared: tuple[AIStrategy, AnalyzedBoard]) -> object:
+    strategy, analysis = prepared
+    return strategy.find_moves(analysis)
+
+
+def results_to_json(
+    results: Mapping[str, Timing],
+    positions: Sequence[Position],
+    warmup: int,
+    repetitions: int,
+) -> str:
+    return json.dumps(
+        {
+            "version": FORMAT_VERSION,
+            "python": platform.python_version(),
+            "warmup": warmup,
+            "repetitions": repetitions,
+            "positions": {position.name: position.category for position in positions},
+            "benchmarks": {key: timing.to_dict() for key, timing in sorted(results.items())},
+        },
+        indent=1,
+    )
+
+
+def load_results(path: Path) -> dict[str, float]:
+    """Median milliseconds per benchmark key from a results file."""
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    if payload.get("version") != FORMAT_VERSION:
+        raise ValueError(f"{path} is not a version {FORMAT_VERSION} benchmark file")
+    return {key: entry["median_ms"] for key, entry in payload["benchmarks"].items()}
+
+
+def find_regressions(
+    baseline: Mapping[str, float],
+    current: Mapping[str, float],
+    threshold: float = 0.25,
+    min_delta_ms: float = 0.1,
+) -> list[Regression]:
+    """
+    Benchmarks whose median grew by more than `threshold` (a fraction) and
+    by more than `min_delta_ms`, so timer noise on tiny timings is ignored.
+    """
+    regressions = [
+        Regression(key, baseline[key], current[key])
+        for key in sorted(baseline.keys() & current.keys())
+        if current[key] > baseline[key] * (1 + threshold)
+        and current[key] - baseline[key] > min_delta_ms
+    ]
+    return sorted(regressions, key=lambda regression: regression.ratio, reverse=True)
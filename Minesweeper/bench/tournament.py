@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import math
+import os
+import random
+import statistics
+import time
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import NamedTuple
+
+from minesweeper.ai.analyzer import Analyzer
+from minesweeper.ai.registry import StrategyRegistry, parse_chain
+from minesweeper.ai.runner import StrategyRunner
+from minesweeper.ai.strategies.random_explorer import RandomExplorer
+from minesweeper.domain.move import Move
+from minesweeper.domain.types import GameConfig, GamePhase
+from minesweeper.engine.game import Game
+from minesweeper.engine.replay import RecordedGame
+from minesweeper.engine.stats import GameResult, StatsTracker
+
+SEEDS_PER_TASK = 10
+
+
+class GameRecord(NamedTuple):
+    seed: int
+    won: bool
+    is_evaluable: bool
+    seconds: float
+    moves: int
+    played: tuple[Move, ...] = ()  # every applied move, in order, for replays
+
+
+@dataclass(frozen=True)
+class ChainSummary:
+    name: str
+    games: int
+    wins: int
+    evaluable_win_rate: float
+    mean_seconds: float
+    mean_moves: float
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.games if self.games else 0.0
+
+    def describe(self) -> str:
+        return (
+            f"{self.name}: won {self.wins}/{self.games} ({self.win_rate:.1%}), "
+            f"evaluable win rate {self.evaluable_win_rate:.1%}, "
+            f"{self.mean_seconds * 1000:.1f}ms and {self.mean_moves:.1f} moves per game"
+        )
+
+
+@dataclass(frozen=True)
+class PairedComparison:
+    """
+    One challenger chain against the baseline over the same seeded boards.
+
+    Only boards exactly one of the two chains won carry information about
+    which is stronger, so the p-value is the exact two-sided McNemar test
+    on those discordant pairs.
+    """
+
+    baseline: str
+    challenger: str
+    games: int
+    baseline_only_wins: int
+    challenger_only_wins: int
+
+    @property
+    def win_rate_difference(self) -> float:
+        if not self.games:
+            return 0.0
+        return (self.challenger_only_wins - self.baseline_only_wins) / self.games
+
+    @property
+    def p_value(self) -> float:
+        return mcnemar_p_value(self.baseline_only_wins, self.challenger_only_wins)
+
+    def describe(self) -> str:
+        return (
+            f"{self.challenger} vs {self.baseline}: {self.win_rate_difference:+.1%} win rate "
+            f"({self.challenger_only_wins} boards only {self.challenger} won, "
+            f"{self.baseline_only_wins} only {self.baseline} won, p={self.p_value:.3g})"
+        )
+
+
+@dataclass(frozen=True)
+class TournamentResult:
+    summaries: tuple[ChainSummary, ...]
+    comparisons: tuple[PairedComparison, ...]
+    losses: tuple[RecordedGame, ...] = ()
+
+    def report_lines(self) -> list[str]:
+        return [
+            *(summary.describe() for summary in self.summaries),
+            *(comparison.describe() for comparison in self.comparisons),
+        ]
+
+
+def mcnemar_p_value(first_only: int, second_only: int) -> float:
+    """Exact two-sided McNemar test: a binomial test of the discordant pairs at p=0.5."""
+    discordant = first_only + second_only
+    if discordant == 0:
+        return 1.0
+    tail = sum(math.comb(discordant, k) for k in range(min(first_only, second_only) + 1))
+    p_value: float = 2 * tail / 2**discordant
+    return min(1.0, p_value)
+
+
+def play_game(names: Sequence[str], config: GameConfig, seed: int) -> GameRecord:
+    """
+    Play one board to the end with the named chain.
+
+    The board is seeded with `seed`, so every chain faces exactly the same
+    mine layout. The strategies get an independent generator derived from
+    `seed`: with the same stream a random first click would land on a
+    mine, which the engine then moves, and the chains would no longer
+    play the same board.
+    """
+    started = time.perf_counter()
+    game = Game(config, random.Random(seed))
+    strategies = StrategyRegistry(random.Random(f"strategy:{seed}")).chain(names)
+    analyzer = Analyzer()
+    runner = StrategyRunner()
+    is_evaluable = False
+    played: list[Move] = []
+
+    while game.phase in {GamePhase.NOT_STARTED, GamePhase.IN_PROGRESS}:
+        analysis = analyzer.analyze(game.board)
+        chain = strategies
+        if any(value == 0 for value in analysis.grid.values()):
+            chain = [strategy for strategy in strategies if not isinstance(strategy, RandomExplorer)]
+
+        result = runner.first_result(chain, analysis)
+        if result is None:
+            break
+
+        applied = game.apply_moves(result.moves).applied
+        if not applied:
+            break
+        played.extend(applied)
+        if not isinstance(result.strategy, RandomExplorer):
+            is_evaluable = True
+
+    return GameRecord(
+        seed=seed,
+        won=game.phase == GamePhase.WON,
+        is_evaluable=is_evaluable,
+        seconds=time.perf_counter() - started,
+        moves=len(played),
+        played=tuple(played),
+    )
+
+
+def _play_seeds(names: Sequence[str], config: GameConfig, seeds: Sequence[int]) -> list[GameRecord]:
+    return [play_game(names, config, seed) for seed in seeds]
+
+
+def run_tournament(
+    chains: Sequence[str],
+    config: GameConfig,
+    games: int,
+    seed: int = 0,
+    workers: int | None = None,
+    progress: Callable[[str], None] | None = None,
+) -> TournamentResult:
+    """
+    Play every chain on the boards seeded `seed` .. `seed + games - 1`.
+
+    `chains` are chain texts as accepted by `parse_chain`; the first is the
+    baseline every other chain is compared against. Games are spread over
+    `workers` processes (all cores by default). Every lost game comes back
+    as a `RecordedGame` for the replay viewer.
+    """
+    if len(chains) < 2:
+        raise ValueError("a tournament needs at least two chains")
+    if games < 1:
+        raise ValueError("games must be at least 1")
+
+    resolved = [parse_chain(chain) for chain in chains]
+    seeds = list(range(seed, seed + games))
+    batches = [seeds[start:start + SEEDS_PER_TASK] for start in range(0, games, SEEDS_PER_TASK)]
+    tasks = [(index, batch) for index in range(len(chains)) for batch in batches]
+    chain_args = [resolved[index] for index, _batch in tasks]
+    config_args = [config] * len(tasks)
+    seed_args = [batch for _index, batch in tasks]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        records = _collect(chains, games, tasks, map(_play_seeds, chain_args, config_args, seed_args), progress)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            outcomes = executor.map(_play_seeds, chain_args, config_args, seed_args)
+            records = _collect(chains, games, tasks, outcomes, progress)
+
+    summaries = tuple(_summarize(chain, list(by_seed.values())) for chain, by_seed in zip(chains, records))
+    comparisons = tuple(
+        _compare(chains[0], records[0], chains[index], records[index])
+        for index in range(1, len(chains))
+    )
+    losses = tuple(
+        RecordedGame(
+            width=config.width,
+            height=config.height,
+            num_mines=config.num_mines,
+            seed=record.seed,
+            moves=record.played,
+            label=f"{chain} seed {record.seed}",
+        )
+        for chain, by_seed in zip(chains, records)
+        for _seed, record in sorted(by_seed.items())
+        if not record.won
+    )
+    return TournamentResult(summaries, comparisons, losses)
+
+
+def _collect(
+    chains: Sequence[str],
+    games: int,
+    tasks: Sequence[tuple[int, Sequence[int]]],
+    outcomes: Iterable[list[GameRecord]],
+    progress: Callable[[str], None] | None,
+) -> list[dict[int, GameRecord]]:
+    records: list[dict[int, GameRecord]] = [{} for _ in chains]
+    for (index, _batch), batch_records in zip(tasks, outcomes):
+        for record in batch_records:
+            records[index][record.seed] = record
+        if progress is not None:
+            progress(f"{chains[index]}: {len(records[index])}/{games} games")
+    return records
+
+
+def _summarize(name: str, records: Sequence[GameRecord]) -> ChainSummary:
+    stats = StatsTracker()
+    for record in records:
+        stats.record(GameResult(won=record.won, is_evaluable=record.is_evaluable))
+
+    return ChainSummary(
+        name=name,
+        games=len(records),
+        wins=sum(record.won for record in records),
+        evaluable_win_rate=stats.win_rate,
+        mean_seconds=statistics.fmean(record.seconds for record in records),
+        mean_moves=statistics.fmean(record.moves for record in records),
+    )
+
+
+def _compare(
+    baseline: str,
+    baseline_records: dict[int, GameRecord],
+    challenger: str,
+    challenger_records: dict[int, GameRecord],
+) -> PairedComparison:
+    seeds = baseline_records.keys() & challenger_records.keys()
+    return PairedComparison(
+        baseline=baseline,
+        challenger=challenger,
+        games=len(seeds),
+        baseline_only_wins=sum(
+            baseline_records[seed].won and not challenger_records[seed].won for seed in seeds
+        ),
+        challenger_only_wins=sum(
+            challenger_records[seed].won and not baseline_records[seed].won for seed in seeds
+        ),
+    )
@@ -66,6 +66,9 @@ PLAYER_ONLY = GameMode("Player Only", player_input=True, ai_enabled=False)
 HYBRID = GameMode("Hybrid", player_input=True, ai_enabled=True, ai_togglable=True)
 
 
+RENDERERS = ("pygame", "text", "null")
+
+
 @dataclass(frozen=True)
 class GameConfig:
     """All user-tunable knobs. Frozen so it's safe to pass around."""
@@ -77,10 +80,33 @@ class GameConfig:
     font_size_px: int = 30
     restart_delay_ms: int = 1000
     ai_click_feedback: bool = False
+    ai_turbo: bool = False
+    strategy_workers: int = 1
+    max_fps: int = 60
+    strategies: tuple[str, ...] | None = None  # strategy names; None is the default chain
+    renderer: str = "pygame"  # one of RENDERERS
+    max_games: int | None = None  # stop after this many finished games; None plays until closed
 
     def __post_init__(self) -> None:
+        if self.strategy_workers < 1:
+            raise ValueError(
+                f"strategy_workers ({self.strategy_workers}) must be at least 1"
+            )
+        if self.max_fps < 1:
+            raise ValueError(f"max_fps ({self.max_fps}) must be at least 1")
+        if self.renderer not in RENDERERS:
+            raise ValueError(f"renderer ({self.renderer!r}) must be one of {', '.join(RENDERERS)}")
+        if self.max_games is not None and self.max_games < 1:
+            raise ValueError(f"max_games ({self.max_games}) must be at least 1")
         if self.num_mines >= self.width * self.height:
             raise ValueError(
                 f"num_mines ({self.num_mines}) must be less than "
                 f"total tiles ({self.width * self.height})"
             )
+
+
+PRESETS: dict[str, GameConfig] = {
+    "beginner": GameConfig(width=9, height=9, num_mines=10),
+    "intermediate": GameConfig(width=16, height=16, num_mines=40),
+    "expert": GameConfig(width=30, height=16, num_mines=99),
+}
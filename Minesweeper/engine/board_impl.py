@@ -1,5 +1,8 @@
+from collections import Counter
+from collections.abc import Mapping
 from dataclasses import dataclass
 import random
+from types import MappingProxyType
 
 from minesweeper.domain.tile import Tile
 from minesweeper.domain.types import Coord, GameConfig, TileState
@@ -21,6 +24,8 @@ class Board:
         self._height = config.height
         self._num_mines = config.num_mines
         self._cells: dict[Coord, _Cell] = {}
+        self._version = 0
+        self._state_counts = Counter({TileState.HIDDEN: self._width * self._height})
         generator = rng or random.Random()
 
         mine_coords = set(
@@ -52,6 +57,16 @@ class Board:
     def num_mines(self) -> int:
         return self._num_mines
 
+    @property
+    def version(self) -> int:
+        """Incremented on every change, so analyses can be cached per state."""
+        return self._version
+
+    @property
+    def state_counts(self) -> Mapping[TileState, int]:
+        """How many tiles are in each state, kept current by `set_state`."""
+        return MappingProxyType(self._state_counts)
+
     def tile_at(self, coord: Coord) -> Tile:
         cell = self._cells[coord]
         return Tile(
@@ -62,7 +77,11 @@ class Board:
         )
 
     def set_state(self, coord: Coord, state: TileState) -> None:
-        self._cells[coord].state = state
+        cell = self._cells[coord]
+        self._state_counts[cell.state] -= 1
+        self._state_counts[state] += 1
+        cell.state = state
+        self._version += 1
 
     def relocate_mine(self, coord: Coord) -> None:
         source = self._cells[coord]
@@ -74,6 +93,7 @@ class Board:
                 source.is_mine = False
                 target.is_mine = True
                 self._recompute_adjacent_counts()
+                self._version += 1
                 return
 
     def _recompute_adjacent_counts(self) -> None:
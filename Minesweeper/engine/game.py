@@ -1,11 +1,37 @@
 import random
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
+from typing import NamedTuple
 
 from minesweeper.domain.move import Move
 from minesweeper.domain.types import ActionType, Coord, GameConfig, GamePhase, TileState
 from minesweeper.engine.board_impl import Board
 
 
+class MoveOutcome(NamedTuple):
+    """Result of one move inside a batch. `skipped` holds the reason it was not applied."""
+
+    move: Move
+    changed: tuple[Coord, ...] = ()
+    skipped: str | None = None
+
+    @property
+    def applied(self) -> bool:
+        return self.skipped is None
+
+
+class BatchOutcome(NamedTuple):
+    outcomes: tuple[MoveOutcome, ...]
+    changed: tuple[Coord, ...]
+
+    @property
+    def applied(self) -> tuple[Move, ...]:
+        return tuple(outcome.move for outcome in self.outcomes if outcome.applied)
+
+    @property
+    def skipped(self) -> tuple[MoveOutcome, ...]:
+        return tuple(outcome for outcome in self.outcomes if not outcome.applied)
+
+
 class Game:
     """Concrete game engine."""
 
@@ -23,9 +49,46 @@ class Game:
         return self._board
 
     def apply_move(self, move: Move) -> Sequence[Coord]:
+        self._ensure_not_over()
+        return self._apply(move, check_win=True)
+
+    def apply_moves(self, moves: Iterable[Move]) -> BatchOutcome:
+        """
+        Apply a batch of moves, skipping the ones that are invalid.
+
+        The win scan runs once after the batch instead of after every reveal.
+        Moves after a loss are reported as skipped.
+        """
+        outcomes: list[MoveOutcome] = []
+        changed: dict[Coord, None] = {}
+        revealed = False
+
+        for move in moves:
+            try:
+                self._ensure_not_over()
+                move_changed = self._apply(move, check_win=False)
+            except ValueError as exc:
+                outcomes.append(MoveOutcome(move, skipped=str(exc)))
+                continue
+
+            revealed = revealed or move.action == ActionType.REVEAL
+            changed.update(dict.fromkeys(move_changed))
+            outcomes.append(MoveOutcome(move, tuple(move_changed)))
+
+        if (
+            revealed
+            and self._phase == GamePhase.IN_PROGRESS
+            and self._all_safe_tiles_revealed()
+        ):
+            self._phase = GamePhase.WON
+
+        return BatchOutcome(tuple(outcomes), tuple(changed))
+
+    def _ensure_not_over(self) -> None:
         if self._phase in {GamePhase.WON, GamePhase.LOST}:
             raise ValueError("Cannot apply moves after the game is over")
 
+    def _apply(self, move: Move, check_win: bool) -> list[Coord]:
         if move.action == ActionType.REVEAL:
             try:
                 tile = self._board.tile_at(move.coord)
@@ -46,12 +109,16 @@ class Game:
                     tile = self._board.tile_at(move.coord)
 
             if tile.is_mine and not starting_move:
+                if not check_win and self._all_safe_tiles_revealed():
+                    # A deferred batch already won the game before this move.
+                    self._phase = GamePhase.WON
+                    raise ValueError("Cannot apply moves after the game is over")
                 self._board.set_state(move.coord, TileState.EXPLODED)
                 self._phase = GamePhase.LOST
                 return [move.coord]
 
             changed = self._reveal_from(move.coord)
-            if self._all_safe_tiles_revealed():
+            if check_win and self._all_safe_tiles_revealed():
                 self._phase = GamePhase.WON
             return changed
 
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import copy
+import json
+import random
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from minesweeper.domain.move import Move
+from minesweeper.domain.types import ActionType, Coord, GameConfig, GamePhase
+from minesweeper.engine.board_impl import Board
+from minesweeper.engine.game import Game
+
+KEYFRAME_INTERVAL = 50
+
+
+@dataclass(frozen=True)
+class RecordedGame:
+    """
+    One played game: the seeded board plus every move that was applied.
+
+    The board is rebuilt as `Game(config, random.Random(seed))`, the same
+    way the tournament creates it, so replaying the moves reproduces the
+    game exactly.
+    """
+
+    width: int
+    height: int
+    num_mines: int
+    seed: int
+    moves: tuple[Move, ...] = field(default_factory=tuple)
+    label: str = ""
+
+    @property
+    def config(self) -> GameConfig:
+        return GameConfig(width=self.width, height=self.height, num_mines=self.num_mines)
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "label": self.label,
+            "width": self.width,
+            "height": self.height,
+            "num_mines": self.num_mines,
+            "seed": self.seed,
+            "moves": [[move.action.name.lower(), move.coord.x, move.coord.y] for move in self.moves],
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, object]) -> RecordedGame:
+        width, height, num_mines, seed = (payload.get(key) for key in ("width", "height", "num_mines", "seed"))
+        raw_moves = payload.get("moves")
+        if not (
+            isinstance(width, int)
+            and isinstance(height, int)
+            and isinstance(num_mines, int)
+            and isinstance(seed, int)
+            and isinstance(raw_moves, list)
+        ):
+            raise ValueError(
+                f"recording {payload.get('label', '')!r} needs integer width, height, num_mines "
+                "and seed and a list of moves"
+            )
+        try:
+            moves = tuple(
+                Move(ActionType[str(action).upper()], Coord(int(x), int(y)))
+                for action, x, y in raw_moves
+            )
+        except (KeyError, TypeError, ValueError) as exc:
+            raise ValueError(f"invalid recorded moves: {exc}") from exc
+        return cls(
+            width=width,
+            height=height,
+            num_mines=num_mines,
+            seed=seed,
+            moves=moves,
+            label=str(payload.get("label", "")),
+        )
+
+
+def load_recordings(path: Path) -> list[RecordedGame]:
+    """Recorded games from a JSON Lines file, one game per line."""
+    lines = path.read_text(encoding="utf-8").splitlines()
+    return [RecordedGame.from_dict(json.loads(line)) for line in lines if line.strip()]
+
+
+def save_recordings(games: Iterable[RecordedGame], path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        "".join(json.dumps(game.to_dict()) + "\n" for game in games),
+        encoding="utf-8",
+    )
+
+
+class GameReplay:
+    """
+    Steps through a recorded game, forwards or backwards.
+
+    A snapshot of the game is kept every `keyframe_interval` moves the
+    first time the replay passes that point. Seeking restores the nearest
+    snapshot at or before the target and applies only the moves after it,
+    so scrubbing never re-simulates from move zero.
+    """
+
+    def __init__(self, recording: RecordedGame, keyframe_interval: int = KEYFRAME_INTERVAL) -> None:
+        if keyframe_interval < 1:
+            raise ValueError(f"keyframe_interval ({keyframe_interval}) must be at least 1")
+        self._recording = recording
+        self._interval = keyframe_interval
+        start = Game(recording.config, random.Random(recording.seed))
+        self._keyframes: dict[int, Game] = {0: start}
+        self._game = copy.deepcopy(start)
+        self._position = 0
+
+    @property
+    def recording(self) -> RecordedGame:
+        return self._recording
+
+    @property
+    def position(self) -> int:
+        """How many recorded moves have been applied."""
+        return self._position
+
+    @property
+    def length(self) -> int:
+        return len(self._recording.moves)
+
+    @property
+    def board(self) -> Board:
+        return self._game.board
+
+    @property
+    def phase(self) -> GamePhase:
+        return self._game.phase
+
+    @property
+    def last_move(self) -> Move | None:
+        return self._recording.moves[self._position - 1] if self._position else None
+
+    def step(self, count: int = 1) -> None:
+        self.seek(self._position + count)
+
+    def seek(self, position: int) -> None:
+        position = max(0, min(position, self.length))
+        keyframe = max(index for index in self._keyframes if index <= position)
+        if position < self._position or keyframe > self._position:
+            self._game = copy.deepcopy(self._keyframes[keyframe])
+            self._position = keyframe
+
+        moves = self._recording.moves
+        while self._position < position:
+            try:
+                self._game.apply_move(moves[self._position])
+            except ValueError:
+                # Only applied moves are recorded; tolerate hand-edited files.
+                pass
+            self._position += 1
+            if self._position % self._interval == 0 and self._position not in self._keyframes:
+                self._keyframes[self._position] = copy.deepcopy(self._game)
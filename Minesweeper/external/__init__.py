@@ -5,7 +5,7 @@ from minesweeper.external.api import calibrate, read_once, run
 from minesweeper.external.app import ExternalApp
 from minesweeper.external.capture import CaptureError, ScreenCapture, ScreenRegion, TileSize
 from minesweeper.external.calibration import CalibrationResult, CalibrationWizard
-from minesweeper.external.classifier import ColorProfiles, TileClassifier
+from minesweeper.external.classifier import ClassificationMemo, ColorProfiles, TileClassifier
 from minesweeper.external.board_reader import ScreenBoardReader
 from minesweeper.external.config import DiagnosticsConfig, RetryPolicy, TimingConfig
 from minesweeper.external.diagnostics import DiagnosticsRecorder
@@ -27,6 +27,7 @@ __all__ = [
     "CalibrationError",
     "CalibrationResult",
     "CalibrationWizard",
+    "ClassificationMemo",
     "ColorProfiles",
     "DiagnosticsConfig",
     "DiagnosticsRecorder",
@@ -1,12 +1,21 @@
 from __future__ import annotations
 
-from typing import Protocol
+from typing import Protocol, TypedDict
 
 from minesweeper.external.config import TimingConfig
 
 
+class ClassifierConfig(TypedDict, total=False):
+    """Keyword arguments an adapter passes on to `TileClassifier`."""
+
+    background_threshold: float
+    center_threshold: float
+    number_threshold: float
+    flag_threshold: float
+
+
 class ExternalAdapter(Protocol):
-    def classifier_config(self) -> dict[str, object]:
+    def classifier_config(self) -> ClassifierConfig:
         ...
 
     def timing_config(self) -> TimingConfig:
@@ -5,13 +5,14 @@ from pathlib import Path
 from typing import Any
 
 from minesweeper.ai.analyzer import Analyzer
+from minesweeper.ai.runner import StrategyRunner
 from minesweeper.ai.strategy import AIStrategy
 from minesweeper.domain.tile import Tile
 from minesweeper.external.app import ExternalApp
-from minesweeper.external.adapter import ExternalAdapter
+from minesweeper.external.adapter import ClassifierConfig, ExternalAdapter
 from minesweeper.external.calibration import CalibrationResult, CalibrationWizard
 from minesweeper.external.capture import ScreenCapture
-from minesweeper.external.classifier import TileClassifier
+from minesweeper.external.classifier import ClassificationMemo, TileClassifier
 from minesweeper.external.config import DiagnosticsConfig, RetryPolicy, TimingConfig
 from minesweeper.external.diagnostics import DiagnosticsRecorder
 from minesweeper.external.errors import CalibrationError
@@ -34,7 +35,7 @@ def calibrate(
     timing: TimingConfig | None = None,
     output: Callable[[str], None] | None = None,
 ) -> CalibrationResult:
-    runtime_capture = capture or ScreenCapture()
+    runtime_capture = capture or ScreenCapture(array_frames=True)
     timing_config = timing or _adapter_timing(adapter)
     wizard = CalibrationWizard(
         runtime_capture,
@@ -63,7 +64,7 @@ def read_once(
     capture: ScreenCapture | None = None,
     classifier: TileClassifier | None = None,
 ) -> dict[Coord, Tile]:
-    runtime_capture = capture or ScreenCapture()
+    runtime_capture = capture or ScreenCapture(array_frames=True)
     runtime_classifier = classifier or TileClassifier(
         calibration.profiles,
         **_adapter_classifier_config(adapter),
@@ -94,11 +95,13 @@ def run(
     executor: ScreenMoveExecutor | None = None,
     analyzer: Analyzer | None = None,
     strategies: Sequence[AIStrategy] | None = None,
+    strategy_runner: StrategyRunner | None = None,
     sleep: Callable[[float], None] | None = None,
     output: Callable[[str], None] | None = None,
     timing: TimingConfig | None = None,
     diagnostics: DiagnosticsConfig | None = None,
     retry: RetryPolicy | None = None,
+    classification_memo_dir: Path | None = None,
 ) -> Any:
     retry_config = retry or RetryPolicy()
     try:
@@ -113,8 +116,12 @@ def run(
     except CalibrationError:
         return STOP_REASONS.calibration_failed
     timing_config = timing or _adapter_timing(adapter)
+    memo = None
+    if classifier is None and classification_memo_dir is not None:
+        memo = ClassificationMemo(classification_memo_dir)
     runtime_classifier = classifier or TileClassifier(
         runtime_calibration.profiles,
+        memo=memo,
         **_adapter_classifier_config(adapter),
     )
     recorder = DiagnosticsRecorder(diagnostics, runtime_calibration, timing_config)
@@ -129,13 +136,18 @@ def run(
         executor=executor,
         analyzer=analyzer,
         strategies=strategies,
+        strategy_runner=strategy_runner,
         sleep=sleep,
         output=output,
         board_read_retries=retry_config.board_read_retries,
         unchanged_board_retries=retry_config.unchanged_board_retries,
         debug_capture_dir=debug_capture_dir,
     )
-    reason = app.run()
+    try:
+        reason = app.run()
+    finally:
+        if memo is not None:
+            memo.save()
     if reason in {
         STOP_REASONS.board_refresh_failed_after_retry,
         STOP_REASONS.execution_failed,
@@ -145,7 +157,7 @@ def run(
     return reason
 
 
-def _adapter_classifier_config(adapter: ExternalAdapter | None) -> dict[str, object]:
+def _adapter_classifier_config(adapter: ExternalAdapter | None) -> ClassifierConfig:
     if adapter is None:
         return {}
     return adapter.classifier_config()
@@ -6,12 +6,11 @@ from collections.abc import Callable, Sequence
 from pathlib import Path
 
 from minesweeper.ai.analyzer import Analyzer
+from minesweeper.ai.instrumentation import StrategyProfiler, StrategyStats
+from minesweeper.ai.registry import StrategyRegistry
+from minesweeper.ai.runner import StrategyRunner
 from minesweeper.ai.strategy import AIStrategy
-from minesweeper.ai.strategies.constraint_subtractor import ConstraintSubtractor
-from minesweeper.ai.strategies.pattern_detector import PatternDetector
-from minesweeper.ai.strategies.probability_solver import ProbabilitySolver
 from minesweeper.ai.strategies.random_explorer import RandomExplorer
-from minesweeper.ai.strategies.transitive_matcher import TransitiveMatcher
 from minesweeper.domain.move import Move
 from minesweeper.domain.types import ActionType, Coord, TileState
 from minesweeper.external.board_reader import ScreenBoardReader
@@ -38,6 +37,7 @@ class ExternalApp:
         executor: ScreenMoveExecutor | None = None,
         analyzer: Analyzer | None = None,
         strategies: Sequence[AIStrategy] | None = None,
+        strategy_runner: StrategyRunner | None = None,
         sleep: Callable[[float], None] | None = None,
         output: Callable[[str], None] | None = None,
     ) -> None:
@@ -48,7 +48,7 @@ class ExternalApp:
         self._sleep = sleep or time.sleep
         self._output = output or (lambda _message: None)
 
-        runtime_capture = capture or ScreenCapture()
+        runtime_capture = capture or ScreenCapture(array_frames=True)
         runtime_classifier = classifier or TileClassifier(calibration.profiles)
         self._board_reader = board_reader or ScreenBoardReader(
             capture=runtime_capture,
@@ -73,15 +73,29 @@ class ExternalApp:
         self._batch_index = 0
         self._move_index = 0
         self._rng = random.Random()
-        self._strategies = list(strategies) if strategies is not None else [
-            RandomExplorer(self._rng),
-            PatternDetector(),
-            ConstraintSubtractor(),
-            TransitiveMatcher(),
-            ProbabilitySolver(),
-        ]
+        self._strategies = (
+            list(strategies)
+            if strategies is not None
+            else StrategyRegistry(self._rng).chain()
+        )
+        self._strategy_runner = strategy_runner or StrategyRunner(profiler=StrategyProfiler())
+
+    @property
+    def strategy_stats(self) -> list[StrategyStats]:
+        return self._strategy_runner.strategy_stats()
 
     def run(self) -> str:
+        try:
+            return self._run_loop()
+        finally:
+            self._strategy_runner.close()
+            for line in self._strategy_runner.report_lines():
+                self._output(line)
+            cache_stats = getattr(self._board_reader, "cache_stats", None)
+            if cache_stats is not None and cache_stats.tiles:
+                self._output(cache_stats.describe())
+
+    def _run_loop(self) -> str:
         while True:
             refresh_failure = self._refresh_with_retry()
             if refresh_failure is not None:
@@ -160,20 +174,24 @@ class ExternalApp:
             return STOP_REASONS.board_refresh_failed_after_retry
 
     def _next_moves(self, analysis) -> Sequence[Move]:
-        for strategy in self._strategies:
-            if isinstance(strategy, RandomExplorer) and self._has_revealed_zero():
-                continue
+        strategies = self._strategies
+        if any(isinstance(strategy, RandomExplorer) for strategy in strategies) and self._has_revealed_zero():
+            strategies = [
+                strategy for strategy in strategies if not isinstance(strategy, RandomExplorer)
+            ]
 
-            moves = strategy.find_moves(analysis)
-            moves = self._validated_moves(moves)
-            moves = self._conservative_live_batch(moves)
-            if moves:
-                move_count = len(moves)
-                noun = "move" if move_count == 1 else "moves"
-                self._output(f"External: using {strategy.name} with {move_count} {noun}")
-                return moves
+        result = self._strategy_runner.first_result(
+            strategies,
+            analysis,
+            accept=lambda moves: self._conservative_live_batch(self._validated_moves(moves)),
+        )
+        if result is None:
+            return []
 
-        return []
+        move_count = len(result.moves)
+        noun = "move" if move_count == 1 else "moves"
+        self._output(f"External: using {result.strategy.name} with {move_count} {noun}")
+        return result.moves
 
     def _validated_moves(self, moves: Sequence[Move]) -> list[Move]:
         if not moves:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
@@ -8,8 +9,8 @@ from minesweeper.domain.move import Move
 from minesweeper.domain.types import ActionType, TileState
 from minesweeper.domain.tile import Tile
 from minesweeper.domain.types import Coord
-from minesweeper.external.capture import ScreenCapture, ScreenRegion, TileSize
-from minesweeper.external.classifier import TileClassifier
+from minesweeper.external.capture import CaptureFrame, ScreenCapture, ScreenRegion, TileSize, tile_digest
+from minesweeper.external.classifier import BATCH_CLASSIFY_FRACTION, TileClassifier
 from minesweeper.external.debug_capture import dump_capture, dump_move_overlay, write_debug_metadata
 from minesweeper.external.errors import BoardReadError
 from minesweeper.external.grid import TileGrid
@@ -34,7 +35,33 @@ class _TilePixelGrid:
         return self._pixels.getpixel((self._origin_x + x, self._origin_y + y))
 
 
+@dataclass(frozen=True)
+class TileCacheStats:
+    """How many tiles refreshes read from array captures, and how many skipped classification."""
+
+    tiles: int = 0
+    reused: int = 0
+
+    @property
+    def reuse_rate(self) -> float:
+        return self.reused / self.tiles if self.tiles else 0.0
+
+    def describe(self) -> str:
+        return f"Tile cache: reused {self.reused}/{self.tiles} tiles ({self.reuse_rate:.1%})"
+
+
 class ScreenBoardReader:
+    """
+    Reads the board from screen captures through a `TileClassifier`.
+
+    For array captures every tile's pixels are digested, and a tile whose
+    digest matches the previous refresh keeps its previous `Tile` instead of
+    being classified again. When many tiles changed at once the whole board
+    is classified in one `classify_board` pass instead. A new calibration
+    gets a new reader, so the cache never outlives the geometry it was
+    built for.
+    """
+
     def __init__(
         self,
         capture: ScreenCapture,
@@ -64,6 +91,9 @@ class ScreenBoardReader:
         self._latest_board_pixels: Any | None = None
         self._expected_flagged_coords: set[Coord] = set()
         self._expected_revealed_coords: set[Coord] = set()
+        self._tile_cache: dict[Coord, tuple[bytes, Tile]] = {}
+        self._tile_slices: dict[Coord, tuple[slice, slice]] | None = None
+        self._cache_stats = TileCacheStats()
 
     @property
     def width(self) -> int:
@@ -77,6 +107,10 @@ class ScreenBoardReader:
     def num_mines(self) -> int:
         return self._num_mines
 
+    @property
+    def cache_stats(self) -> TileCacheStats:
+        return self._cache_stats
+
     def refresh(self) -> None:
         try:
             board_pixels = self._capture.grab(self._board_region)
@@ -88,19 +122,14 @@ class ScreenBoardReader:
                     warn=self._output,
                 )
                 self._refresh_index += 1
-            tiles: dict[Coord, Tile] = {}
-            for x in range(self._width):
-                for y in range(self._height):
-                    coord = Coord(x, y)
-                    tile_pixels = self._tile_pixels(board_pixels, coord)
-                    tile = self._classifier.classify(tile_pixels, coord)
-                    if tile.state == TileState.HIDDEN and coord in self._expected_flagged_coords:
-                        tile = Tile(coord=coord, state=TileState.FLAGGED, is_mine=False)
-                    elif tile.state != TileState.HIDDEN:
-                        self._expected_revealed_coords.discard(coord)
-                    elif tile.state != TileState.FLAGGED:
-                        self._expected_flagged_coords.discard(coord)
-                    tiles[coord] = tile
+            tiles = self._classify_tiles(board_pixels)
+            for coord, tile in tiles.items():
+                if tile.state == TileState.HIDDEN and coord in self._expected_flagged_coords:
+                    tiles[coord] = Tile(coord=coord, state=TileState.FLAGGED, is_mine=False)
+                elif tile.state != TileState.HIDDEN:
+                    self._expected_revealed_coords.discard(coord)
+                elif tile.state != TileState.FLAGGED:
+                    self._expected_flagged_coords.discard(coord)
         except BoardReadError:
             raise
         except Exception as exc:
@@ -185,22 +214,88 @@ class ScreenBoardReader:
 
         return self._tiles[coord]
 
-    def _tile_pixels(self, board_pixels: Any, coord: Coord) -> _TilePixelGrid:
-        if self._grid is not None:
-            rect = self._grid.tile_rect(coord)
-            return _TilePixelGrid(
-                pixels=board_pixels,
-                origin_x=rect.left - self._board_region.left,
-                origin_y=rect.top - self._board_region.top,
-                width=rect.width,
-                height=rect.height,
+    def _classify_tiles(self, board_pixels: Any) -> dict[Coord, Tile]:
+        if isinstance(board_pixels, CaptureFrame):
+            return self._classify_frame(board_pixels)
+
+        tiles: dict[Coord, Tile] = {}
+        for x in range(self._width):
+            for y in range(self._height):
+                coord = Coord(x, y)
+                tiles[coord] = self._classifier.classify(self._tile_pixels(board_pixels, coord), coord)
+        return tiles
+
+    def _classify_frame(self, frame: CaptureFrame) -> dict[Coord, Tile]:
+        pixels = frame.pixels
+        digests = {
+            coord: tile_digest(pixels[rows, columns])
+            for coord, (rows, columns) in self._frame_tile_slices().items()
+        }
+
+        changed = [
+            coord
+            for coord, digest in digests.items()
+            if coord not in self._tile_cache or self._tile_cache[coord][0] != digest
+        ]
+        # The classifier's memo, if it has one, looks tiles up by the same digests.
+        if len(changed) > len(digests) * BATCH_CLASSIFY_FRACTION:
+            grid = self._board_grid()
+            tiles = self._classifier.classify_board(
+                frame,
+                grid,
+                offset=(grid.origin_left - self._board_region.left, grid.origin_top - self._board_region.top),
+                digests=digests,
             )
+            reused = 0
+        else:
+            tiles = {coord: self._tile_cache[coord][1] for coord in digests}
+            for coord in changed:
+                tile = self._frame_tile(frame, coord)
+                tiles[coord] = self._classifier.classify(tile, coord, digest=digests[coord])
+            reused = len(digests) - len(changed)
+
+        self._tile_cache = {coord: (digest, tiles[coord]) for coord, digest in digests.items()}
+        self._cache_stats = TileCacheStats(
+            tiles=self._cache_stats.tiles + len(digests),
+            reused=self._cache_stats.reused + reused,
+        )
+        return tiles
+
+    def _frame_tile(self, frame: CaptureFrame, coord: Coord) -> Any:
+        rows, columns = self._frame_tile_slices()[coord]
+        return frame.pixels[rows, columns]
+
+    def _frame_tile_slices(self) -> dict[Coord, tuple[slice, slice]]:
+        if self._tile_slices is None:
+            self._tile_slices = {}
+            for x in range(self._width):
+                for y in range(self._height):
+                    rect = self._tile_rect(Coord(x, y))
+                    left = rect.left - self._board_region.left
+                    top = rect.top - self._board_region.top
+                    self._tile_slices[Coord(x, y)] = (slice(top, top + rect.height), slice(left, left + rect.width))
+        return self._tile_slices
+
+    def _board_grid(self) -> TileGrid:
+        if self._grid is not None:
+            return self._grid
+        return TileGrid(
+            origin_left=self._board_region.left,
+            origin_top=self._board_region.top,
+            col_boundaries=tuple(x * self._tile_size.width for x in range(self._width + 1)),
+            row_boundaries=tuple(y * self._tile_size.height for y in range(self._height + 1)),
+        )
+
+    def _tile_pixels(self, board_pixels: Any, coord: Coord) -> _TilePixelGrid:
+        rect = self._tile_rect(coord)
+        origin_x = rect.left - self._board_region.left
+        origin_y = rect.top - self._board_region.top
         return _TilePixelGrid(
             pixels=board_pixels,
-            origin_x=coord.x * self._tile_size.width,
-            origin_y=coord.y * self._tile_size.height,
-            width=self._tile_size.width,
-            height=self._tile_size.height,
+            origin_x=origin_x,
+            origin_y=origin_y,
+            width=rect.width,
+            height=rect.height,
         )
 
     def _tile_rect(self, coord: Coord) -> ScreenRegion:
@@ -5,12 +5,11 @@ import time
 from collections.abc import Callable, Sequence
 
 from minesweeper.ai.analyzer import Analyzer
+from minesweeper.ai.instrumentation import StrategyProfiler, StrategyStats
+from minesweeper.ai.registry import StrategyRegistry
+from minesweeper.ai.runner import StrategyRunner
 from minesweeper.ai.strategy import AIStrategy
-from minesweeper.ai.strategies.constraint_subtractor import ConstraintSubtractor
-from minesweeper.ai.strategies.pattern_detector import PatternDetector
-from minesweeper.ai.strategies.probability_solver import ProbabilitySolver
 from minesweeper.ai.strategies.random_explorer import RandomExplorer
-from minesweeper.ai.strategies.transitive_matcher import TransitiveMatcher
 from minesweeper.domain.move import Move
 from minesweeper.domain.types import Coord, TileState
 from minesweeper.external.browser.bridge.server import BrowserBridgeServer, BridgeError
@@ -28,6 +27,7 @@ class BrowserApp:
         executor: DomMoveExecutor,
         analyzer: Analyzer | None = None,
         strategies: Sequence[AIStrategy] | None = None,
+        strategy_runner: StrategyRunner | None = None,
         startup_wait_ms: int | None = None,
         refresh_poll_interval_ms: int = 250,
         post_move_refresh_retries: int = 8,
@@ -46,15 +46,26 @@ class BrowserApp:
         self._output = output or (lambda _message: None)
         self._rng = random.Random()
         self._snapshot_ready = False
-        self._strategies = list(strategies) if strategies is not None else [
-            RandomExplorer(self._rng),
-            PatternDetector(),
-            ConstraintSubtractor(),
-            TransitiveMatcher(),
-            ProbabilitySolver(),
-        ]
+        self._strategies = (
+            list(strategies)
+            if strategies is not None
+            else StrategyRegistry(self._rng).chain()
+        )
+        self._strategy_runner = strategy_runner or StrategyRunner(profiler=StrategyProfiler())
+
+    @property
+    def strategy_stats(self) -> list[StrategyStats]:
+        return self._strategy_runner.strategy_stats()
 
     def run(self) -> str:
+        try:
+            return self._run_loop()
+        finally:
+            self._strategy_runner.close()
+            for line in self._strategy_runner.report_lines():
+                self._output(line)
+
+    def _run_loop(self) -> str:
         while True:
             refresh_failure = self._refresh_from_bridge(allow_retry=not self._snapshot_ready)
             if refresh_failure is not None:
@@ -136,19 +147,21 @@ class BrowserApp:
         return STOP_REASONS.board_refresh_failed_after_retry
 
     def _next_moves(self, analysis) -> Sequence[Move]:
-        for strategy in self._strategies:
-            if isinstance(strategy, RandomExplorer) and self._has_revealed_zero():
-                continue
-
-            moves = strategy.find_moves(analysis)
-            if moves:
-                self._output(
-                    f"Browser: using {strategy.name} with {len(moves)} move"
-                    f"{'' if len(moves) == 1 else 's'}"
-                )
-                return list(moves)
-
-        return []
+        strategies = self._strategies
+        if any(isinstance(strategy, RandomExplorer) for strategy in strategies) and self._has_revealed_zero():
+            strategies = [
+                strategy for strategy in strategies if not isinstance(strategy, RandomExplorer)
+            ]
+
+        result = self._strategy_runner.first_result(strategies, analysis)
+        if result is None:
+            return []
+
+        self._output(
+            f"Browser: using {result.strategy.name} with {len(result.moves)} move"
+            f"{'' if len(result.moves) == 1 else 's'}"
+        )
+        return list(result.moves)
 
     def _has_revealed_zero(self) -> bool:
         for x in range(self._board_reader.width):
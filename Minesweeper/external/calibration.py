@@ -10,7 +10,7 @@ from pathlib import Path
 from typing import Any, NamedTuple
 
 from minesweeper.domain.types import Coord
-from minesweeper.external.capture import ScreenCapture, ScreenRegion, TileSize
+from minesweeper.external.capture import CaptureFrame, ScreenCapture, ScreenRegion, TileSize, pixel_array
 from minesweeper.external.classifier import (
     ColorProfiles,
     average_color,
@@ -112,24 +112,27 @@ def _tile_pixels(
     coord: Coord,
     tile_size: TileSize | None = None,
     grid: TileGrid | None = None,
-) -> _TilePixelGrid:
+) -> Any:
     if grid is not None:
         rect = grid.tile_rect(coord)
-        return _TilePixelGrid(
-            pixels=pixels,
-            origin_x=rect.left - grid.origin_left,
-            origin_y=rect.top - grid.origin_top,
-            width=rect.width,
-            height=rect.height,
-        )
-    if tile_size is None:
+        origin_x = rect.left - grid.origin_left
+        origin_y = rect.top - grid.origin_top
+        width, height = rect.width, rect.height
+    elif tile_size is None:
         raise ValueError("tile_size is required when grid is not provided")
+    else:
+        origin_x = coord.x * tile_size.width
+        origin_y = coord.y * tile_size.height
+        width, height = tile_size
+
+    if isinstance(pixels, CaptureFrame):
+        return pixels.crop(origin_x, origin_y, width, height)
     return _TilePixelGrid(
         pixels=pixels,
-        origin_x=coord.x * tile_size.width,
-        origin_y=coord.y * tile_size.height,
-        width=tile_size.width,
-        height=tile_size.height,
+        origin_x=origin_x,
+        origin_y=origin_y,
+        width=width,
+        height=height,
     )
 
 
@@ -158,7 +161,10 @@ def _changed_tiles(
     return changed
 
 
-def _tile_signature(tile_pixels: _TilePixelGrid) -> tuple[Any, ...]:
+def _tile_signature(tile_pixels: Any) -> tuple[Any, ...] | bytes:
+    array = pixel_array(tile_pixels)
+    if array is not None:
+        return array.tobytes()
     width, height = tile_pixels.size
     return tuple(
         tile_pixels.getpixel((x, y))
@@ -1,15 +1,27 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import threading
+from collections.abc import Mapping
+from importlib import import_module
 from math import sqrt
+from pathlib import Path
 from typing import Any, NamedTuple
 
 from minesweeper.domain.tile import Tile
 from minesweeper.domain.types import Coord, TileState
+from minesweeper.external.capture import pixel_array, tile_digest
 from minesweeper.external.errors import BoardReadError
+from minesweeper.external.grid import TileGrid
 
 Color = tuple[int, int, int]
 PixelGrid = Any
 
+# Share of tiles needing classification above which one pass over the
+# whole board beats classifying them one by one.
+BATCH_CLASSIFY_FRACTION = 0.1
+
 
 class ColorProfiles(NamedTuple):
     hidden_bg: Color
@@ -45,8 +57,22 @@ def average_color(colors: list[Color]) -> Color:
     return tuple(sum(color[channel] for color in colors) // count for channel in range(3))  # type: ignore[return-value]
 
 
+def _mean_color(totals: Any, count: int) -> Color:
+    red, green, blue = (int(total) // count for total in totals)
+    return red, green, blue
+
+
+def _pixel_size(pixels: PixelGrid, array: Any | None) -> tuple[int, int]:
+    if array is None:
+        width, height = pixels.size
+    else:
+        height, width = array.shape[:2]
+    return int(width), int(height)
+
+
 def sample_background(pixels: PixelGrid, inset: int = 1) -> Color:
-    width, height = pixels.size
+    array = pixel_array(pixels)
+    width, height = _pixel_size(pixels, array)
     if width >= 8 and height >= 8 and width > inset * 2 + 1 and height > inset * 2 + 1:
         x_min = inset
         x_max = width - inset - 1
@@ -57,6 +83,12 @@ def sample_background(pixels: PixelGrid, inset: int = 1) -> Color:
         x_max = width - 1
         y_min = 0
         y_max = height - 1
+    if array is not None:
+        outer = array[y_min:y_max + 1, x_min:x_max + 1]
+        inner = array[y_min + 1:y_max, x_min + 1:x_max]
+        totals = outer.sum(axis=(0, 1), dtype="int64") - inner.sum(axis=(0, 1), dtype="int64")
+        count = outer.shape[0] * outer.shape[1] - inner.shape[0] * inner.shape[1]
+        return _mean_color(totals, count)
     colors = [
         pixels.getpixel((x, y))
         for y in range(y_min, y_max + 1)
@@ -67,9 +99,16 @@ def sample_background(pixels: PixelGrid, inset: int = 1) -> Color:
 
 
 def sample_center(pixels: PixelGrid, patch_radius: int = 1) -> Color:
-    width, height = pixels.size
+    array = pixel_array(pixels)
+    width, height = _pixel_size(pixels, array)
     center_x = width // 2
     center_y = height // 2
+    if array is not None:
+        patch = array[
+            max(0, center_y - patch_radius):center_y + patch_radius + 1,
+            max(0, center_x - patch_radius):center_x + patch_radius + 1,
+        ]
+        return _mean_color(patch.sum(axis=(0, 1), dtype="int64"), patch.shape[0] * patch.shape[1])
     colors = [
         pixels.getpixel((x, y))
         for y in range(center_y - patch_radius, center_y + patch_radius + 1)
@@ -85,9 +124,12 @@ def sample_accent(
     relative_threshold: float = 0.75,
     min_chroma: int = 35,
 ) -> Color | None:
-    width, height = pixels.size
+    array = pixel_array(pixels)
+    width, height = _pixel_size(pixels, array)
     if width <= 2 or height <= 2:
         return None
+    if array is not None:
+        return _sample_accent_array(array, background, min_distance, relative_threshold, min_chroma)
 
     candidates: list[tuple[float, Color]] = []
     for y in range(1, height - 1):
@@ -114,10 +156,357 @@ def sample_accent(
     return average_color(selected)
 
 
+def _sample_accent_array(
+    array: Any,
+    background: Color,
+    min_distance: float,
+    relative_threshold: float,
+    min_chroma: int,
+) -> Color | None:
+    interior = array[1:-1, 1:-1].astype("int32")
+    delta = interior - background
+    distances = (delta * delta).sum(axis=2).astype("float64") ** 0.5
+    chroma = interior.max(axis=2) - interior.min(axis=2)
+    candidates = (distances >= min_distance) & (chroma >= min_chroma)
+    if not candidates.any():
+        return None
+
+    candidate_distances = distances[candidates]
+    strongest = candidate_distances.max()
+    selected = interior[candidates][candidate_distances >= strongest * relative_threshold]
+    if not len(selected):
+        return None
+    return _mean_color(selected.sum(axis=0), len(selected))
+
+
 def _color_chroma(color: Color) -> int:
     return max(color) - min(color)
 
 
+class BoardSamples(NamedTuple):
+    """Per-tile samples for a whole board, indexed `[row][column]`."""
+
+    centers: list[list[Color]]
+    backgrounds: list[list[Color]]
+    accents: list[list[Color | None]]
+
+
+def _load_numpy() -> Any | None:
+    try:
+        return import_module("numpy")
+    except ImportError:
+        return None
+
+
+def sample_board(
+    pixels: PixelGrid,
+    grid: TileGrid,
+    offset: tuple[int, int] = (0, 0),
+    inset: int = 1,
+    patch_radius: int = 1,
+    min_distance: float = 30.0,
+    relative_threshold: float = 0.75,
+    min_chroma: int = 35,
+) -> BoardSamples:
+    """
+    `sample_center`, `sample_background` and `sample_accent` for every tile at once.
+
+    `pixels` is a capture frame or RGB array holding the whole board; tile
+    `(x, y)` starts at `offset` plus the grid boundaries. Borders are summed
+    from prefix sums over only the rows and columns they lie on, and accent
+    colour maths only runs on interior pixels saturated enough to qualify,
+    so the cost barely depends on tile size. Boards with tiles narrower than
+    the centre patch are sampled tile by tile, since clipping the patch to
+    such a tile would count its edge pixels twice.
+    """
+    array = pixel_array(pixels)
+    numpy = _load_numpy()
+    if array is None or numpy is None:
+        raise ValueError("sample_board needs a capture frame or an RGB array")
+
+    columns = numpy.asarray(grid.col_boundaries) + offset[0]
+    rows = numpy.asarray(grid.row_boundaries) + offset[1]
+    lefts, rights = columns[:-1][None, :], columns[1:][None, :]
+    tops, bottoms = rows[:-1][:, None], rows[1:][:, None]
+    widths, heights = rights - lefts, bottoms - tops
+    if min(int(widths.min()), int(heights.min())) < 2 * patch_radius + 1:
+        return _sample_tiles(array, grid, offset, inset, patch_radius, min_distance, relative_threshold, min_chroma)
+
+    center_x = lefts + widths // 2
+    center_y = tops + heights // 2
+    spread = numpy.arange(-patch_radius, patch_radius + 1)
+    patch = array[
+        (center_y[:, :, None, None] + spread[:, None]).clip(tops[:, :, None, None], bottoms[:, :, None, None] - 1),
+        (center_x[:, :, None, None] + spread).clip(lefts[:, :, None, None], rights[:, :, None, None] - 1),
+    ]
+    patch_size = patch.shape[2] * patch.shape[3]
+    centers = patch.sum(axis=(2, 3), dtype="int64") // patch_size
+
+    use_inset = (widths >= 8) & (heights >= 8) & (widths > inset * 2 + 1) & (heights > inset * 2 + 1)
+    margin = numpy.where(use_inset, inset, 0)
+    x_min, x_max = lefts + margin, rights - 1 - margin
+    y_min, y_max = tops + margin, bottoms - 1 - margin
+    totals = (
+        _row_segment_sums(numpy, array, y_min, x_min, x_max)
+        + numpy.where((y_max > y_min)[:, :, None], _row_segment_sums(numpy, array, y_max, x_min, x_max), 0)
+        + _column_segment_sums(numpy, array, x_min, y_min + 1, y_max - 1)
+        + numpy.where((x_max > x_min)[:, :, None], _column_segment_sums(numpy, array, x_max, y_min + 1, y_max - 1), 0)
+    )
+    ring_size = (x_max - x_min + 1) * (1 + (y_max > y_min)) + (y_max - y_min - 1).clip(0) * (1 + (x_max > x_min))
+    backgrounds = totals // ring_size[:, :, None]
+
+    board_width, board_height = widths.shape[1], heights.shape[0]
+    tile_count = board_width * board_height
+    tile_of_x, inner_x = _axis_tiles(numpy, columns, array.shape[1])
+    tile_of_y, inner_y = _axis_tiles(numpy, rows, array.shape[0])
+    red, green, blue = array[:, :, 0], array[:, :, 1], array[:, :, 2]
+    chroma = numpy.maximum(numpy.maximum(red, green), blue) - numpy.minimum(numpy.minimum(red, green), blue)
+    candidates = numpy.flatnonzero((chroma >= min_chroma) & inner_y[:, None] & inner_x[None, :])
+    ys, xs = numpy.divmod(candidates, array.shape[1])
+    tiles = tile_of_y[ys] * board_width + tile_of_x[xs]
+    colors = array[ys, xs].astype("int64")
+    delta = colors - backgrounds.reshape(-1, 3)[tiles]
+    distances = numpy.sqrt((delta * delta).sum(axis=1))
+    keep = distances >= min_distance
+    tiles, colors, distances = tiles[keep], colors[keep], distances[keep]
+
+    strongest = numpy.zeros(tile_count)
+    if len(tiles):
+        order = numpy.argsort(tiles, kind="stable")
+        grouped = tiles[order]
+        starts = numpy.flatnonzero(numpy.diff(grouped, prepend=-1))
+        strongest[grouped[starts]] = numpy.maximum.reduceat(distances[order], starts)
+    selected = distances >= strongest[tiles] * relative_threshold
+    tiles, colors = tiles[selected], colors[selected]
+    accent_counts = numpy.bincount(tiles, minlength=tile_count)
+    accent_totals = numpy.stack(
+        [numpy.bincount(tiles, weights=colors[:, channel], minlength=tile_count) for channel in range(3)],
+        axis=1,
+    ).astype("int64")
+
+    accent_means = (accent_totals // accent_counts.clip(1)[:, None]).tolist()
+    has_accent = (accent_counts > 0).tolist()
+    accents = [
+        [
+            tuple(accent_means[index]) if has_accent[index] else None
+            for index in range(row * board_width, (row + 1) * board_width)
+        ]
+        for row in range(board_height)
+    ]
+    return BoardSamples(
+        centers=[[tuple(color) for color in row] for row in centers.tolist()],
+        backgrounds=[[tuple(color) for color in row] for row in backgrounds.tolist()],
+        accents=accents,
+    )
+
+
+def _sample_tiles(
+    array: Any,
+    grid: TileGrid,
+    offset: tuple[int, int],
+    inset: int,
+    patch_radius: int,
+    min_distance: float,
+    relative_threshold: float,
+    min_chroma: int,
+) -> BoardSamples:
+    """`sample_board` through the per-tile samplers."""
+    slices = _grid_tile_slices(grid, offset)
+    centers: list[list[Color]] = []
+    backgrounds: list[list[Color]] = []
+    accents: list[list[Color | None]] = []
+    for y in range(grid.height):
+        centers.append([])
+        backgrounds.append([])
+        accents.append([])
+        for x in range(grid.width):
+            rows, columns = slices[Coord(x, y)]
+            tile = array[rows, columns]
+            background = sample_background(tile, inset)
+            centers[y].append(sample_center(tile, patch_radius))
+            backgrounds[y].append(background)
+            accents[y].append(sample_accent(tile, background, min_distance, relative_threshold, min_chroma))
+    return BoardSamples(centers=centers, backgrounds=backgrounds, accents=accents)
+
+
+def _row_segment_sums(numpy: Any, array: Any, ys: Any, x_min: Any, x_max: Any) -> Any:
+    """Sum of row `ys` from `x_min` to `x_max` inclusive, per tile."""
+    needed, index = numpy.unique(ys, return_inverse=True)
+    prefix = numpy.zeros((len(needed), array.shape[1] + 1, 3), dtype="int64")
+    prefix[:, 1:] = array[needed].cumsum(axis=1, dtype="int64")
+    index = index.reshape(ys.shape)
+    return prefix[index, x_max + 1] - prefix[index, x_min]
+
+
+def _column_segment_sums(numpy: Any, array: Any, xs: Any, y_min: Any, y_max: Any) -> Any:
+    """Sum of column `xs` from `y_min` to `y_max` inclusive (zero when empty), per tile."""
+    needed, index = numpy.unique(xs, return_inverse=True)
+    prefix = numpy.zeros((array.shape[0] + 1, len(needed), 3), dtype="int64")
+    prefix[1:] = array[:, needed].cumsum(axis=0, dtype="int64")
+    index = index.reshape(xs.shape)
+    y_end = numpy.maximum(y_max + 1, y_min)
+    return prefix[y_end, index] - prefix[y_min, index]
+
+
+def _grid_tile_slices(grid: TileGrid, offset: tuple[int, int]) -> dict[Coord, tuple[slice, slice]]:
+    """Row and column slices of every tile in a board array, as laid out for `sample_board`."""
+    columns = [boundary + offset[0] for boundary in grid.col_boundaries]
+    rows = [boundary + offset[1] for boundary in grid.row_boundaries]
+    return {
+        Coord(x, y): (slice(rows[y], rows[y + 1]), slice(columns[x], columns[x + 1]))
+        for x in range(grid.width)
+        for y in range(grid.height)
+    }
+
+
+def _axis_tiles(numpy: Any, boundaries: Any, span: int) -> tuple[Any, Any]:
+    """Tile index of every pixel along one axis, and whether it is off the tile's edge rows."""
+    positions = numpy.arange(span)
+    tile = numpy.searchsorted(boundaries, positions, side="right") - 1
+    inside = (positions >= boundaries[0]) & (positions < boundaries[-1])
+    tile = tile.clip(0, len(boundaries) - 2)
+    inner = inside & (positions != boundaries[tile]) & (positions != boundaries[tile + 1] - 1)
+    return tile, inner
+
+
+class ClassificationMemo:
+    """
+    Classified (state, adjacent mines) by tile-pixel digest.
+
+    On one site and zoom level every tile in the same visual state is
+    pixel-identical, so after a few refreshes nearly every tile is a dict
+    lookup. Decisions only hold for the colour profiles and thresholds
+    that made them: every call names that fingerprint, and a different
+    one clears the memo before it is used, so a classifier never reads a
+    decision made under other profiles. Like the solver memos it is
+    cleared entirely once it holds `MEMO_LIMIT` entries.
+
+    With a `directory` the memo is persisted per calibration: `bind` loads
+    the file for the fingerprint if there is one, and `save` writes it.
+    """
+
+    MEMO_LIMIT = 4096
+
+    def __init__(self, directory: Path | None = None, limit: int = MEMO_LIMIT) -> None:
+        if limit < 1:
+            raise ValueError(f"limit ({limit}) must be at least 1")
+        self._directory = directory
+        self._limit = limit
+        self._lock = threading.Lock()
+        self._fingerprint: str | None = None
+        self._entries: dict[bytes, tuple[TileState, int]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def fingerprint(self) -> str | None:
+        return self._fingerprint
+
+    @property
+    def path(self) -> Path | None:
+        """The file this memo is persisted to under its current fingerprint."""
+        if self._directory is None or self._fingerprint is None:
+            return None
+        name = hashlib.sha1(self._fingerprint.encode("utf-8"), usedforsecurity=False).hexdigest()[:16]
+        return self._directory / f"{name}.json"
+
+    def bind(self, fingerprint: str) -> None:
+        with self._lock:
+            self._bind(fingerprint)
+
+    def get(self, fingerprint: str, digest: bytes) -> tuple[TileState, int] | None:
+        with self._lock:
+            self._bind(fingerprint)
+            decision = self._entries.get(digest)
+            if decision is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return decision
+
+    def get_many(self, fingerprint: str, digests: Mapping[Coord, bytes]) -> dict[Coord, tuple[TileState, int]]:
+        """The known decisions for a board of `digests`, taking the lock once."""
+        with self._lock:
+            self._bind(fingerprint)
+            known = {coord: self._entries[digest] for coord, digest in digests.items() if digest in self._entries}
+            self.hits += len(known)
+            self.misses += len(digests) - len(known)
+            return known
+
+    def put(self, fingerprint: str, digest: bytes, decision: tuple[TileState, int]) -> None:
+        with self._lock:
+            self._bind(fingerprint)
+            if len(self._entries) >= self._limit:
+                self._entries.clear()
+            self._entries[digest] = decision
+
+    def to_json(self) -> str:
+        with self._lock:
+            return self._to_json()
+
+    @classmethod
+    def from_json(cls, text: str, directory: Path | None = None) -> ClassificationMemo:
+        payload = json.loads(text)
+        memo = cls(directory)
+        memo._fingerprint = payload["fingerprint"]
+        memo._entries = {
+            bytes.fromhex(digest): (TileState[state], int(number))
+            for digest, (state, number) in payload["entries"].items()
+        }
+        return memo
+
+    def save(self, path: Path | None = None) -> None:
+        """Write the memo to `path`, or to its own `path` when it has a directory."""
+        with self._lock:
+            self._save(path or self.path)
+
+    @classmethod
+    def load(cls, path: Path) -> ClassificationMemo:
+        return cls.from_json(path.read_text(encoding="utf-8"))
+
+    def _bind(self, fingerprint: str) -> None:
+        if fingerprint == self._fingerprint:
+            return
+        # Keep what was learned under the old fingerprint before dropping it.
+        if self._entries:
+            self._save(self.path)
+        self._fingerprint = fingerprint
+        self._entries = self._load_entries()
+
+    def _to_json(self) -> str:
+        return json.dumps(
+            {
+                "fingerprint": self._fingerprint,
+                "entries": {
+                    digest.hex(): [state.name, number]
+                    for digest, (state, number) in self._entries.items()
+                },
+            },
+            separators=(",", ":"),
+        )
+
+    def _save(self, path: Path | None) -> None:
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(self._to_json(), encoding="utf-8")
+
+    def _load_entries(self) -> dict[bytes, tuple[TileState, int]]:
+        path = self.path
+        if path is None or not path.exists():
+            return {}
+        try:
+            stored = ClassificationMemo.from_json(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+        if stored._fingerprint != self._fingerprint or len(stored) > self._limit:
+            return {}
+        return stored._entries
+
+
 class TileClassifier:
     def __init__(
         self,
@@ -126,6 +515,7 @@ class TileClassifier:
         center_threshold: float = 20.0,
         number_threshold: float = 80.0,
         flag_threshold: float = 70.0,
+        memo: ClassificationMemo | None = None,
     ) -> None:
         self._profiles = profiles
         self._background_threshold = background_threshold
@@ -133,13 +523,118 @@ class TileClassifier:
         self._number_threshold = number_threshold
         self._flag_threshold = flag_threshold
         self._last_tiles: dict[Coord, Tile] = {}
-
-    def classify(self, pixels: PixelGrid, coord: Coord) -> Tile:
+        self._memo = memo
+        self._fingerprint = json.dumps(
+            {
+                "profiles": profiles._asdict(),
+                "thresholds": [background_threshold, center_threshold, number_threshold, flag_threshold],
+            },
+            sort_keys=True,
+        )
+        if memo is not None:
+            memo.bind(self._fingerprint)
+
+    @property
+    def memo(self) -> ClassificationMemo | None:
+        return self._memo
+
+    def classify(self, pixels: PixelGrid, coord: Coord, digest: bytes | None = None) -> Tile:
+        """
+        Classify one tile.
+
+        With a memo, array tiles are looked up by `digest` (computed with
+        `tile_digest` when not given) before any colour sampling.
+        """
+        if self._memo is not None and digest is None:
+            array = pixel_array(pixels)
+            if array is not None:
+                digest = tile_digest(array)
+        if self._memo is not None and digest is not None:
+            decision = self._memo.get(self._fingerprint, digest)
+            if decision is None:
+                decision = self._classify_pixels(pixels, coord)
+                self._memo.put(self._fingerprint, digest, decision)
+        else:
+            decision = self._classify_pixels(pixels, coord)
+        state, number = decision
+        return self._remember(Tile(coord=coord, state=state, is_mine=False, adjacent_mines=number))
+
+    def classify_board(
+        self,
+        pixels: PixelGrid,
+        grid: TileGrid,
+        offset: tuple[int, int] = (0, 0),
+        digests: Mapping[Coord, bytes] | None = None,
+    ) -> dict[Coord, Tile]:
+        """
+        Classify every tile of a captured board in one pass.
+
+        Takes the same decisions as `classify` on each tile, but samples
+        the whole board with `sample_board`. Tiles with identical samples
+        (every hidden tile, say) share one decision. With a memo, tiles
+        are first looked up by digest (`digests`, or computed here); the
+        board is only sampled when more than `BATCH_CLASSIFY_FRACTION` of
+        them are unknown, and the rest are classified one by one.
+        """
+        known: dict[Coord, tuple[TileState, int]] = {}
+        if self._memo is not None:
+            array = pixel_array(pixels)
+            if digests is None and array is not None:
+                digests = {
+                    coord: tile_digest(array[rows, columns])
+                    for coord, (rows, columns) in _grid_tile_slices(grid, offset).items()
+                }
+            if digests:
+                known = self._memo.get_many(self._fingerprint, digests)
+
+            tile_count = grid.width * grid.height
+            if digests and array is not None and tile_count - len(known) <= tile_count * BATCH_CLASSIFY_FRACTION:
+                if len(known) < tile_count:
+                    for coord, (rows, columns) in _grid_tile_slices(grid, offset).items():
+                        if coord not in known:
+                            known[coord] = self._classify_pixels(array[rows, columns], coord)
+                            if coord in digests:
+                                self._memo.put(self._fingerprint, digests[coord], known[coord])
+                tiles = {
+                    coord: Tile(coord=coord, state=state, is_mine=False, adjacent_mines=number)
+                    for coord, (state, number) in known.items()
+                }
+                self._last_tiles.update(tiles)
+                return tiles
+
+        samples = sample_board(pixels, grid, offset)
+        decisions: dict[tuple[Color, Color, Color | None], tuple[TileState, int]] = {}
+        tiles = {}
+        for x in range(grid.width):
+            for y in range(grid.height):
+                coord = Coord(x, y)
+                decision = known.get(coord)
+                if decision is None:
+                    key = (samples.centers[y][x], samples.backgrounds[y][x], samples.accents[y][x])
+                    decision = decisions.get(key)
+                    if decision is None:
+                        decision = decisions[key] = self._classify_samples(*key, coord)
+                    if self._memo is not None and digests and coord in digests:
+                        self._memo.put(self._fingerprint, digests[coord], decision)
+                tiles[coord] = Tile(coord=coord, state=decision[0], is_mine=False, adjacent_mines=decision[1])
+        self._last_tiles.update(tiles)
+        return tiles
+
+    def _classify_pixels(self, pixels: PixelGrid, coord: Coord) -> tuple[TileState, int]:
         center = sample_center(pixels)
         background = sample_background(pixels)
         accent = sample_accent(pixels, background)
+        return self._classify_samples(center, background, accent, coord)
+
+    def _classify_samples(
+        self,
+        center: Color,
+        background: Color,
+        accent: Color | None,
+        coord: Coord,
+    ) -> tuple[TileState, int]:
         if self._looks_flagged(accent):
-            return self._remember(Tile(coord=coord, state=TileState.FLAGGED, is_mine=False))
+            return TileState.FLAGGED, 0
 
         state = self._match_center_state(center)
         if state is None:
@@ -151,21 +646,9 @@ class TileClassifier:
                 raise BoardReadError(f"untrusted tile background at {coord}")
             state = fallback_state
 
-        if state == TileState.HIDDEN:
-            return self._remember(Tile(coord=coord, state=TileState.HIDDEN, is_mine=False))
-
-        if state == TileState.FLAGGED:
-            return self._remember(Tile(coord=coord, state=TileState.FLAGGED, is_mine=False))
-
-        if accent is None:
-            return self._remember(
-                Tile(coord=coord, state=TileState.REVEALED, is_mine=False, adjacent_mines=0)
-            )
-
-        number = self._match_number(accent)
-        return self._remember(
-            Tile(coord=coord, state=TileState.REVEALED, is_mine=False, adjacent_mines=number)
-        )
+        if state in {TileState.HIDDEN, TileState.FLAGGED} or accent is None:
+            return state, 0
+        return TileState.REVEALED, self._match_number(accent)
 
     def verify_number(self, coord: Coord, expected: int) -> bool:
         tile = self._last_tiles.get(coord)
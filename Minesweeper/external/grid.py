@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from typing import Any
 
 from minesweeper.domain.types import Coord
-from minesweeper.external.capture import ScreenRegion
+from minesweeper.external.capture import ScreenRegion, pixel_array
 
 PixelGrid = Any
 SITE_MIN_PITCH = 23
@@ -144,6 +144,11 @@ def _scan_offsets(pixels: PixelGrid, axis: str) -> list[int]:
 
 
 def _line_profile(pixels: PixelGrid, axis: str, offset: int) -> list[tuple[int, int, int]]:
+    array = pixel_array(pixels)
+    if array is not None and axis in {"x", "y"}:
+        line = array[offset] if axis == "x" else array[:, offset]
+        return [tuple(color) for color in line.tolist()]
+
     width, height = pixels.size
     if axis == "x":
         return [pixels.getpixel((x, offset)) for x in range(width)]
@@ -161,6 +166,17 @@ def _site_edge_peaks(pixels: PixelGrid, axis: str) -> list[int]:
 
 
 def _site_edge_scores(pixels: PixelGrid, axis: str) -> list[int]:
+    array = pixel_array(pixels)
+    if array is not None and axis in {"x", "y"}:
+        brightness = array.sum(axis=2, dtype="int32")
+        if axis == "x":
+            deltas = brightness[:, 1:] - brightness[:, :-1]
+        else:
+            deltas = brightness[1:, :] - brightness[:-1, :]
+        edges = abs(deltas) // 3 >= SITE_EDGE_DIFF
+        counts: list[int] = edges.sum(axis=0 if axis == "x" else 1).tolist()
+        return counts
+
     width, height = pixels.size
     scores: list[int] = []
     if axis == "x":
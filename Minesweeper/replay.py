@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Sequence
+from pathlib import Path
+
+import pygame
+
+from minesweeper.domain.board import BoardView
+from minesweeper.domain.types import GameConfig, GameMode, GamePhase
+from minesweeper.engine.replay import KEYFRAME_INTERVAL, GameReplay, RecordedGame, load_recordings
+from minesweeper.ui.renderer import PygameRenderer
+
+SPEEDS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 2048, 4096)
+DEFAULT_SPEED = 8
+
+
+class _ReplayRenderer(PygameRenderer):
+    """
+    The game renderer with the replay position and speed in the header.
+
+    The position travels in the mode name, which the renderer already
+    watches for header changes; the speed label is set directly.
+    """
+
+    speed_label = ""
+
+    def _header_labels(
+        self,
+        board: BoardView,
+        win_rate: float,
+        mode: GameMode,
+        ai_active: bool,
+    ) -> tuple[str, str, str]:
+        return (f"Mines {self._remaining_mines(board)}", mode.name, self.speed_label)
+
+
+class ReplayViewer:
+    """
+    Plays recorded games in the pygame window at an adjustable speed.
+
+    Space pauses, `,` and `.` step one move, `[` and `]` halve or double
+    the speed, Home/End jump to either end, PageUp/PageDown jump one
+    keyframe interval and the digit keys jump to that tenth of the game.
+    `N` and `P` switch recordings. Arrow keys, `+`/`-` and the mouse wheel
+    move the viewport as in a live game.
+    """
+
+    IDLE_WAIT_MS = 500
+
+    def __init__(
+        self,
+        recordings: Sequence[RecordedGame],
+        game_index: int = 0,
+        start_move: int = 0,
+        speed: int = DEFAULT_SPEED,
+        max_fps: int = 60,
+    ) -> None:
+        if not recordings:
+            raise ValueError("there are no recorded games to replay")
+        if not 0 <= game_index < len(recordings):
+            raise ValueError(f"game index {game_index} is outside 0..{len(recordings) - 1}")
+        if max_fps < 1:
+            raise ValueError(f"max_fps ({max_fps}) must be at least 1")
+
+        self._recordings = list(recordings)
+        self._replays: dict[int, GameReplay] = {}
+        self._speed_index = min(range(len(SPEEDS)), key=lambda index: abs(SPEEDS[index] - speed))
+        self._frame_ms = 1000 // max_fps
+        self._playing = True
+        self._running = True
+        self._carry_ms = 0.0
+        self._renderer: _ReplayRenderer | None = None
+        self._game_index = game_index
+        self._open(game_index)
+        self.replay.seek(start_move)
+
+    @property
+    def replay(self) -> GameReplay:
+        return self._replays[self._game_index]
+
+    @property
+    def speed(self) -> int:
+        """Moves per second while playing."""
+        return SPEEDS[self._speed_index]
+
+    @property
+    def playing(self) -> bool:
+        return self._playing
+
+    def run(self) -> None:
+        last = _monotonic_ms()
+        needs_render = True
+        while self._running:
+            if needs_render:
+                timeout = 0
+            elif self._playing:
+                timeout = self._frame_ms
+            else:
+                timeout = self.IDLE_WAIT_MS
+
+            for event in self._wait_for_events(timeout):
+                if event.type == pygame.QUIT:
+                    self._running = False
+                elif event.type == pygame.KEYDOWN:
+                    self.handle_key(event.key)
+                    needs_render = True
+                elif event.type == pygame.MOUSEWHEEL and event.y:
+                    self._view.zoom(1 if event.y > 0 else -1)
+                    needs_render = True
+                elif event.type in {pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED}:
+                    self._view.invalidate()
+                    needs_render = True
+
+            now = _monotonic_ms()
+            if self.advance(now - last):
+                needs_render = True
+            last = now
+
+            if needs_render and self._running:
+                self._render()
+                needs_render = False
+
+        pygame.quit()
+
+    def advance(self, elapsed_ms: float) -> bool:
+        """Play the moves due after `elapsed_ms`; returns whether any were applied."""
+        if not self._playing:
+            self._carry_ms = 0.0
+            return False
+
+        self._carry_ms += elapsed_ms
+        due = int(self._carry_ms * self.speed / 1000)
+        if due == 0:
+            return False
+
+        self._carry_ms -= due * 1000 / self.speed
+        self.replay.step(due)
+        if self.replay.position >= self.replay.length:
+            self._playing = False
+        return True
+
+    def handle_key(self, key: int) -> None:
+        replay = self.replay
+        if key == pygame.K_SPACE:
+            if not self._playing and replay.position >= replay.length:
+                replay.seek(0)
+            self._playing = not self._playing
+        elif key == pygame.K_PERIOD:
+            self._playing = False
+            replay.step(1)
+        elif key == pygame.K_COMMA:
+            self._playing = False
+            replay.step(-1)
+        elif key == pygame.K_RIGHTBRACKET:
+            self._speed_index = min(self._speed_index + 1, len(SPEEDS) - 1)
+        elif key == pygame.K_LEFTBRACKET:
+            self._speed_index = max(self._speed_index - 1, 0)
+        elif key == pygame.K_HOME:
+            replay.seek(0)
+        elif key == pygame.K_END:
+            replay.seek(replay.length)
+        elif key == pygame.K_PAGEUP:
+            replay.step(-KEYFRAME_INTERVAL)
+        elif key == pygame.K_PAGEDOWN:
+            replay.step(KEYFRAME_INTERVAL)
+        elif pygame.K_0 <= key <= pygame.K_9:
+            replay.seek(replay.length * (key - pygame.K_0) // 10)
+        elif key == pygame.K_n:
+            self._open((self._game_index + 1) % len(self._recordings))
+        elif key == pygame.K_p:
+            self._open((self._game_index - 1) % len(self._recordings))
+        elif key in {pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN}:
+            self._view.scroll(
+                (key == pygame.K_RIGHT) - (key == pygame.K_LEFT),
+                (key == pygame.K_DOWN) - (key == pygame.K_UP),
+            )
+        elif key in {pygame.K_PLUS, pygame.K_EQUALS, pygame.K_KP_PLUS}:
+            self._view.zoom(1)
+        elif key in {pygame.K_MINUS, pygame.K_KP_MINUS}:
+            self._view.zoom(-1)
+
+    def status(self) -> tuple[str, str]:
+        replay = self.replay
+        label = replay.recording.label or f"game {self._game_index + 1}"
+        if replay.phase in {GamePhase.WON, GamePhase.LOST} and replay.position >= replay.length:
+            label = f"{label} ({replay.phase.name.lower()})"
+        state = f"{self.speed} moves/s" if self._playing else "paused"
+        return (f"{label} • move {replay.position}/{replay.length}", state)
+
+    @property
+    def _view(self) -> _ReplayRenderer:
+        assert self._renderer is not None
+        return self._renderer
+
+    def _open(self, game_index: int) -> None:
+        recording = self._recordings[game_index]
+        if game_index not in self._replays:
+            self._replays[game_index] = GameReplay(recording)
+        previous = self._recordings[self._game_index].config
+        if self._renderer is None or previous != recording.config:
+            self._renderer = _ReplayRenderer(recording.config)
+        else:
+            self._renderer.invalidate()
+        self._game_index = game_index
+        self._carry_ms = 0.0
+
+    def _render(self) -> None:
+        position, speed = self.status()
+        if speed != self._view.speed_label:
+            self._view.speed_label = speed
+            self._view.invalidate()
+        mode = GameMode(position, player_input=False, ai_enabled=False)
+        self._view.render(self.replay.board, 0.0, mode, False)
+        pygame.display.set_caption(f"Minesweeper Replay - {position} - {speed}")
+
+    def _wait_for_events(self, timeout_ms: int) -> list[pygame.event.Event]:
+        events = pygame.event.get()
+        if not events and timeout_ms > 0:
+            first = pygame.event.wait(timeout_ms)
+            if first.type != pygame.NOEVENT:
+                events = [first, *pygame.event.get()]
+        return events
+
+
+def _monotonic_ms() -> float:
+    return time.monotonic() * 1000
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m minesweeper.replay",
+        description="Replay recorded games, e.g. from `python -m minesweeper.bench tournament --record-losses`",
+    )
+    parser.add_argument("recordings", type=Path, help="JSON Lines file with one recorded game per line")
+    parser.add_argument("--game", type=int, default=1, help="Start with this game (1-based)")
+    parser.add_argument("--move", type=int, default=0, help="Start at this move")
+    parser.add_argument(
+        "--speed",
+        type=int,
+        default=DEFAULT_SPEED,
+        help=f"Moves per second, rounded to the nearest of {SPEEDS[0]}..{SPEEDS[-1]}",
+    )
+    parser.add_argument("--max-fps", type=int, default=GameConfig().max_fps, help="Render at most this often")
+    parser.add_argument("--list", action="store_true", help="List the recorded games and exit")
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(list(argv) if argv is not None else None)
+    try:
+        recordings = load_recordings(args.recordings)
+    except (OSError, ValueError) as exc:
+        parser.error(f"could not load {args.recordings}: {exc}")
+
+    if args.list:
+        for number, recording in enumerate(recordings, start=1):
+            print(
+                f"{number}: {recording.label or 'unlabelled'} "
+                f"({recording.width}x{recording.height}, {recording.num_mines} mines, "
+                f"seed {recording.seed}, {len(recording.moves)} moves)"
+            )
+        return 0
+
+    try:
+        viewer = ReplayViewer(
+            recordings,
+            game_index=args.game - 1,
+            start_move=args.move,
+            speed=args.speed,
+            max_fps=args.max_fps,
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
+    viewer.run()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
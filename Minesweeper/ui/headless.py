@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import sys
+from typing import TextIO
+
+from minesweeper.domain.board import BoardView
+from minesweeper.domain.tile import Tile
+from minesweeper.domain.types import Coord, GameMode, TileState
+
+_ANSI_CLEAR = "\x1b[H\x1b[2J"
+_ANSI_RESET = "\x1b[0m"
+_ANSI_COLORS = {
+    "F": "\x1b[33m",
+    "*": "\x1b[1;31m",
+    "1": "\x1b[34m",
+    "2": "\x1b[32m",
+    "3": "\x1b[31m",
+    "4": "\x1b[35m",
+    "5": "\x1b[91m",
+    "6": "\x1b[36m",
+    "7": "\x1b[37m",
+    "8": "\x1b[90m",
+}
+
+
+class NullRenderer:
+    """Draws nothing, so `App` runs without a display."""
+
+    interactive = False
+
+    def render(self, board: BoardView, win_rate: float, mode: GameMode, ai_active: bool) -> None:
+        pass
+
+    def invalidate(self) -> None:
+        pass
+
+    def board_coord_from_screen(self, screen_x: int, screen_y: int) -> Coord | None:
+        return None
+
+    def scroll(self, dx: int, dy: int) -> None:
+        pass
+
+    def zoom(self, steps: int) -> None:
+        pass
+
+
+class TextRenderer:
+    """
+    Prints the board as text, one character per tile.
+
+    On a terminal every frame redraws the screen in place with ANSI
+    colours; otherwise frames are appended as plain text. Either way a
+    frame identical to the previous one is not printed again.
+    """
+
+    interactive = False
+
+    def __init__(self, stream: TextIO | None = None, ansi: bool | None = None) -> None:
+        self._stream = stream or sys.stdout
+        self._ansi = self._stream.isatty() if ansi is None else ansi
+        self._last_frame: str | None = None
+
+    def render(self, board: BoardView, win_rate: float, mode: GameMode, ai_active: bool) -> None:
+        frame = self.format_frame(board, win_rate, mode, ai_active)
+        if frame == self._last_frame:
+            return
+
+        self._last_frame = frame
+        if self._ansi:
+            self._stream.write(_ANSI_CLEAR + frame)
+        else:
+            self._stream.write(frame + "\n")
+        self._stream.flush()
+
+    def invalidate(self) -> None:
+        self._last_frame = None
+
+    def board_coord_from_screen(self, screen_x: int, screen_y: int) -> Coord | None:
+        return None
+
+    def scroll(self, dx: int, dy: int) -> None:
+        pass
+
+    def zoom(self, steps: int) -> None:
+        pass
+
+    def format_frame(self, board: BoardView, win_rate: float, mode: GameMode, ai_active: bool) -> str:
+        tiles = [[board.tile_at(Coord(x, y)) for x in range(board.width)] for y in range(board.height)]
+        flagged = sum(tile.state == TileState.FLAGGED for row in tiles for tile in row)
+        header = (
+            f"Mines {board.num_mines - flagged} | "
+            f"{mode.name} • AI {'On' if ai_active else 'Off'} | "
+            f"Win Rate {win_rate:.1%}"
+        )
+        rows = [" ".join(self._symbol(tile) for tile in row) for row in tiles]
+        return "\n".join([header, *rows]) + "\n"
+
+    def _symbol(self, tile: Tile) -> str:
+        if tile.state == TileState.HIDDEN:
+            symbol = "#"
+        elif tile.state == TileState.FLAGGED:
+            symbol = "F"
+        elif tile.state == TileState.EXPLODED:
+            symbol = "*"
+        elif tile.adjacent_mines == 0:
+            symbol = "."
+        else:
+            symbol = str(tile.adjacent_mines)
+
+        color = _ANSI_COLORS.get(symbol)
+        if self._ansi and color is not None:
+            return f"{color}{symbol}{_ANSI_RESET}"
+        return symbol
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import time
 from typing import NamedTuple, Sequence
 
 import pygame
 
 from minesweeper.domain.types import ActionType, Coord, GameMode
-from minesweeper.ui.renderer import PygameRenderer
+from minesweeper.ui.renderer import Renderer
 
 
 class QuitEvent(NamedTuple):
@@ -25,18 +26,74 @@ class StepAIEvent(NamedTuple):
     pass
 
 
-InputEvent = QuitEvent | TileClickEvent | ToggleAIEvent | StepAIEvent
+class RedrawEvent(NamedTuple):
+    """The window needs repainting (pointer moved or window exposed) but nothing else changed."""
 
 
-def poll_events(mode: GameMode, renderer: PygameRenderer) -> Sequence[InputEvent]:
+InputEvent = QuitEvent | TileClickEvent | ToggleAIEvent | StepAIEvent | RedrawEvent
+
+_SCROLL_KEYS = {
+    pygame.K_LEFT: (-1, 0),
+    pygame.K_RIGHT: (1, 0),
+    pygame.K_UP: (0, -1),
+    pygame.K_DOWN: (0, 1),
+}
+_ZOOM_KEYS = {
+    pygame.K_PLUS: 1,
+    pygame.K_EQUALS: 1,
+    pygame.K_KP_PLUS: 1,
+    pygame.K_MINUS: -1,
+    pygame.K_KP_MINUS: -1,
+}
+
+
+def poll_events(mode: GameMode, renderer: Renderer, timeout_ms: int = 0) -> Sequence[InputEvent]:
+    """
+    Translate pending pygame events.
+
+    With a positive `timeout_ms` and an empty queue, block until the next
+    event arrives or the timeout passes instead of returning straight away.
+    Renderers without a window have no queue, so this only waits out the
+    timeout; Ctrl-C during the wait quits.
+    """
+    if not renderer.interactive:
+        return _wait_without_window(timeout_ms)
+
+    events = pygame.event.get()
+    if not events and timeout_ms > 0:
+        first = pygame.event.wait(timeout_ms)
+        if first.type != pygame.NOEVENT:
+            events = [first, *pygame.event.get()]
+
     translated: list[InputEvent] = []
-    for event in pygame.event.get():
+    for event in events:
         if event.type == pygame.QUIT:
             translated.append(QuitEvent())
             continue
 
+        if event.type in {pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED}:
+            renderer.invalidate()
+            translated.append(RedrawEvent())
+            continue
+
+        if event.type == pygame.MOUSEMOTION and mode.player_input:
+            translated.append(RedrawEvent())
+            continue
+
+        if event.type == pygame.MOUSEWHEEL:
+            if event.y:
+                renderer.zoom(1 if event.y > 0 else -1)
+                translated.append(RedrawEvent())
+            continue
+
         if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_SPACE and mode.ai_togglable:
+            if event.key in _SCROLL_KEYS:
+                renderer.scroll(*_SCROLL_KEYS[event.key])
+                translated.append(RedrawEvent())
+            elif event.key in _ZOOM_KEYS:
+                renderer.zoom(_ZOOM_KEYS[event.key])
+                translated.append(RedrawEvent())
+            elif event.key == pygame.K_SPACE and mode.ai_togglable:
                 translated.append(ToggleAIEvent())
             elif event.key == pygame.K_s and mode.ai_enabled:
                 translated.append(StepAIEvent())
@@ -53,3 +110,11 @@ def poll_events(mode: GameMode, renderer: PygameRenderer) -> Sequence[InputEvent
                 translated.append(TileClickEvent(coord, ActionType.FLAG))
 
     return translated
+
+
+def _wait_without_window(timeout_ms: int) -> Sequence[InputEvent]:
+    try:
+        time.sleep(timeout_ms / 1000)
+    except KeyboardInterrupt:
+        return [QuitEvent()]
+    return []
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+from collections import Counter
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from importlib import import_module
 from pathlib import Path
+from types import ModuleType
+from typing import Protocol
 
 import pygame
 
@@ -43,25 +48,90 @@ class _Theme:
     )
 
 
+_TileKey = tuple[TileState, int, bool]
+
+MIN_SPRITE_TILE_PX = 4
+MINIMAP_TILE_PX = 1
+
+# Minimap palette indexes; the palette itself lists the theme colours in this order.
+_MINIMAP_REVEALED_ZERO = 2
+_MINIMAP_REVEALED_NUMBER = 3
+_MINIMAP_INDEXES = {
+    TileState.HIDDEN: 0,
+    TileState.FLAGGED: 1,
+    TileState.REVEALED: _MINIMAP_REVEALED_ZERO,
+    TileState.EXPLODED: 4,
+}
+
+
+class Renderer(Protocol):
+    """
+    Draws the game for `App`.
+
+    Only `interactive` renderers own a window with an event queue; for the
+    others `poll_events` just waits and the game takes no player input.
+    """
+
+    @property
+    def interactive(self) -> bool: ...
+
+    def render(self, board: BoardView, win_rate: float, mode: GameMode, ai_active: bool) -> None: ...
+
+    def invalidate(self) -> None: ...
+
+    def board_coord_from_screen(self, screen_x: int, screen_y: int) -> Coord | None: ...
+
+    def scroll(self, dx: int, dy: int) -> None: ...
+
+    def zoom(self, steps: int) -> None: ...
+
+
 @dataclass(frozen=True)
 class _Layout:
     header_height: int
     outer_padding: int = 12
+    max_view_size: tuple[int, int] = (1200, 720)
 
 
 class PygameRenderer:
+    """
+    Draws the board with dirty-rectangle updates.
+
+    The first frame, and any frame after `invalidate()`, is drawn in full
+    and flipped. Later frames redraw only the tiles whose state or hover
+    changed since they were last drawn, plus the header when its labels
+    change, and push just those rectangles to the display. Boards that
+    expose a `version` counter are not rescanned while it is unchanged.
+
+    Every visual tile variant is pre-rendered once into a sprite atlas, so
+    drawing the changed tiles is a single `blits()` call.
+
+    Boards larger than `_Layout.max_view_size` are shown through a
+    scrollable, zoomable viewport, and only the tiles inside it are read
+    and drawn. Zoom levels halve the tile size down to
+    `MIN_SPRITE_TILE_PX`; below that the viewport becomes a minimap with
+    one pixel per tile, blitted in one go from a palette-indexed state
+    array.
+    """
+
+    interactive = True
+
     def __init__(self, config: GameConfig) -> None:
         pygame.init()
         self._config = config
         self._theme = _Theme()
         self._layout = _Layout(header_height=max(config.tile_size_px * 2, config.font_size_px + 20))
         self._status_bar_height = self._layout.header_height
+        max_view_width, max_view_height = self._layout.max_view_size
         self._board_rect = pygame.Rect(
             self._layout.outer_padding,
             self._layout.header_height + self._layout.outer_padding,
-            config.width * config.tile_size_px,
-            config.height * config.tile_size_px,
+            min(config.width * config.tile_size_px, max_view_width),
+            min(config.height * config.tile_size_px, max_view_height),
         )
+        self._zoom_sizes = self._build_zoom_sizes()
+        self._zoom_index = self._initial_zoom_index()
+        self._view_origin = Coord(0, 0)
         self._surface = pygame.display.set_mode(
             (
                 self._board_rect.width + self._layout.outer_padding * 2,
@@ -80,6 +150,23 @@ class PygameRenderer:
         self._exploded_mine_surface = (
             bomb_surface.copy() if bomb_surface is not None else self._build_mine_surface(exploded=True)
         )
+        self._atlas, self._atlas_areas = self._build_tile_atlas()
+        self._scaled_atlases: dict[int, tuple[pygame.Surface, dict[_TileKey, pygame.Rect]]] = {}
+        self._numpy = _load_numpy()
+        self._minimap_palette = [
+            self._theme.hidden_tile,
+            self._theme.flagged_tile,
+            self._theme.revealed_zero,
+            self._theme.revealed_tile,
+            self._theme.exploded_tile,
+        ]
+        self._drawn_tiles: dict[Coord, _TileKey] = {}
+        self._drawn_header: tuple[tuple[str, str, str], tuple[int, int, int]] | None = None
+        self._last_board: BoardView | None = None
+        self._last_version: int | None = None
+        self._last_status: tuple[float, GameMode, bool] | None = None
+        self._last_hovered: Coord | None = None
+        self._needs_full_redraw = True
         pygame.display.set_caption("Minesweeper Rewrite")
 
     def render(
@@ -89,57 +176,231 @@ class PygameRenderer:
         mode: GameMode,
         ai_active: bool,
     ) -> None:
-        self._surface.fill(self._theme.window_bg)
-        self._draw_header_panel()
-        self._draw_board_frame()
-        self._draw_status(board, win_rate, mode, ai_active)
-        hovered_coord = self._hovered_coord(mode)
-
-        for x in range(board.width):
-            for y in range(board.height):
-                coord = Coord(x, y)
-                self._draw_tile(board.tile_at(coord), hovered=coord == hovered_coord)
-
-        pygame.display.flip()
+        full_redraw = self._needs_full_redraw
+        if full_redraw:
+            self._surface.fill(self._theme.window_bg)
+            self._draw_header_panel()
+            self._draw_board_frame()
+            self._drawn_tiles.clear()
+            self._drawn_header = None
+
+        version = getattr(board, "version", None)
+        board_changed = (
+            full_redraw
+            or version is None
+            or board is not self._last_board
+            or version != self._last_version
+        )
+        status = (win_rate, mode, ai_active)
+        dirty: list[pygame.Rect] = []
+
+        if board_changed or status != self._last_status:
+            header = (self._header_labels(board, win_rate, mode, ai_active), self._header_accent(board))
+            if header != self._drawn_header:
+                self._draw_header_panel()
+                self._draw_status(*header)
+                self._drawn_header = header
+                dirty.append(self._header_rect())
+
+        if self._tile_size < MIN_SPRITE_TILE_PX:
+            if board_changed:
+                dirty.append(self._draw_minimap(board))
+            hovered_coord = None
+        else:
+            hovered_coord = self._hovered_coord(mode)
+            if board_changed:
+                coords = self._visible_coords()
+            else:
+                coords = [coord for coord in {self._last_hovered, hovered_coord} if coord is not None]
+
+            atlas, areas = self._atlas_for(self._tile_size)
+            sprites: list[tuple[pygame.Surface, pygame.Rect, pygame.Rect]] = []
+            for coord in coords:
+                key = self._tile_key(board.tile_at(coord), hovered=coord == hovered_coord)
+                if self._drawn_tiles.get(coord) == key:
+                    continue
+                rect = self._tile_rect(coord)
+                sprites.append((atlas, rect, areas[key]))
+                self._drawn_tiles[coord] = key
+                dirty.append(rect)
+            self._surface.blits(sprites, doreturn=False)
+
+        self._last_board = board
+        self._last_version = version
+        self._last_status = status
+        self._last_hovered = hovered_coord
+        self._needs_full_redraw = False
+
+        if full_redraw:
+            pygame.display.flip()
+        elif dirty:
+            pygame.display.update(dirty)
+
+    def invalidate(self) -> None:
+        """Redraw and flip the whole window on the next frame, e.g. after it was exposed."""
+        self._needs_full_redraw = True
 
     def board_coord_from_screen(self, screen_x: int, screen_y: int) -> Coord | None:
-        board_x = screen_x - self._board_rect.left
-        board_y = screen_y - self._board_rect.top
-        if board_x < 0 or board_y < 0:
+        view = self._view_rect()
+        if not view.collidepoint(screen_x, screen_y):
             return None
 
-        tile_x = board_x // self._config.tile_size_px
-        tile_y = board_y // self._config.tile_size_px
-        if tile_x >= self._config.width or tile_y >= self._config.height:
-            return None
+        size = self._tile_size
+        return Coord(
+            self._view_origin.x + (screen_x - view.left) // size,
+            self._view_origin.y + (screen_y - view.top) // size,
+        )
 
-        return Coord(tile_x, tile_y)
+    def scroll(self, dx: int, dy: int) -> None:
+        """Move the viewport by `dx`, `dy` steps of a quarter of its size."""
+        columns, rows = self._visible_span()
+        self._move_view(
+            self._view_origin.x + dx * max(1, columns // 4),
+            self._view_origin.y + dy * max(1, rows // 4),
+        )
 
-    def _draw_header_panel(self) -> None:
-        pygame.draw.rect(
-            self._surface,
-            self._theme.header_bg,
-            pygame.Rect(0, 0, self._surface.get_width(), self._layout.header_height),
+    def zoom(self, steps: int) -> None:
+        """Zoom in (positive `steps`) or out, keeping the centre of the viewport in place."""
+        index = max(0, min(self._zoom_index - steps, len(self._zoom_sizes) - 1))
+        if index == self._zoom_index:
+            return
+
+        columns, rows = self._visible_span()
+        center_x = self._view_origin.x + columns / 2
+        center_y = self._view_origin.y + rows / 2
+        self._zoom_index = index
+        columns, rows = self._visible_span()
+        self._move_view(int(center_x - columns / 2), int(center_y - rows / 2))
+        self.invalidate()
+
+    @property
+    def _tile_size(self) -> int:
+        return self._zoom_sizes[self._zoom_index]
+
+    def _build_zoom_sizes(self) -> list[int]:
+        base = self._config.tile_size_px
+        sizes = {base * 2, MINIMAP_TILE_PX}
+        size = base
+        while size >= MIN_SPRITE_TILE_PX:
+            sizes.add(size)
+            size //= 2
+        return sorted(sizes, reverse=True)
+
+    def _initial_zoom_index(self) -> int:
+        """The default tile size, or the largest smaller one that fits the whole board."""
+        for index, size in enumerate(self._zoom_sizes):
+            if size > self._config.tile_size_px:
+                continue
+            if (
+                self._config.width * size <= self._board_rect.width
+                and self._config.height * size <= self._board_rect.height
+            ):
+                return index
+        return self._zoom_sizes.index(self._config.tile_size_px)
+
+    def _visible_span(self) -> tuple[int, int]:
+        size = self._tile_size
+        return (
+            min(self._config.width, self._board_rect.width // size),
+            min(self._config.height, self._board_rect.height // size),
         )
 
+    def _view_rect(self) -> pygame.Rect:
+        columns, rows = self._visible_span()
+        size = self._tile_size
+        return pygame.Rect(self._board_rect.left, self._board_rect.top, columns * size, rows * size)
+
+    def _visible_coords(self) -> list[Coord]:
+        columns, rows = self._visible_span()
+        origin_x, origin_y = self._view_origin
+        return [
+            Coord(x, y)
+            for x in range(origin_x, origin_x + columns)
+            for y in range(origin_y, origin_y + rows)
+        ]
+
+    def _move_view(self, x: int, y: int) -> None:
+        columns, rows = self._visible_span()
+        origin = Coord(
+            max(0, min(x, self._config.width - columns)),
+            max(0, min(y, self._config.height - rows)),
+        )
+        if origin != self._view_origin:
+            self._view_origin = origin
+            self.invalidate()
+
+    def _atlas_for(self, size: int) -> tuple[pygame.Surface, dict[_TileKey, pygame.Rect]]:
+        base = self._config.tile_size_px
+        if size == base:
+            return self._atlas, self._atlas_areas
+
+        scaled = self._scaled_atlases.get(size)
+        if scaled is None:
+            atlas = pygame.transform.smoothscale(self._atlas, (self._atlas.get_width() // base * size, size))
+            areas = {
+                key: pygame.Rect(area.left // base * size, 0, size, size)
+                for key, area in self._atlas_areas.items()
+            }
+            scaled = self._scaled_atlases[size] = (atlas, areas)
+        return scaled
+
+    def _draw_minimap(self, board: BoardView) -> pygame.Rect:
+        columns, rows = self._visible_span()
+        origin_x, origin_y = self._view_origin
+        tile_at = board.tile_at
+        states = bytearray(columns * rows)
+        index = 0
+        for y in range(origin_y, origin_y + rows):
+            for x in range(origin_x, origin_x + columns):
+                tile = tile_at(Coord(x, y))
+                state = _MINIMAP_INDEXES[tile.state]
+                if state == _MINIMAP_REVEALED_ZERO and tile.adjacent_mines:
+                    state = _MINIMAP_REVEALED_NUMBER
+                states[index] = state
+                index += 1
+
+        rect = self._view_rect()
+        self._surface.blit(self._minimap_surface(bytes(states), columns, rows), rect)
+        return rect
+
+    def _minimap_surface(self, states: bytes, width: int, height: int) -> pygame.Surface:
+        """An 8-bit surface showing `states`, one row-major palette index per tile."""
+        if self._numpy is not None:
+            surface = pygame.Surface((width, height), depth=8)
+            indices = self._numpy.frombuffer(states, dtype=self._numpy.uint8).reshape(height, width)
+            pygame.surfarray.blit_array(surface, indices.T)
+        else:
+            surface = pygame.image.frombuffer(states, (width, height), "P")
+        surface.set_palette(self._minimap_palette)
+        return surface
+
+    def _header_rect(self) -> pygame.Rect:
+        return pygame.Rect(0, 0, self._surface.get_width(), self._layout.header_height)
+
+    def _draw_header_panel(self) -> None:
+        pygame.draw.rect(self._surface, self._theme.header_bg, self._header_rect())
+
     def _draw_board_frame(self) -> None:
-        frame_rect = self._board_rect.inflate(8, 8)
+        frame_rect = self._view_rect().inflate(8, 8)
         pygame.draw.rect(self._surface, self._theme.border, frame_rect, border_radius=6)
 
+    def _state_counts(self, board: BoardView) -> Mapping[TileState, int]:
+        """Tiles per state, from the board's running counts when it keeps them."""
+        counts: Mapping[TileState, int] | None = getattr(board, "state_counts", None)
+        if counts is None:
+            counts = Counter(
+                board.tile_at(Coord(x, y)).state
+                for x in range(board.width)
+                for y in range(board.height)
+            )
+        return counts
+
     def _has_exploded_tile(self, board: BoardView) -> bool:
-        return any(
-            board.tile_at(Coord(x, y)).state == TileState.EXPLODED
-            for x in range(board.width)
-            for y in range(board.height)
-        )
+        return self._state_counts(board).get(TileState.EXPLODED, 0) > 0
 
     def _all_safe_tiles_revealed(self, board: BoardView) -> bool:
-        return all(
-            tile.is_mine or tile.state == TileState.REVEALED
-            for x in range(board.width)
-            for y in range(board.height)
-            for tile in [board.tile_at(Coord(x, y))]
-        )
+        safe_tiles = board.width * board.height - board.num_mines
+        return self._state_counts(board).get(TileState.REVEALED, 0) == safe_tiles
 
     def _header_accent(self, board: BoardView) -> tuple[int, int, int]:
         if self._has_exploded_tile(board):
@@ -161,11 +422,9 @@ class PygameRenderer:
             f"Win Rate {win_rate:.1%}",
         )
 
-    def _draw_status(self, board: BoardView, win_rate: float, mode: GameMode, ai_active: bool) -> None:
-        left, center, right = self._header_labels(board, win_rate, mode, ai_active)
-        accent = self._header_accent(board)
-
-        header_rect = pygame.Rect(0, 0, self._surface.get_width(), self._layout.header_height)
+    def _draw_status(self, labels: tuple[str, str, str], accent: tuple[int, int, int]) -> None:
+        left, center, right = labels
+        header_rect = self._header_rect()
         pygame.draw.line(
             self._surface,
             accent,
@@ -198,12 +457,7 @@ class PygameRenderer:
         }
 
     def _count_flagged(self, board: BoardView) -> int:
-        return sum(
-            1
-            for x in range(board.width)
-            for y in range(board.height)
-            if board.tile_at(Coord(x, y)).state == TileState.FLAGGED
-        )
+        return self._state_counts(board).get(TileState.FLAGGED, 0)
 
     def _remaining_mines(self, board: BoardView) -> int:
         return board.num_mines - self._count_flagged(board)
@@ -270,8 +524,8 @@ class PygameRenderer:
         )
         return surface
 
-    def _draw_centered_icon(self, rect: pygame.Rect, icon: pygame.Surface) -> None:
-        self._surface.blit(icon, icon.get_rect(center=rect.center))
+    def _draw_centered_icon(self, surface: pygame.Surface, rect: pygame.Rect, icon: pygame.Surface) -> None:
+        surface.blit(icon, icon.get_rect(center=rect.center))
 
     def _hovered_coord(self, mode: GameMode) -> Coord | None:
         if not mode.player_input:
@@ -279,17 +533,18 @@ class PygameRenderer:
         return self.board_coord_from_screen(*pygame.mouse.get_pos())
 
     def _tile_rect(self, coord: Coord) -> pygame.Rect:
+        size = self._tile_size
         return pygame.Rect(
-            self._board_rect.left + coord.x * self._config.tile_size_px,
-            self._board_rect.top + coord.y * self._config.tile_size_px,
-            self._config.tile_size_px,
-            self._config.tile_size_px,
+            self._board_rect.left + (coord.x - self._view_origin.x) * size,
+            self._board_rect.top + (coord.y - self._view_origin.y) * size,
+            size,
+            size,
         )
 
     def _shade(self, color: tuple[int, int, int], delta: int) -> tuple[int, int, int]:
         return tuple(max(0, min(255, channel + delta)) for channel in color)
 
-    def _draw_tile_background(self, rect: pygame.Rect, tile: Tile, hovered: bool) -> None:
+    def _draw_tile_background(self, surface: pygame.Surface, rect: pygame.Rect, tile: Tile, hovered: bool) -> None:
         color = self._theme.hidden_tile
         top_left = self._shade(color, 22)
         bottom_right = self._shade(color, -24)
@@ -311,31 +566,31 @@ class PygameRenderer:
             color = self._shade(color, 16)
             top_left = self._shade(top_left, 10)
 
-        pygame.draw.rect(self._surface, color, rect)
-        pygame.draw.line(self._surface, top_left, rect.topleft, (rect.right - 1, rect.top), 2)
-        pygame.draw.line(self._surface, top_left, rect.topleft, (rect.left, rect.bottom - 1), 2)
+        pygame.draw.rect(surface, color, rect)
+        pygame.draw.line(surface, top_left, rect.topleft, (rect.right - 1, rect.top), 2)
+        pygame.draw.line(surface, top_left, rect.topleft, (rect.left, rect.bottom - 1), 2)
         pygame.draw.line(
-            self._surface,
+            surface,
             bottom_right,
             (rect.left, rect.bottom - 1),
             (rect.right - 1, rect.bottom - 1),
             2,
         )
         pygame.draw.line(
-            self._surface,
+            surface,
             bottom_right,
             (rect.right - 1, rect.top),
             (rect.right - 1, rect.bottom - 1),
             2,
         )
 
-    def _draw_tile_content(self, rect: pygame.Rect, tile: Tile) -> None:
+    def _draw_tile_content(self, surface: pygame.Surface, rect: pygame.Rect, tile: Tile) -> None:
         if tile.state == TileState.FLAGGED:
-            self._draw_centered_icon(rect, self._flag_surface)
+            self._draw_centered_icon(surface, rect, self._flag_surface)
             return
 
         if tile.state == TileState.EXPLODED:
-            self._draw_centered_icon(rect, self._exploded_mine_surface)
+            self._draw_centered_icon(surface, rect, self._exploded_mine_surface)
             return
 
         if tile.state != TileState.REVEALED or tile.adjacent_mines <= 0:
@@ -344,9 +599,46 @@ class PygameRenderer:
         text = self._number_surfaces.get(tile.adjacent_mines)
         if text is None:
             text = self._font.render(str(tile.adjacent_mines), True, self._theme.text_primary)
-        self._surface.blit(text, text.get_rect(center=rect.center))
+        surface.blit(text, text.get_rect(center=rect.center))
+
+    def _tile_key(self, tile: Tile, hovered: bool) -> _TileKey:
+        """Everything that affects how a tile looks; equal keys draw identical pixels."""
+        return (
+            tile.state,
+            tile.adjacent_mines if tile.state == TileState.REVEALED else 0,
+            hovered and tile.state in {TileState.HIDDEN, TileState.FLAGGED},
+        )
+
+    def _tile_variants(self) -> list[Tile]:
+        coord = Coord(0, 0)
+        return [
+            Tile(coord, TileState.HIDDEN, False),
+            Tile(coord, TileState.FLAGGED, False),
+            *(Tile(coord, TileState.REVEALED, False, adjacent_mines=value) for value in range(9)),
+            Tile(coord, TileState.EXPLODED, True),
+        ]
 
-    def _draw_tile(self, tile: Tile, hovered: bool = False) -> None:
-        rect = self._tile_rect(tile.coord)
-        self._draw_tile_background(rect, tile, hovered)
-        self._draw_tile_content(rect, tile)
+    def _build_tile_atlas(self) -> tuple[pygame.Surface, dict[_TileKey, pygame.Rect]]:
+        """One row holding every distinct tile look, keyed like `_tile_key`."""
+        size = self._config.tile_size_px
+        variants: list[tuple[Tile, bool]] = []
+        for tile in self._tile_variants():
+            variants.append((tile, False))
+            if self._tile_key(tile, hovered=True) != self._tile_key(tile, hovered=False):
+                variants.append((tile, True))
+
+        atlas = pygame.Surface((size * len(variants), size)).convert()
+        areas: dict[_TileKey, pygame.Rect] = {}
+        for index, (tile, hovered) in enumerate(variants):
+            area = pygame.Rect(index * size, 0, size, size)
+            self._draw_tile_background(atlas, area, tile, hovered)
+            self._draw_tile_content(atlas, area, tile)
+            areas[self._tile_key(tile, hovered)] = area
+        return atlas, areas
+
+
+def _load_numpy() -> ModuleType | None:
+    try:
+        return import_module("numpy")
+    except ImportError:
+        return None
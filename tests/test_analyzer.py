@@ -1,3 +1,5 @@
+import pytest
+
 from minesweeper.ai.analyzer import Analyzer, AnalyzedBoard
 from minesweeper.domain.move import Move
 from minesweeper.domain.types import ActionType, Coord, GameConfig
@@ -106,3 +108,68 @@ def test_total_mines_matches_board() -> None:
     analysis = Analyzer().analyze(board)
 
     assert analysis.total_mines == 6
+    assert (analysis.width, analysis.height) == (4, 5)
+
+
+def test_frontier_constraints_count_unknowns_and_flags() -> None:
+    game = Game(
+        GameConfig(width=3, height=3, num_mines=1),
+        FixedSampleRandom([Coord(2, 2)]),
+    )
+    game.apply_move(Move(ActionType.REVEAL, Coord(1, 1)))
+    game.apply_move(Move(ActionType.FLAG, Coord(0, 0)))
+
+    analysis = Analyzer().analyze(game.board)
+    constraint = analysis.frontier_constraints[Coord(1, 1)]
+
+    assert constraint.unknowns == analysis.unknown_coords
+    assert constraint.mines_needed == 0
+
+
+def test_constraints_are_computed_once_and_immutable() -> None:
+    game = Game(
+        GameConfig(width=3, height=3, num_mines=1),
+        FixedSampleRandom([Coord(2, 2)]),
+    )
+    game.apply_move(Move(ActionType.REVEAL, Coord(1, 1)))
+
+    analysis = Analyzer().analyze(game.board)
+
+    assert analysis.constraints is analysis.constraints
+    assert isinstance(analysis.constraints, tuple)
+    assert analysis.frontier_constraints is analysis.frontier_constraints
+    with pytest.raises(TypeError):
+        analysis.frontier_constraints[Coord(0, 0)] = analysis.constraints[0]  # type: ignore[index]
+
+
+def test_constraints_skip_frontier_cells_without_unknowns() -> None:
+    satisfied = Coord(0, 0)
+    active = Coord(2, 0)
+    analysis = AnalyzedBoard(
+        grid={satisfied: 1, active: 1},
+        frontier=[satisfied, active],
+        unknown_coords=frozenset({Coord(3, 0)}),
+        flagged_coords=frozenset({Coord(0, 1)}),
+    )
+
+    assert set(analysis.frontier_constraints) == {satisfied, active}
+    assert [constraint.unknowns for constraint in analysis.constraints] == [
+        frozenset({Coord(3, 0)})
+    ]
+
+
+def test_reuses_analysis_until_the_board_changes() -> None:
+    game = Game(
+        GameConfig(width=3, height=3, num_mines=1),
+        FixedSampleRandom([Coord(2, 2)]),
+    )
+    analyzer = Analyzer()
+
+    first = analyzer.analyze(game.board)
+    assert analyzer.analyze(game.board) is first
+
+    game.apply_move(Move(ActionType.REVEAL, Coord(1, 1)))
+
+    second = analyzer.analyze(game.board)
+    assert second is not first
+    assert second.grid[Coord(1, 1)] == 1
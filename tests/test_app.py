@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+import threading
+import time
+
+import pytest
+
 import minesweeper.app as app_module
 from minesweeper.ai.analyzer import AnalyzedBoard
 from minesweeper.domain.move import Move
@@ -9,9 +14,11 @@ from minesweeper.domain.types import (
     Coord,
     GameConfig,
     GamePhase,
+    HYBRID,
     PLAYER_ONLY,
     TileState,
 )
+from minesweeper.engine.game import BatchOutcome, MoveOutcome
 
 
 class StubBoard:
@@ -65,6 +72,10 @@ class RecordingMoveGame:
         self.applied_moves.append(move)
         return [move.coord]
 
+    def apply_moves(self, moves: list[Move]) -> BatchOutcome:
+        outcomes = tuple(MoveOutcome(move, tuple(self.apply_move(move))) for move in moves)
+        return BatchOutcome(outcomes, tuple(move.coord for move in moves))
+
 
 class StubAnalyzer:
     def __init__(self, analysis: AnalyzedBoard) -> None:
@@ -128,8 +139,7 @@ def test_app_renders_lost_board_before_reset(monkeypatch) -> None:
 
     monkeypatch.setattr(app_module, "PygameRenderer", lambda _config: renderer)
     monkeypatch.setattr(app_module, "Game", lambda _config, _rng: game)
-    monkeypatch.setattr(app_module, "poll_events", lambda _mode, _renderer: [app_module.QuitEvent()])
-    monkeypatch.setattr(app_module.pygame.time, "delay", lambda _ms: None)
+    monkeypatch.setattr(app_module, "poll_events", lambda _mode, _renderer, **_kwargs: [app_module.QuitEvent()])
     monkeypatch.setattr(app_module.pygame, "quit", lambda: None)
 
     app = app_module.App(GameConfig(width=2, height=2, num_mines=1, restart_delay_ms=0), PLAYER_ONLY)
@@ -165,9 +175,308 @@ def test_ai_turn_applies_full_batch_from_first_matching_strategy(monkeypatch) ->
     )
     app._strategies = [first, second]
 
-    app._run_ai_turn()
+    with app._ai_wakeup:
+        app._run_ai_turn()
 
     assert game.applied_moves == batch
     assert first.calls == 1
     assert second.calls == 0
     assert app._is_evaluable is True
+
+
+def test_ai_turn_applies_moves_after_a_skipped_one(monkeypatch) -> None:
+    game = app_module.Game(GameConfig(width=3, height=3, num_mines=1), None)
+    game._board.set_state(Coord(0, 0), TileState.REVEALED)
+    batch = [
+        Move(ActionType.REVEAL, Coord(0, 0)),
+        Move(ActionType.FLAG, Coord(2, 2)),
+    ]
+
+    monkeypatch.setattr(app_module, "PygameRenderer", lambda _config: object())
+    monkeypatch.setattr(app_module, "Game", lambda _config, _rng: game)
+
+    app = app_module.App(GameConfig(width=3, height=3, num_mines=1))
+    app._analyzer = StubAnalyzer(AnalyzedBoard(unknown_coords=frozenset({Coord(2, 2)})))
+    app._strategies = [StubBatchStrategy(batch)]
+
+    with app._ai_wakeup:
+        app._run_ai_turn()
+
+    assert game.board.tile_at(Coord(2, 2)).state == TileState.FLAGGED
+
+
+def test_ai_turn_records_per_strategy_stats(monkeypatch) -> None:
+    game = RecordingMoveGame()
+    batch = [
+        Move(ActionType.REVEAL, Coord(0, 0)),
+        Move(ActionType.FLAG, Coord(1, 1)),
+    ]
+
+    monkeypatch.setattr(app_module, "PygameRenderer", lambda _config: object())
+    monkeypatch.setattr(app_module, "Game", lambda _config, _rng: game)
+
+    app = app_module.App(GameConfig())
+    app._analyzer = StubAnalyzer(AnalyzedBoard())
+    app._strategies = [StubBatchStrategy([]), StubBatchStrategy(batch)]
+
+    with app._ai_wakeup:
+        app._run_ai_turn()
+
+    [stats] = app.strategy_stats
+    assert stats.name == "StubBatchStrategy"
+    assert stats.calls == 2
+    assert stats.hits == 1
+    assert stats.moves == 2
+
+
+def test_app_builds_strategy_chain_from_config(monkeypatch) -> None:
+    monkeypatch.setattr(app_module, "PygameRenderer", lambda _config: object())
+
+    app = app_module.App(GameConfig(strategies=("PatternDetector", "ProbabilitySolver")))
+
+    assert [strategy.name for strategy in app._strategies] == ["PatternDetector", "ProbabilitySolver"]
+
+
+class ScriptedEvents:
+    """Stands in for `poll_events`: advances a fake clock and replays one event batch per call."""
+
+    def __init__(self, batches: list[tuple[int, list[object]]]) -> None:
+        self.now = 0
+        self._batches = list(batches)
+        self.timeouts: list[int] = []
+
+    def ticks(self) -> int:
+        return self.now
+
+    def __call__(self, _mode: object, _renderer: object, timeout_ms: int = 0) -> list[object]:
+        self.timeouts.append(timeout_ms)
+        if not self._batches:
+            return [app_module.QuitEvent()]
+        self.now, events = self._batches.pop(0)
+        return events
+
+
+def _ai_step(app: app_module.App, now: int) -> int:
+    """Run one worker turn the way `_ai_loop` does, with the game lock held."""
+    with app._ai_wakeup:
+        return app._ai_step(now)
+
+
+def _scripted_app(monkeypatch, config: GameConfig, mode, game, events: ScriptedEvents, renderer) -> app_module.App:
+    monkeypatch.setattr(app_module, "PygameRenderer", lambda _config: renderer)
+    monkeypatch.setattr(app_module, "Game", lambda _config, _rng: game)
+    monkeypatch.setattr(app_module, "poll_events", events)
+    monkeypatch.setattr(app_module.pygame, "quit", lambda: None)
+    app = app_module.App(config, mode)
+    app._ticks = events.ticks
+    return app
+
+
+def _hidden_board() -> StubBoard:
+    return StubBoard(
+        2,
+        2,
+        1,
+        [Tile(Coord(x, y), TileState.HIDDEN, False) for x in range(2) for y in range(2)],
+    )
+
+
+def test_idle_player_loop_blocks_on_events_after_drawing(monkeypatch) -> None:
+    renderer = RecordingRenderer()
+    game = StubGame(_hidden_board(), _hidden_board(), GamePhase.NOT_STARTED)
+    events = ScriptedEvents([(0, []), (500, [])])
+    app = _scripted_app(monkeypatch, GameConfig(width=2, height=2, num_mines=1), PLAYER_ONLY, game, events, renderer)
+
+    app.run()
+
+    assert events.timeouts == [0, app_module.App.IDLE_WAIT_MS, app_module.App.IDLE_WAIT_MS]
+    assert len(renderer.rendered_states) == 1
+
+
+def test_ai_worker_plays_at_most_one_batch_per_frame(monkeypatch) -> None:
+    game = RecordingMoveGame()
+    monkeypatch.setattr(app_module, "PygameRenderer", lambda _config: object())
+    monkeypatch.setattr(app_module, "Game", lambda _config, _rng: game)
+    app = app_module.App(GameConfig(max_fps=50), app_module.AI_ONLY)
+    app._analyzer = StubAnalyzer(AnalyzedBoard())
+    strategy = StubBatchStrategy([Move(ActionType.REVEAL, Coord(0, 0))])
+    app._strategies = [strategy]
+
+    assert _ai_step(app, 0) == 20
+    assert _ai_step(app, 5) == 15
+    assert _ai_step(app, 20) == 20
+
+    assert strategy.calls == 2
+
+
+def test_turbo_ai_worker_plays_back_to_back(monkeypatch) -> None:
+    game = RecordingMoveGame()
+    monkeypatch.setattr(app_module, "PygameRenderer", lambda _config: object())
+    monkeypatch.setattr(app_module, "Game", lambda _config, _rng: game)
+    app = app_module.App(GameConfig(max_fps=50, ai_turbo=True, ai_click_feedback=True), app_module.AI_ONLY)
+    app._analyzer = StubAnalyzer(AnalyzedBoard())
+    strategy = StubBatchStrategy([Move(ActionType.REVEAL, Coord(0, 0))])
+    app._strategies = [strategy]
+
+    assert [_ai_step(app, 0) for _ in range(3)] == [0, 0, 0]
+    assert strategy.calls == 3
+
+    app._main_waiting = True
+    assert _ai_step(app, 0) == app_module.App.IDLE_WAIT_MS
+    assert strategy.calls == 3
+
+
+def test_ai_worker_steps_on_request_while_paused(monkeypatch) -> None:
+    game = RecordingMoveGame()
+    monkeypatch.setattr(app_module, "PygameRenderer", lambda _config: object())
+    monkeypatch.setattr(app_module, "Game", lambda _config, _rng: game)
+    app = app_module.App(GameConfig(), HYBRID)
+    app._analyzer = StubAnalyzer(AnalyzedBoard())
+    strategy = StubBatchStrategy([Move(ActionType.REVEAL, Coord(0, 0))])
+    app._strategies = [strategy]
+
+    app._handle_events([app_module.StepAIEvent()])
+    _ai_step(app, 0)
+    _ai_step(app, 100)
+
+    assert strategy.calls == 1
+
+
+def test_turbo_ai_worker_restarts_finished_games_and_records_them(monkeypatch) -> None:
+    lost_board = StubBoard(1, 1, 0, [Tile(Coord(0, 0), TileState.EXPLODED, True)])
+    game = StubGame(lost_board, _hidden_board(), GamePhase.LOST)
+    monkeypatch.setattr(app_module, "PygameRenderer", lambda _config: object())
+    monkeypatch.setattr(app_module, "Game", lambda _config, _rng: game)
+
+    paced = app_module.App(GameConfig(), app_module.AI_ONLY)
+    assert _ai_step(paced, 0) == app_module.App.IDLE_WAIT_MS
+    assert game.reset_calls == 0
+
+    turbo = app_module.App(GameConfig(ai_turbo=True), app_module.AI_ONLY)
+    turbo._is_evaluable = True
+    assert _ai_step(turbo, 0) == 0
+    assert game.reset_calls == 1
+    assert turbo._stats.win_rate == 0.0
+    assert turbo._stats._evaluable_games == 1
+    assert turbo._is_evaluable is False
+
+
+def test_ai_only_run_plays_on_a_worker_thread(monkeypatch) -> None:
+    renderer = RecordingRenderer()
+    game = RecordingMoveGame()
+    strategy = StubBatchStrategy([Move(ActionType.REVEAL, Coord(0, 0))])
+    monkeypatch.setattr(renderer, "render", lambda *_args: renderer.rendered_states.append({}))
+
+    def poll_until_the_ai_played(_mode, _renderer, timeout_ms=0):
+        deadline = time.monotonic() + 5
+        while strategy.calls < 3 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        return [app_module.QuitEvent()]
+
+    monkeypatch.setattr(app_module, "PygameRenderer", lambda _config: renderer)
+    monkeypatch.setattr(app_module, "Game", lambda _config, _rng: game)
+    monkeypatch.setattr(app_module, "poll_events", poll_until_the_ai_played)
+    monkeypatch.setattr(app_module.pygame, "quit", lambda: None)
+    app = app_module.App(GameConfig(ai_turbo=True), app_module.AI_ONLY)
+    app._ticks = lambda: 0
+    app._analyzer = StubAnalyzer(AnalyzedBoard())
+    app._strategies = [strategy]
+
+    app.run()
+
+    assert strategy.calls >= 3
+    assert app._ai_thread is not None and not app._ai_thread.is_alive()
+    assert len(renderer.rendered_states) == 1
+
+
+def test_restart_waits_for_its_delay_without_blocking(monkeypatch) -> None:
+    lost_board = StubBoard(1, 2, 1, [Tile(Coord(0, 0), TileState.EXPLODED, True), Tile(Coord(0, 1), TileState.HIDDEN, False)])
+    renderer = RecordingRenderer()
+    game = StubGame(lost_board, _hidden_board(), GamePhase.LOST)
+    events = ScriptedEvents([(0, []), (600, []), (1000, [])])
+    app = _scripted_app(
+        monkeypatch,
+        GameConfig(width=2, height=2, num_mines=1, restart_delay_ms=1000),
+        PLAYER_ONLY,
+        game,
+        events,
+        renderer,
+    )
+
+    app.run()
+
+    assert events.timeouts[:3] == [0, app_module.App.IDLE_WAIT_MS, 400]
+    assert game.reset_calls == 1
+    assert len(renderer.rendered_states) == 2
+
+
+def test_headless_app_plays_a_fixed_number_of_games(monkeypatch) -> None:
+    def unexpected_window(_config):
+        raise AssertionError("the null renderer must not open a window")
+
+    monkeypatch.setattr(app_module, "PygameRenderer", unexpected_window)
+    output: list[str] = []
+    app = app_module.App(
+        GameConfig(width=9, height=9, num_mines=10, renderer="null", max_games=3),
+        app_module.AI_ONLY,
+        output=output.append,
+    )
+
+    app.run()
+
+    assert app.games_played == 3
+    assert output[0].startswith("Played 3 games, win rate ")
+
+
+class RaisingStrategy:
+    @property
+    def name(self) -> str:
+        return "RaisingStrategy"
+
+    def find_moves(self, analysis: AnalyzedBoard) -> list[Move]:
+        raise RuntimeError("strategy failed")
+
+
+def test_headless_app_raises_a_strategy_error_instead_of_hanging(monkeypatch) -> None:
+    app = app_module.App(
+        GameConfig(width=9, height=9, num_mines=10, renderer="null", max_games=3),
+        app_module.AI_ONLY,
+    )
+    app._strategies = [RaisingStrategy()]
+
+    with pytest.raises(RuntimeError, match="strategy failed"):
+        app.run()
+
+    assert app._ai_thread is not None and not app._ai_thread.is_alive()
+
+
+def test_ai_turn_runs_strategies_without_the_lock_and_drops_stale_moves(monkeypatch) -> None:
+    game = app_module.Game(GameConfig(width=3, height=3, num_mines=1), None)
+    monkeypatch.setattr(app_module, "PygameRenderer", lambda _config: object())
+    monkeypatch.setattr(app_module, "Game", lambda _config, _rng: game)
+    app = app_module.App(GameConfig(width=3, height=3, num_mines=1), HYBRID)
+    flagged = Coord(2, 2)
+
+    def click() -> None:
+        with app._exclusive():
+            app._handle_events([app_module.TileClickEvent(flagged, ActionType.FLAG)])
+
+    class ClickingStrategy(StubBatchStrategy):
+        def find_moves(self, analysis: AnalyzedBoard) -> list[Move]:
+            # The player flags a tile while the strategy thinks, which needs the lock.
+            player = threading.Thread(target=click)
+            player.start()
+            player.join(timeout=5)
+            assert not player.is_alive()
+            return super().find_moves(analysis)
+
+    strategy = ClickingStrategy([Move(ActionType.REVEAL, Coord(0, 0))])
+    app._strategies = [strategy]
+    app._handle_events([app_module.StepAIEvent()])
+
+    assert _ai_step(app, 0) == 0
+    assert strategy.calls == 1
+    assert game.board.tile_at(Coord(0, 0)).state == TileState.HIDDEN
+    assert game.board.tile_at(flagged).state == TileState.FLAGGED
+    assert app._pending_steps == 1
+
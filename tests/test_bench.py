@@ -0,0 +1,193 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from minesweeper.ai.analyzer import AnalyzedBoard, Analyzer
+from minesweeper.bench.__main__ import main
+from minesweeper.bench.corpus import CATEGORIES, Position, categorize, load_corpus, save_corpus
+from minesweeper.bench.solver import (
+    ANALYZE,
+    Regression,
+    Timing,
+    find_regressions,
+    load_results,
+    results_to_json,
+    run_benchmarks,
+    time_call,
+)
+from minesweeper.domain.move import Move
+from minesweeper.domain.types import ActionType, Coord, TileState
+
+
+class StubStrategy:
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self.calls = 0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def find_moves(self, analysis: AnalyzedBoard) -> list[Move]:
+        self.calls += 1
+        return [Move(ActionType.REVEAL, Coord(0, 0))]
+
+
+class TickingClock:
+    def __init__(self, tick: float) -> None:
+        self._tick = tick
+        self._now = 0.0
+
+    def __call__(self) -> float:
+        self._now += self._tick
+        return self._now
+
+
+FIFTY_FIFTY = Position(
+    name="fifty_fifty-tiny",
+    category="fifty_fifty",
+    num_mines=1,
+    rows=("##", "11", "00"),
+)
+
+
+def test_position_board_reads_rows_as_tiles() -> None:
+    board = Position("p", "early", 1, ("#F", "12")).board()
+
+    assert (board.width, board.height, board.num_mines) == (2, 2, 1)
+    assert board.tile_at(Coord(0, 0)).state == TileState.HIDDEN
+    assert board.tile_at(Coord(1, 0)).state == TileState.FLAGGED
+    assert board.tile_at(Coord(1, 1)).adjacent_mines == 2
+    with pytest.raises(KeyError):
+        board.tile_at(Coord(2, 0))
+
+
+def test_position_round_trips_through_board_snapshot() -> None:
+    copied = Position.from_board("copy", "early", FIFTY_FIFTY.board())
+
+    assert copied.rows == FIFTY_FIFTY.rows
+    assert copied.num_mines == FIFTY_FIFTY.num_mines
+
+
+def test_corpus_round_trips_through_json(tmp_path: Path) -> None:
+    path = tmp_path / "positions.json"
+
+    save_corpus([FIFTY_FIFTY], path)
+
+    assert load_corpus(path) == [FIFTY_FIFTY]
+
+
+def test_categorize_detects_isolated_fifty_fifty() -> None:
+    analysis = Analyzer().analyze(FIFTY_FIFTY.board())
+
+    assert "fifty_fifty" in categorize(analysis, safe_tiles=5)
+
+
+def test_position_from_dict_rejects_malformed_entries() -> None:
+    entry = FIFTY_FIFTY.to_dict()
+
+    assert Position.from_dict(entry) == FIFTY_FIFTY
+    with pytest.raises(ValueError, match="integer num_mines"):
+        Position.from_dict({**entry, "num_mines": "1"})
+    with pytest.raises(ValueError, match="list of rows"):
+        Position.from_dict({**entry, "rows": None})
+
+
+def test_shipped_corpus_covers_every_category() -> None:
+    categories = {position.category for position in load_corpus()}
+
+    assert categories == set(CATEGORIES)
+
+
+def test_time_call_warms_up_then_stops_at_the_time_budget() -> None:
+    calls: list[int] = []
+
+    samples = time_call(
+        lambda: calls.append(1),
+        warmup=2,
+        repetitions=10,
+        max_seconds=3.0,
+        clock=TickingClock(1.0),
+    )
+
+    assert len(calls) == 2 + 3
+    assert samples == [1.0, 1.0, 1.0]
+
+
+def test_run_benchmarks_times_analyze_and_each_strategy_per_position() -> None:
+    first = StubStrategy("First")
+    second = StubStrategy("Second")
+
+    results = run_benchmarks(
+        [FIFTY_FIFTY],
+        strategies_factory=lambda: [first, second],
+        warmup=1,
+        repetitions=4,
+        clock=TickingClock(0.5),
+    )
+
+    assert set(results) == {
+        f"fifty_fifty-tiny/{ANALYZE}",
+        "fifty_fifty-tiny/First",
+        "fifty_fifty-tiny/Second",
+    }
+    assert results["fifty_fifty-tiny/First"] == Timing(4, 500.0, 500.0, 500.0, 500.0)
+    assert first.calls == second.calls == 5
+
+
+def test_run_benchmarks_times_every_call_on_fresh_strategies_and_analyses() -> None:
+    seen: list[tuple[StubStrategy, AnalyzedBoard]] = []
+    factories = 0
+
+    class CachingStrategy(StubStrategy):
+        def find_moves(self, analysis: AnalyzedBoard) -> list[Move]:
+            seen.append((self, analysis))
+            return super().find_moves(analysis)
+
+    def factory() -> list[StubStrategy]:
+        nonlocal factories
+        factories += 1
+        return [CachingStrategy("Caching")]
+
+    run_benchmarks([FIFTY_FIFTY], strategies_factory=factory, warmup=1, repetitions=3, clock=TickingClock(0.5))
+
+    assert factories == 1 + 4
+    assert len(seen) == 4
+    assert len({id(strategy) for strategy, _analysis in seen}) == 4
+    assert len({id(analysis) for _strategy, analysis in seen}) == 4
+
+
+def test_results_json_round_trips_medians(tmp_path: Path) -> None:
+    path = tmp_path / "results.json"
+    results = {"p/Solver": Timing.from_seconds([0.001, 0.003, 0.002])}
+
+    path.write_text(results_to_json(results, [FIFTY_FIFTY], warmup=1, repetitions=3))
+
+    assert load_results(path) == {"p/Solver": 2.0}
+    assert json.loads(path.read_text())["positions"] == {"fifty_fifty-tiny": "fifty_fifty"}
+
+
+def test_load_results_rejects_unknown_versions(tmp_path: Path) -> None:
+    path = tmp_path / "results.json"
+    path.write_text(json.dumps({"version": 99, "benchmarks": {}}))
+
+    with pytest.raises(ValueError):
+        load_results(path)
+
+
+def test_find_regressions_ignores_noise_and_small_deltas() -> None:
+    baseline = {"slow": 10.0, "noisy": 0.01, "steady": 5.0, "dropped": 1.0}
+    current = {"slow": 15.0, "noisy": 0.03, "steady": 5.5, "added": 3.0}
+
+    assert find_regressions(baseline, current, threshold=0.25) == [Regression("slow", 10.0, 15.0)]
+
+
+def test_compare_command_exits_non_zero_on_regression(tmp_path: Path) -> None:
+    baseline = tmp_path / "baseline.json"
+    current = tmp_path / "current.json"
+    baseline.write_text(results_to_json({"p/Solver": Timing.from_seconds([0.001])}, [], 0, 1))
+    current.write_text(results_to_json({"p/Solver": Timing.from_seconds([0.002])}, [], 0, 1))
+
+    assert main(["compare", str(baseline), str(baseline)]) == 0
+    assert main(["compare", str(baseline), str(current)]) == 1
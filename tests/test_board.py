@@ -120,3 +120,26 @@ def test_adjacent_mines_range() -> None:
         tile = board.tile_at(Coord(x, y))
         if not tile.is_mine:
             assert 0 <= tile.adjacent_mines <= 8
+
+
+def test_version_changes_with_every_state_change() -> None:
+    board = Board(GameConfig(width=3, height=3, num_mines=1), FixedSampleRandom([Coord(0, 0)]))
+    start = board.version
+
+    board.set_state(Coord(2, 2), TileState.FLAGGED)
+    flagged = board.version
+    board.relocate_mine(Coord(0, 0))
+
+    assert start < flagged < board.version
+
+
+def test_state_counts_follow_state_changes() -> None:
+    board = Board(GameConfig(width=3, height=3, num_mines=1), FixedSampleRandom([Coord(0, 0)]))
+
+    board.set_state(Coord(2, 2), TileState.FLAGGED)
+    board.set_state(Coord(1, 1), TileState.REVEALED)
+    board.set_state(Coord(2, 2), TileState.HIDDEN)
+
+    assert board.state_counts[TileState.HIDDEN] == 8
+    assert board.state_counts[TileState.REVEALED] == 1
+    assert board.state_counts[TileState.FLAGGED] == 0
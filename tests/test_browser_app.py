@@ -358,3 +358,26 @@ def test_browser_app_waits_for_changed_snapshot_after_executing_moves() -> None:
             ),
         )
     ]
+
+
+def test_browser_app_exposes_strategy_stats_and_reports_them_at_session_end() -> None:
+    bridge = BrowserBridgeServer()
+    session_id = "tab-123"
+    bridge.register_session(session_id)
+    bridge.receive_snapshot_message(session_id, hidden_snapshot().to_dict())
+    messages: list[str] = []
+
+    app = BrowserApp(
+        session_id=session_id,
+        bridge=bridge,
+        board_reader=FakeDomReader(),
+        executor=DomMoveExecutor(session_id=session_id, send=lambda _command: None),
+        strategies=[FakeStrategy("Empty", [])],
+        output=messages.append,
+    )
+
+    app.run()
+
+    assert [(stats.name, stats.calls, stats.hits) for stats in app.strategy_stats] == [("Empty", 1, 0)]
+    assert messages[-2] == "Strategy stats:"
+    assert messages[-1].startswith("  Empty: 1 calls, 0.0% hit rate, 0 moves")
@@ -0,0 +1,115 @@
+import pytest
+
+from minesweeper.ai.analyzer import AnalyzedBoard
+from minesweeper.ai.coord_set import CoordSet
+from minesweeper.domain.types import Coord
+
+
+def test_membership_length_and_sorted_iteration() -> None:
+    coords = {Coord(2, 0), Coord(0, 1), Coord(0, 0), Coord(1, 2)}
+    coord_set = CoordSet.from_coords(3, 3, coords)
+
+    assert len(coord_set) == 4
+    assert list(coord_set) == sorted(coords)
+    assert Coord(1, 2) in coord_set
+    assert Coord(1, 1) not in coord_set
+    assert Coord(-1, 0) not in coord_set
+    assert Coord(3, 0) not in coord_set
+
+
+def test_equals_and_hashes_like_a_frozenset() -> None:
+    coords = frozenset({Coord(0, 0), Coord(1, 1)})
+    coord_set = CoordSet.from_coords(2, 2, coords)
+
+    assert coord_set == coords
+    assert coords == coord_set
+    assert hash(coord_set) == hash(coords)
+    assert coord_set == CoordSet.from_coords(2, 2, coords)
+    assert coord_set != CoordSet.from_coords(2, 2, {Coord(0, 0)})
+
+
+def test_set_algebra_keeps_the_board_shape() -> None:
+    left = CoordSet.from_coords(3, 2, {Coord(0, 0), Coord(1, 0), Coord(2, 1)})
+    right = CoordSet.from_coords(3, 2, {Coord(1, 0), Coord(0, 1)})
+
+    assert left & right == {Coord(1, 0)}
+    assert left | right == {Coord(0, 0), Coord(1, 0), Coord(2, 1), Coord(0, 1)}
+    assert left - right == {Coord(0, 0), Coord(2, 1)}
+    assert left ^ right == {Coord(0, 0), Coord(2, 1), Coord(0, 1)}
+    assert isinstance(left - right, CoordSet)
+    assert not left.isdisjoint(right)
+    assert (left & right) <= left
+    assert left - {Coord(0, 0)} == {Coord(1, 0), Coord(2, 1)}
+
+
+def test_without_drops_coords_and_ignores_outsiders() -> None:
+    coord_set = CoordSet.from_coords(2, 2, {Coord(0, 0), Coord(1, 1)})
+
+    assert coord_set.without(Coord(0, 0), Coord(5, 5)) == {Coord(1, 1)}
+    assert coord_set == {Coord(0, 0), Coord(1, 1)}
+
+
+def test_neighbor_helpers_respect_board_edges() -> None:
+    coord_set = CoordSet.from_coords(3, 3, {Coord(0, 0), Coord(1, 0), Coord(1, 1), Coord(2, 2)})
+
+    assert coord_set.neighbors_in(Coord(0, 1)) == [Coord(0, 0), Coord(1, 0), Coord(1, 1)]
+    assert coord_set.neighbors_in(Coord(1, 1)) == [Coord(0, 0), Coord(1, 0), Coord(2, 2)]
+    assert coord_set.count_neighbors(Coord(2, 0)) == 2
+    assert coord_set.count_neighbors(Coord(5, 5)) == 0
+
+
+def test_origin_allows_negative_coordinates() -> None:
+    coord_set = CoordSet.from_coords(2, 2, {Coord(-1, -1), Coord(0, 0)}, origin=Coord(-1, -1))
+
+    assert list(coord_set) == [Coord(-1, -1), Coord(0, 0)]
+    assert coord_set.neighbors_in(Coord(-1, 0)) == [Coord(-1, -1), Coord(0, 0)]
+
+
+def test_rejects_coords_off_the_board() -> None:
+    with pytest.raises(ValueError, match="outside"):
+        CoordSet.from_coords(2, 2, {Coord(2, 0)})
+
+
+def test_analyzed_board_stores_plain_sets_as_coord_sets() -> None:
+    analysis = AnalyzedBoard(
+        grid={Coord(0, 0): 1},
+        unknown_coords=frozenset({Coord(1, 0), Coord(1, 1)}),
+        flagged_coords=frozenset({Coord(0, 1)}),
+        width=2,
+        height=2,
+    )
+
+    assert isinstance(analysis.unknown_coords, CoordSet)
+    assert isinstance(analysis.flagged_coords, CoordSet)
+    assert analysis.unknown_coords == {Coord(1, 0), Coord(1, 1)}
+    assert analysis.flagged_coords.count_neighbors(Coord(0, 0)) == 1
+
+
+def test_mixed_algebra_falls_back_to_plain_frozensets() -> None:
+    coord_set = CoordSet.from_coords(3, 3, {Coord(0, 0), Coord(1, 1)})
+    outside = {Coord(-1, 0), Coord(5, 5)}
+
+    assert set(Coord(0, 0).neighbors()) - coord_set == set(Coord(0, 0).neighbors()) - {Coord(1, 1)}
+    assert {Coord(-1, 0)} - coord_set == {Coord(-1, 0)}
+    assert frozenset(outside) | coord_set == outside | {Coord(0, 0), Coord(1, 1)}
+    assert coord_set | {Coord(5, 5)} == {Coord(0, 0), Coord(1, 1), Coord(5, 5)}
+    assert {Coord(0, 0), Coord(5, 5)} & coord_set == {Coord(0, 0)}
+    assert {Coord(0, 0), Coord(5, 5)} ^ coord_set == {Coord(1, 1), Coord(5, 5)}
+    assert coord_set - CoordSet.from_coords(2, 2, {Coord(0, 0)}) == {Coord(1, 1)}
+    for result in (
+        {Coord(-1, 0)} - coord_set,
+        frozenset(outside) | coord_set,
+        coord_set & {Coord(0, 0)},
+        coord_set ^ CoordSet(4, 4),
+    ):
+        assert type(result) is frozenset
+
+
+def test_membership_of_other_values_is_false() -> None:
+    coord_set = CoordSet.from_coords(2, 2, {Coord(0, 0)})
+
+    assert (0, 0) in coord_set
+    assert "ab" not in coord_set
+    assert ("a", 1) not in coord_set
+    assert None not in coord_set
+    assert (0, 0, 0) not in coord_set
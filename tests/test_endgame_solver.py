@@ -0,0 +1,101 @@
+import threading
+
+from minesweeper.ai.analyzer import AnalyzedBoard
+from minesweeper.ai.strategies.endgame_solver import EndgameSolver
+from minesweeper.ai.strategies.probability_solver import ProbabilitySolver
+from minesweeper.domain.types import ActionType, Coord
+
+
+def _analysis(rows: list[str], total_mines: int) -> AnalyzedBoard:
+    """`#` is unknown, `F` a flag and digits are revealed numbers."""
+    grid: dict[Coord, int] = {}
+    for y, row in enumerate(rows):
+        for x, symbol in enumerate(row):
+            if symbol == "#":
+                grid[Coord(x, y)] = AnalyzedBoard.UNKNOWN
+            elif symbol == "F":
+                grid[Coord(x, y)] = AnalyzedBoard.FLAGGED
+            else:
+                grid[Coord(x, y)] = int(symbol)
+
+    return AnalyzedBoard(
+        grid=grid,
+        frontier=[coord for coord, value in grid.items() if value > 0],
+        unknown_coords=frozenset(coord for coord, value in grid.items() if value == AnalyzedBoard.UNKNOWN),
+        flagged_coords=frozenset(coord for coord, value in grid.items() if value == AnalyzedBoard.FLAGGED),
+        total_mines=total_mines,
+        width=len(rows[0]),
+        height=len(rows),
+    )
+
+
+def test_prefers_win_probability_over_single_step_survival() -> None:
+    # Five layouts fit. (2,1) and (4,0) survive 4/5 but then leave a blind
+    # 50/50 behind a second one (win 1/5). (0,0) survives only 3/5 but its
+    # number settles the left pair (win 2/5).
+    analysis = _analysis(["#11##", "#1##1"], total_mines=2)
+
+    assert EndgameSolver().find_moves(analysis) == [(ActionType.REVEAL, Coord(0, 0))]
+    assert ProbabilitySolver().find_moves(analysis)[0].coord in {Coord(2, 1), Coord(4, 0)}
+
+
+def test_uses_exact_mine_count_to_settle_unconstrained_tiles() -> None:
+    # The 1 needs one mine among its two unknowns; with only one mine left
+    # the unconstrained corner tiles must be safe.
+    analysis = _analysis(["##1##"], total_mines=1)
+
+    assert EndgameSolver().find_moves(analysis) == [
+        (ActionType.REVEAL, Coord(0, 0)),
+        (ActionType.REVEAL, Coord(4, 0)),
+    ]
+
+
+def test_flags_mines_of_a_unique_layout() -> None:
+    analysis = _analysis(["#1", "11"], total_mines=1)
+
+    assert EndgameSolver().find_moves(analysis) == [(ActionType.FLAG, Coord(0, 0))]
+
+
+def test_accounts_for_flags_in_remaining_mine_count() -> None:
+    analysis = _analysis(["F#", "##"], total_mines=1)
+
+    assert EndgameSolver().find_moves(analysis) == [
+        (ActionType.REVEAL, Coord(0, 1)),
+        (ActionType.REVEAL, Coord(1, 0)),
+        (ActionType.REVEAL, Coord(1, 1)),
+    ]
+
+
+def test_defers_when_too_many_unknowns_remain() -> None:
+    analysis = _analysis(["##1##"], total_mines=1)
+
+    assert EndgameSolver(max_unknowns=3).find_moves(analysis) == []
+
+
+def test_defers_when_search_budget_is_exhausted() -> None:
+    analysis = _analysis(["#11##", "#1##1"], total_mines=2)
+
+    assert EndgameSolver(max_search_nodes=0).find_moves(analysis) == []
+
+
+def test_defers_when_no_layout_fits() -> None:
+    analysis = _analysis(["#1#"], total_mines=0)
+
+    assert EndgameSolver().find_moves(analysis) == []
+
+
+def test_overlapping_calls_on_one_instance_agree() -> None:
+    solver = EndgameSolver()
+    analysis = _analysis(["#11##", "#1##1"], total_mines=2)
+    results = []
+
+    def solve() -> None:
+        results.append(solver.find_moves(analysis))
+
+    threads = [threading.Thread(target=solve) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [[(ActionType.REVEAL, Coord(0, 0))]] * 4
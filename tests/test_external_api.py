@@ -1,5 +1,8 @@
 from pathlib import Path
 
+import pytest
+
+from minesweeper.domain.types import Coord
 from minesweeper.external.calibration import CalibrationResult
 from minesweeper.external.api import calibrate, read_once, run
 from minesweeper.external.config import DiagnosticsConfig, RetryPolicy, TimingConfig
@@ -80,11 +83,50 @@ def test_run_applies_adapter_timing_and_classifier_overrides(monkeypatch) -> Non
     assert reason == "no moves available"
     assert recorded["classifier_config_called"] is True
     assert recorded["timing_config_called"] is True
-    assert recorded["classifier_kwargs"] == {"background_threshold": 12.0}
+    assert recorded["classifier_kwargs"] == {"memo": None, "background_threshold": 12.0}
     assert recorded["settle_delay_ms"] == 50
     assert recorded["click_delay_ms"] == 25
 
 
+def test_run_persists_the_classification_memo_per_calibration(monkeypatch, tmp_path: Path) -> None:
+    numpy = pytest.importorskip("numpy")
+    profiles = ColorProfiles(
+        hidden_bg=(20, 20, 20),
+        revealed_bg=(220, 220, 220),
+        flagged_bg=None,
+        number_colors={},
+        mine_bg=None,
+    )
+    calibration = CalibrationResult(
+        board_region=ScreenRegion(0, 0, 10, 10),
+        tile_size=TileSize(10, 10),
+        width=1,
+        height=1,
+        num_mines=1,
+        profiles=profiles,
+    )
+    classifiers = []
+
+    class StubExternalApp:
+        def __init__(self, calibration, settle_delay_ms, classifier=None, **kwargs) -> None:
+            classifiers.append(classifier)
+
+        def run(self) -> str:
+            tile = numpy.full((10, 10, 3), profiles.hidden_bg, dtype=numpy.uint8)
+            classifiers[-1].classify(tile, Coord(0, 0))
+            return "no moves available"
+
+    monkeypatch.setattr("minesweeper.external.api.ExternalApp", StubExternalApp)
+
+    run(calibration=calibration, classification_memo_dir=tmp_path)
+    run(calibration=calibration, classification_memo_dir=tmp_path)
+
+    assert [path.parent for path in tmp_path.iterdir()] == [tmp_path]
+    first, second = (classifier.memo for classifier in classifiers)
+    assert (len(first), first.hits) == (1, 0)
+    assert (len(second), second.hits) == (1, 1)
+
+
 def test_run_writes_failure_artifacts_in_failure_only_mode(tmp_path: Path) -> None:
     class ExplodingBoardReader:
         width = 1
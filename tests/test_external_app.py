@@ -4,6 +4,7 @@ from minesweeper.domain.move import Move
 from minesweeper.domain.tile import Tile
 from minesweeper.domain.types import ActionType, Coord, TileState
 from minesweeper.external.app import ExternalApp
+from minesweeper.external.board_reader import TileCacheStats
 from minesweeper.external.calibration import CalibrationResult
 from minesweeper.external.capture import ScreenRegion, TileSize
 from minesweeper.external.classifier import ColorProfiles
@@ -243,10 +244,12 @@ def test_external_app_logs_no_moves_stop_when_output_is_enabled() -> None:
 
     reason = app.run()
 
-    assert messages == [
+    assert messages[:2] == [
         "External: refreshing board snapshot",
         "External: no moves available; stopping",
     ]
+    assert messages[2] == "Strategy stats:"
+    assert messages[3].startswith("  Empty: 1 calls, 0.0% hit rate, 0 moves")
     assert reason == STOP_REASONS.no_moves_available
 
 
@@ -268,7 +271,7 @@ def test_external_app_logs_unchanged_board_retry_and_stop() -> None:
 
     reason = app.run()
 
-    assert messages == [
+    assert messages[:-2] == [
         "External: refreshing board snapshot",
         "External: using Reveal with 1 move",
         "External: executing batch 0 with 1 move before next refresh",
@@ -277,6 +280,7 @@ def test_external_app_logs_unchanged_board_retry_and_stop() -> None:
         "External: refreshing board snapshot",
         "External: board unchanged after retry; stopping",
     ]
+    assert messages[-2] == "Strategy stats:"
     assert reason == STOP_REASONS.board_unchanged_after_retry
 
 
@@ -618,3 +622,49 @@ def test_external_app_passes_calibration_grid_to_default_runtime_components(monk
 
     assert board_reader_kwargs["grid"] == calibration_result.grid
     assert executor_kwargs["grid"] == calibration_result.grid
+
+
+def test_external_app_exposes_strategy_stats_and_reports_them_at_session_end() -> None:
+    hidden = {Coord(0, 0): Tile(Coord(0, 0), TileState.HIDDEN, False)}
+    revealed = {Coord(0, 0): Tile(Coord(0, 0), TileState.REVEALED, False, 0)}
+    board_reader = FakeBoardReader([hidden, revealed])
+    messages: list[str] = []
+
+    app = ExternalApp(
+        calibration(),
+        board_reader=board_reader,
+        analyzer=FakeAnalyzer(),
+        executor=RecordingExecutor(),
+        strategies=[FakeStrategy("Empty", []), FakeStrategy("Reveal", [Move(ActionType.REVEAL, Coord(0, 0))])],
+        sleep=lambda _seconds: None,
+        output=lambda message: messages.append(message),
+    )
+
+    app.run()
+
+    assert [(stats.name, stats.calls, stats.hits, stats.moves) for stats in app.strategy_stats] == [
+        ("Empty", 1, 0, 0),
+        ("Reveal", 1, 1, 1),
+    ]
+    assert messages[-3] == "Strategy stats:"
+    assert messages[-2].startswith("  Empty: 1 calls, 0.0% hit rate, 0 moves")
+    assert messages[-1].startswith("  Reveal: 1 calls, 100.0% hit rate, 1 moves")
+
+
+def test_external_app_reports_tile_cache_reuse_at_session_end() -> None:
+    revealed = {Coord(0, 0): Tile(Coord(0, 0), TileState.REVEALED, False, 0)}
+    board_reader = FakeBoardReader([revealed])
+    board_reader.cache_stats = TileCacheStats(tiles=480, reused=432)  # type: ignore[attr-defined]
+    messages: list[str] = []
+
+    ExternalApp(
+        calibration(),
+        board_reader=board_reader,
+        analyzer=FakeAnalyzer(),
+        executor=RecordingExecutor(),
+        strategies=[],
+        sleep=lambda _seconds: None,
+        output=lambda message: messages.append(message),
+    ).run()
+
+    assert messages[-1] == "Tile cache: reused 432/480 tiles (90.0%)"
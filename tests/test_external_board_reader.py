@@ -2,12 +2,14 @@ from pathlib import Path
 
 import pytest
 
+import minesweeper.external.classifier as classifier_module
 from minesweeper.domain.move import Move
 from minesweeper.domain.types import ActionType
 from minesweeper.domain.tile import Tile
 from minesweeper.domain.types import Coord, TileState
-from minesweeper.external.board_reader import ScreenBoardReader
-from minesweeper.external.capture import ScreenRegion, TileSize
+from minesweeper.external.board_reader import ScreenBoardReader, TileCacheStats
+from minesweeper.external.capture import CaptureFrame, ScreenRegion, TileSize
+from minesweeper.external.classifier import ClassificationMemo, ColorProfiles, TileClassifier
 from minesweeper.external.errors import BoardReadError
 from minesweeper.external.grid import TileGrid
 
@@ -113,6 +115,71 @@ def test_refresh_uses_per_tile_rects_from_empirical_grid() -> None:
     }
 
 
+def test_refresh_classifies_capture_frames_as_a_whole_board() -> None:
+    numpy = pytest.importorskip("numpy")
+    frame = CaptureFrame(numpy.zeros((61, 63, 3), dtype=numpy.uint8))
+    grid = TileGrid(origin_left=12, origin_top=20, col_boundaries=(0, 31, 63), row_boundaries=(0, 30, 61))
+    received: list[tuple[object, TileGrid, tuple[int, int]]] = []
+
+    class BoardClassifier:
+        def classify_board(
+            self, pixels, board_grid: TileGrid, offset: tuple[int, int], digests: dict[Coord, bytes] | None = None
+        ) -> dict[Coord, Tile]:
+            received.append((pixels, board_grid, offset))
+            return {
+                Coord(x, y): Tile(coord=Coord(x, y), state=TileState.HIDDEN, is_mine=False)
+                for x in range(2)
+                for y in range(2)
+            }
+
+    reader = ScreenBoardReader(
+        capture=FakeCapture(frame),
+        classifier=BoardClassifier(),
+        board_region=ScreenRegion(10, 20, 65, 61),
+        tile_size=TileSize(31, 30),
+        width=2,
+        height=2,
+        num_mines=3,
+        grid=grid,
+    )
+    reader.remember_moves([Move(ActionType.FLAG, Coord(1, 1))])
+
+    reader.refresh()
+
+    assert received == [(frame, grid, (2, 0))]
+    assert reader.tile_at(Coord(1, 1)).state == TileState.FLAGGED
+
+
+def test_refresh_builds_a_regular_grid_for_capture_frames_without_one() -> None:
+    numpy = pytest.importorskip("numpy")
+    grids: list[TileGrid] = []
+
+    class BoardClassifier:
+        def classify_board(
+            self, pixels, board_grid: TileGrid, offset: tuple[int, int], digests: dict[Coord, bytes] | None = None
+        ) -> dict[Coord, Tile]:
+            grids.append(board_grid)
+            return {
+                Coord(x, y): Tile(coord=Coord(x, y), state=TileState.HIDDEN, is_mine=False)
+                for x in range(3)
+                for y in range(2)
+            }
+
+    reader = ScreenBoardReader(
+        capture=FakeCapture(CaptureFrame(numpy.zeros((8, 12, 3), dtype=numpy.uint8))),
+        classifier=BoardClassifier(),
+        board_region=ScreenRegion(10, 20, 12, 8),
+        tile_size=TileSize(4, 4),
+        width=3,
+        height=2,
+        num_mines=1,
+    )
+
+    reader.refresh()
+
+    assert grids == [TileGrid(10, 20, (0, 4, 8, 12), (0, 4, 8))]
+
+
 def test_tile_at_uses_cached_snapshot_after_refresh() -> None:
     capture = FakeCapture(DummyBoardPixels(4, 4))
     classifier = RecordingClassifier()
@@ -316,3 +383,96 @@ def test_save_move_overlay_uses_latest_snapshot_and_tile_bounds(tmp_path: Path)
             },
         )
     ]
+
+
+class CountingArrayClassifier:
+    def __init__(self) -> None:
+        self.board_calls = 0
+        self.tile_calls: list[Coord] = []
+
+    def classify_board(
+        self, pixels, board_grid: TileGrid, offset: tuple[int, int], digests: dict[Coord, bytes] | None = None
+    ) -> dict[Coord, Tile]:
+        self.board_calls += 1
+        frame = pixels.pixels
+        return {
+            coord: self._tile(frame[coord.y * 4:(coord.y + 1) * 4, coord.x * 4:(coord.x + 1) * 4], coord)
+            for coord in (Coord(x, y) for x in range(board_grid.width) for y in range(board_grid.height))
+        }
+
+    def classify(self, pixels, coord: Coord, digest: bytes | None = None) -> Tile:
+        self.tile_calls.append(coord)
+        return self._tile(pixels, coord)
+
+    def _tile(self, pixels, coord: Coord) -> Tile:
+        if pixels.any():
+            return Tile(coord=coord, state=TileState.REVEALED, is_mine=False, adjacent_mines=0)
+        return Tile(coord=coord, state=TileState.HIDDEN, is_mine=False)
+
+
+def cached_reader(board, classifier: CountingArrayClassifier) -> ScreenBoardReader:
+    return ScreenBoardReader(
+        capture=FakeCapture(CaptureFrame(board)),
+        classifier=classifier,
+        board_region=ScreenRegion(0, 0, 40, 12),
+        tile_size=TileSize(4, 4),
+        width=10,
+        height=3,
+        num_mines=5,
+    )
+
+
+def test_refresh_reuses_tiles_whose_pixels_did_not_change() -> None:
+    numpy = pytest.importorskip("numpy")
+    board = numpy.zeros((12, 40, 3), dtype=numpy.uint8)
+    classifier = CountingArrayClassifier()
+    reader = cached_reader(board, classifier)
+
+    reader.refresh()
+    reader.refresh()
+    board[4:8, 8:12] = 200
+    reader.refresh()
+
+    assert classifier.board_calls == 1
+    assert classifier.tile_calls == [Coord(2, 1)]
+    assert reader.tile_at(Coord(2, 1)).state == TileState.REVEALED
+    assert reader.tile_at(Coord(3, 1)).state == TileState.HIDDEN
+    assert reader.cache_stats == TileCacheStats(tiles=90, reused=59)
+    assert reader.cache_stats.describe() == "Tile cache: reused 59/90 tiles (65.6%)"
+
+
+def test_refresh_reclassifies_the_whole_board_when_many_tiles_changed() -> None:
+    numpy = pytest.importorskip("numpy")
+    board = numpy.zeros((12, 40, 3), dtype=numpy.uint8)
+    classifier = CountingArrayClassifier()
+    reader = cached_reader(board, classifier)
+
+    reader.refresh()
+    board[0:4] = 200
+    reader.refresh()
+
+    assert classifier.board_calls == 2
+    assert classifier.tile_calls == []
+    assert reader.tile_at(Coord(9, 0)).state == TileState.REVEALED
+
+
+def test_refresh_shares_its_tile_digests_with_the_classification_memo(monkeypatch) -> None:
+    numpy = pytest.importorskip("numpy")
+    profiles = ColorProfiles((0, 0, 0), (200, 200, 200), None, {}, None)
+    board = numpy.zeros((12, 40, 3), dtype=numpy.uint8)
+    board[:, 20:] = profiles.revealed_bg
+    memo = ClassificationMemo()
+    first = cached_reader(board, TileClassifier(profiles, memo=memo))
+    first.refresh()
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("memoized tiles should not be sampled")
+
+    monkeypatch.setattr(classifier_module, "sample_board", fail)
+    monkeypatch.setattr(classifier_module, "sample_center", fail)
+    second = cached_reader(board, TileClassifier(profiles, memo=memo))
+    second.refresh()
+
+    assert len(memo) == 2
+    assert second.tile_at(Coord(4, 2)).state == TileState.HIDDEN
+    assert second.tile_at(Coord(5, 0)).state == TileState.REVEALED
@@ -17,7 +17,7 @@ from minesweeper.external.calibration import (
     _wait_for_guarded_click,
 )
 from minesweeper.domain.types import Coord
-from minesweeper.external.capture import ScreenRegion, TileSize
+from minesweeper.external.capture import CaptureFrame, ScreenRegion, TileSize
 from minesweeper.external.classifier import ColorProfiles
 from minesweeper.external.grid import TileGrid
 
@@ -681,6 +681,23 @@ def test_calibration_detects_changed_tiles_between_snapshots() -> None:
     assert changed == [Coord(1, 1)]
 
 
+def test_calibration_compares_capture_frames_tile_by_tile() -> None:
+    numpy = pytest.importorskip("numpy")
+    before = numpy.full((4, 4, 3), 30, dtype=numpy.uint8)
+    after = before.copy()
+    after[0:2, 2:4] = 200
+
+    changed = _changed_tiles(
+        before_pixels=CaptureFrame(before),
+        after_pixels=CaptureFrame(after),
+        width=2,
+        height=2,
+        tile_size=TileSize(2, 2),
+    )
+
+    assert changed == [Coord(1, 0)]
+
+
 def test_live_profile_builder_learns_hidden_and_revealed_backgrounds() -> None:
     before = FakePixelGrid(
         [
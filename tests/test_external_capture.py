@@ -1,7 +1,14 @@
 import pytest
 
 from minesweeper.domain.types import Coord
-from minesweeper.external.capture import CaptureError, ScreenCapture, ScreenRegion, TileSize
+from minesweeper.external.capture import (
+    CaptureError,
+    CaptureFrame,
+    ScreenCapture,
+    ScreenRegion,
+    TileSize,
+    pixel_array,
+)
 
 
 class StubMSS:
@@ -93,3 +100,64 @@ def test_grab_rejects_region_outside_screen_bounds() -> None:
 
     with pytest.raises(ValueError, match="outside screen bounds"):
         capture.grab(ScreenRegion(90, 70, 20, 20))
+
+
+class StubShot:
+    def __init__(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        self.raw = bytearray(
+            value
+            for y in range(height)
+            for x in range(width)
+            for value in (x, y, 200, 255)
+        )
+
+
+class StubShotMSS(StubMSS):
+    def __init__(self) -> None:
+        super().__init__()
+        self.shots: list[StubShot] = []
+
+    def grab(self, region: dict[str, int]) -> StubShot:
+        self.regions.append(region)
+        self.shots.append(StubShot(region["width"], region["height"]))
+        return self.shots[-1]
+
+
+def test_array_frames_view_the_mss_bgra_buffer_as_rgb() -> None:
+    pytest.importorskip("numpy")
+    backend = StubShotMSS()
+    capture = ScreenCapture(mss_factory=lambda: backend, array_frames=True)
+
+    frame = capture.grab(ScreenRegion(0, 0, 4, 3))
+
+    assert isinstance(frame, CaptureFrame)
+    assert frame.size == (4, 3)
+    assert frame.getpixel((3, 2)) == (200, 2, 3)
+    assert frame.pixels.shape == (3, 4, 3)
+    assert frame.crop(1, 1, 2, 2).tolist() == [
+        [[200, 1, 1], [200, 1, 2]],
+        [[200, 2, 1], [200, 2, 2]],
+    ]
+
+    backend.shots[0].raw[0:3] = b"\x09\x08\x07"
+    assert frame.getpixel((0, 0)) == (7, 8, 9)
+
+
+def test_array_frames_fall_back_to_backend_images_without_numpy() -> None:
+    capture = ScreenCapture(mss_factory=StubShotMSS, array_frames=True, numpy_loader=lambda: None)
+
+    shot = capture.grab(ScreenRegion(0, 0, 4, 3))
+
+    assert isinstance(shot, StubShot)
+
+
+def test_pixel_array_accepts_frames_and_tile_views_only() -> None:
+    numpy = pytest.importorskip("numpy")
+    pixels = numpy.zeros((3, 4, 3), dtype=numpy.uint8)
+    frame = CaptureFrame(pixels)
+
+    assert pixel_array(frame) is pixels
+    assert pixel_array(frame.crop(0, 0, 2, 2)) is not None
+    assert pixel_array(StubShot(2, 2)) is None
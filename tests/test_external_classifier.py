@@ -1,8 +1,20 @@
 import pytest
 
+import minesweeper.external.classifier as classifier_module
 from minesweeper.domain.types import Coord, TileState
 from minesweeper.external.errors import BoardReadError
-from minesweeper.external.classifier import ColorProfiles, TileClassifier, color_distance
+from minesweeper.external.capture import CaptureFrame
+from minesweeper.external.classifier import (
+    ClassificationMemo,
+    ColorProfiles,
+    TileClassifier,
+    color_distance,
+    sample_accent,
+    sample_background,
+    sample_board,
+    sample_center,
+)
+from minesweeper.external.grid import TileGrid
 
 
 class FakePixelGrid:
@@ -219,3 +231,271 @@ def test_classifier_uses_site_palette_for_numbers_when_calibration_has_not_seen_
 
     assert tile.state == TileState.REVEALED
     assert tile.adjacent_mines == 1
+
+
+@pytest.mark.parametrize(
+    "tile",
+    [
+        make_tile(background=(220, 220, 220), center=(0, 0, 255), size=9),
+        make_tile_with_accent((180, 181, 181), (0, 128, 0), accent_origin=(5, 2), accent_size=3),
+        make_tile_with_outer_frame((189, 189, 189), frame=(255, 255, 255)),
+    ],
+)
+def test_samplers_read_array_tiles_like_pixel_grids(tile: FakePixelGrid) -> None:
+    numpy = pytest.importorskip("numpy")
+    array = numpy.array(tile._pixels, dtype=numpy.uint8)
+    background = sample_background(tile)
+
+    assert sample_background(array) == background
+    assert sample_center(array) == sample_center(tile)
+    assert sample_accent(array, background) == sample_accent(tile, background)
+
+
+def test_classifier_reads_array_slices_of_a_capture_frame() -> None:
+    numpy = pytest.importorskip("numpy")
+    profiles = ColorProfiles(
+        hidden_bg=(189, 189, 189),
+        revealed_bg=(180, 181, 181),
+        flagged_bg=None,
+        number_colors={},
+        mine_bg=None,
+    )
+    board = numpy.zeros((9, 18, 3), dtype=numpy.uint8)
+    board[:, :9] = profiles.hidden_bg
+    board[:, 9:] = profiles.revealed_bg
+    board[3:6, 12:15] = (0, 128, 0)
+    classifier = TileClassifier(profiles)
+
+    hidden = classifier.classify(board[:, :9], Coord(0, 0))
+    number = classifier.classify(board[:, 9:], Coord(1, 0))
+
+    assert hidden.state == TileState.HIDDEN
+    assert (number.state, number.adjacent_mines) == (TileState.REVEALED, 2)
+
+
+SITE_PROFILES = ColorProfiles(
+    hidden_bg=(189, 189, 189),
+    revealed_bg=(180, 181, 181),
+    flagged_bg=None,
+    number_colors={},
+    mine_bg=None,
+)
+UNEVEN_GRID = TileGrid(origin_left=0, origin_top=0, col_boundaries=(1, 10, 20, 29), row_boundaries=(2, 11, 21))
+
+
+def uneven_board():
+    numpy = pytest.importorskip("numpy")
+    board = numpy.full((23, 31, 3), (90, 90, 90), dtype=numpy.uint8)
+    board[2:11, 1:10] = SITE_PROFILES.hidden_bg
+    board[2:11, 10:20] = SITE_PROFILES.revealed_bg
+    board[5:8, 14:16] = (0, 0, 255)
+    board[2:11, 20:29] = SITE_PROFILES.revealed_bg
+    board[11:21, 1:10] = SITE_PROFILES.hidden_bg
+    board[14:18, 4:7] = (220, 0, 0)
+    board[11:21, 10:20] = SITE_PROFILES.revealed_bg
+    board[13:19, 13:17] = (0, 128, 0)
+    board[14:16, 14:15] = (255, 0, 0)
+    board[11:21, 20:29] = SITE_PROFILES.revealed_bg
+    return board
+
+
+def test_sample_board_matches_per_tile_samples_on_an_uneven_grid() -> None:
+    board = uneven_board()
+
+    samples = sample_board(CaptureFrame(board), UNEVEN_GRID)
+
+    for y in range(UNEVEN_GRID.height):
+        for x in range(UNEVEN_GRID.width):
+            rect = UNEVEN_GRID.tile_rect(Coord(x, y))
+            tile = board[rect.top:rect.top + rect.height, rect.left:rect.left + rect.width]
+            background = sample_background(tile)
+            assert samples.backgrounds[y][x] == background
+            assert samples.centers[y][x] == sample_center(tile)
+            assert samples.accents[y][x] == sample_accent(tile, background)
+
+
+
+@pytest.mark.parametrize("tile_width", [1, 2, 3])
+def test_sample_board_matches_per_tile_samples_on_tiles_narrower_than_the_patch(tile_width: int) -> None:
+    numpy = pytest.importorskip("numpy")
+    grid = TileGrid(
+        origin_left=0,
+        origin_top=0,
+        col_boundaries=tuple(range(0, tile_width * 4 + 1, tile_width)),
+        row_boundaries=(0, 2, 5),
+    )
+    board = numpy.random.default_rng(tile_width).integers(0, 256, (5, tile_width * 4, 3), dtype=numpy.uint8)
+
+    samples = sample_board(board, grid)
+
+    for y in range(grid.height):
+        for x in range(grid.width):
+            rect = grid.tile_rect(Coord(x, y))
+            tile = board[rect.top:rect.top + rect.height, rect.left:rect.left + rect.width]
+            background = sample_background(tile)
+            assert samples.centers[y][x] == sample_center(tile)
+            assert samples.backgrounds[y][x] == background
+            assert samples.accents[y][x] == sample_accent(tile, background)
+
+def test_classify_board_matches_classify_for_every_tile() -> None:
+    board = uneven_board()
+    classifier = TileClassifier(SITE_PROFILES)
+
+    tiles = classifier.classify_board(board, UNEVEN_GRID)
+
+    expected = {}
+    for x in range(UNEVEN_GRID.width):
+        for y in range(UNEVEN_GRID.height):
+            rect = UNEVEN_GRID.tile_rect(Coord(x, y))
+            tile = board[rect.top:rect.top + rect.height, rect.left:rect.left + rect.width]
+            expected[Coord(x, y)] = TileClassifier(SITE_PROFILES).classify(tile, Coord(x, y))
+    assert tiles == expected
+    assert [(tile.state, tile.adjacent_mines) for tile in tiles.values()] == [
+        (TileState.HIDDEN, 0),
+        (TileState.FLAGGED, 0),
+        (TileState.REVEALED, 1),
+        (TileState.REVEALED, 2),
+        (TileState.REVEALED, 0),
+        (TileState.REVEALED, 0),
+    ]
+    assert classifier.verify_number(Coord(1, 0), 1)
+
+
+def test_classify_board_offsets_the_grid_inside_a_larger_frame() -> None:
+    numpy = pytest.importorskip("numpy")
+    board = uneven_board()
+    frame = numpy.zeros((30, 40, 3), dtype=numpy.uint8)
+    frame[4:27, 6:37] = board
+
+    shifted = TileClassifier(SITE_PROFILES).classify_board(CaptureFrame(frame), UNEVEN_GRID, offset=(6, 4))
+
+    assert shifted == TileClassifier(SITE_PROFILES).classify_board(board, UNEVEN_GRID)
+
+
+def test_classify_board_rejects_untrusted_tiles() -> None:
+    board = uneven_board()
+    board[11:21, 20:29] = (40, 90, 40)
+
+    with pytest.raises(BoardReadError, match=r"untrusted tile background at Coord\(x=2, y=1\)"):
+        TileClassifier(SITE_PROFILES).classify_board(board, UNEVEN_GRID)
+
+
+def test_sample_board_needs_array_pixels() -> None:
+    with pytest.raises(ValueError, match="capture frame or an RGB array"):
+        sample_board(make_tile(background=(0, 0, 0)), UNEVEN_GRID)
+
+
+def test_classification_memo_answers_repeat_boards_without_sampling(monkeypatch) -> None:
+    board = uneven_board()
+    memo = ClassificationMemo()
+    expected = TileClassifier(SITE_PROFILES).classify_board(board, UNEVEN_GRID)
+
+    assert TileClassifier(SITE_PROFILES, memo=memo).classify_board(board, UNEVEN_GRID) == expected
+    assert len(memo) == 6
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("memoized tiles should not be sampled")
+
+    monkeypatch.setattr(classifier_module, "sample_board", fail)
+    monkeypatch.setattr(classifier_module, "sample_center", fail)
+    classifier = TileClassifier(SITE_PROFILES, memo=memo)
+
+    assert classifier.classify_board(CaptureFrame(board), UNEVEN_GRID) == expected
+    assert classifier.verify_number(Coord(1, 0), 1)
+    rect = UNEVEN_GRID.tile_rect(Coord(1, 1))
+    tile = classifier.classify(board[rect.top:rect.top + rect.height, rect.left:rect.left + rect.width], Coord(1, 1))
+    assert (tile.state, tile.adjacent_mines) == (TileState.REVEALED, 2)
+    assert (memo.hits, memo.misses) == (7, 6)
+
+
+def test_classification_memo_classifies_a_few_new_tiles_one_by_one(monkeypatch) -> None:
+    numpy = pytest.importorskip("numpy")
+    grid = TileGrid(origin_left=0, origin_top=0, col_boundaries=tuple(range(0, 100, 9)), row_boundaries=(0, 9))
+    board = numpy.zeros((9, 99, 3), dtype=numpy.uint8)
+    board[:] = SITE_PROFILES.hidden_bg
+    memo = ClassificationMemo()
+    TileClassifier(SITE_PROFILES, memo=memo).classify_board(board, grid)
+    board[:, 90:] = SITE_PROFILES.revealed_bg
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("one new tile should not sample the whole board")
+
+    monkeypatch.setattr(classifier_module, "sample_board", fail)
+    tiles = TileClassifier(SITE_PROFILES, memo=memo).classify_board(board, grid)
+
+    assert tiles[Coord(10, 0)].state == TileState.REVEALED
+    assert {tiles[Coord(x, 0)].state for x in range(10)} == {TileState.HIDDEN}
+    assert len(memo) == 2
+
+
+def test_classification_memo_is_cleared_when_profiles_change() -> None:
+    numpy = pytest.importorskip("numpy")
+    tile = numpy.zeros((9, 9, 3), dtype=numpy.uint8)
+    tile[:] = SITE_PROFILES.hidden_bg
+    memo = ClassificationMemo()
+    old = TileClassifier(SITE_PROFILES, memo=memo)
+    assert old.classify(tile, Coord(0, 0)).state == TileState.HIDDEN
+
+    swapped = SITE_PROFILES._replace(hidden_bg=SITE_PROFILES.revealed_bg, revealed_bg=SITE_PROFILES.hidden_bg)
+    assert TileClassifier(swapped, memo=memo).classify(tile, Coord(0, 0)).state == TileState.REVEALED
+    assert len(memo) == 1
+
+    assert old.classify(tile, Coord(0, 0)).state == TileState.HIDDEN
+    assert memo.hits == 0
+
+
+def test_classification_memo_is_cleared_when_full() -> None:
+    memo = ClassificationMemo(limit=2)
+    for index in range(3):
+        memo.put("site", bytes([index]), (TileState.HIDDEN, 0))
+
+    assert len(memo) == 1
+    assert memo.get("site", bytes([2])) == (TileState.HIDDEN, 0)
+    assert memo.get("site", bytes([0])) is None
+
+
+def test_classification_memo_skips_tiles_without_pixel_arrays() -> None:
+    memo = ClassificationMemo()
+
+    tile = TileClassifier(SITE_PROFILES, memo=memo).classify(make_tile(SITE_PROFILES.hidden_bg), Coord(0, 0))
+
+    assert tile.state == TileState.HIDDEN
+    assert len(memo) == 0
+
+
+def test_classification_memo_is_persisted_per_calibration(tmp_path) -> None:
+    board = uneven_board()
+    memo = ClassificationMemo(tmp_path)
+    TileClassifier(SITE_PROFILES, memo=memo).classify_board(board, UNEVEN_GRID)
+    memo.save()
+
+    restored = ClassificationMemo(tmp_path)
+    TileClassifier(SITE_PROFILES, memo=restored)
+    assert restored.path == memo.path and len(restored) == 6
+    assert ClassificationMemo.load(memo.path).to_json() == memo.to_json()
+
+    other = ClassificationMemo(tmp_path)
+    TileClassifier(SITE_PROFILES, center_threshold=5.0, memo=other)
+    assert other.path != memo.path and len(other) == 0
+
+
+
+def test_classification_memo_saves_before_switching_calibration(tmp_path) -> None:
+    memo = ClassificationMemo(tmp_path)
+    TileClassifier(SITE_PROFILES, memo=memo).classify_board(uneven_board(), UNEVEN_GRID)
+    first_path = memo.path
+
+    TileClassifier(SITE_PROFILES, center_threshold=5.0, memo=memo)
+
+    assert memo.path != first_path and len(memo) == 0
+    assert first_path is not None and len(ClassificationMemo.load(first_path)) == 6
+
+def test_classification_memo_ignores_unreadable_files(tmp_path) -> None:
+    memo = ClassificationMemo(tmp_path)
+    TileClassifier(SITE_PROFILES, memo=memo)
+    memo.path.write_text("not json", encoding="utf-8")
+
+    restored = ClassificationMemo(tmp_path)
+    TileClassifier(SITE_PROFILES, memo=restored)
+
+    assert len(restored) == 0
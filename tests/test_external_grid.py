@@ -1,5 +1,7 @@
+import pytest
+
 from minesweeper.domain.types import Coord
-from minesweeper.external.capture import ScreenRegion
+from minesweeper.external.capture import CaptureFrame, ScreenRegion
 from minesweeper.external.grid import TileGrid, detect_tile_grid
 
 
@@ -241,6 +243,18 @@ def test_detect_tile_grid_extends_minesweeperonline_lattice_when_last_edge_is_cl
     assert grid.row_boundaries == tuple(list(18 + index * 25 for index in range(16)) + [len(clipped_pixels)])
 
 
+def test_detect_tile_grid_reads_capture_frames_like_pixel_grids() -> None:
+    numpy = pytest.importorskip("numpy")
+    pixels = minesweeperonline_hidden_board(left_pad=7, top_pad=5, width_tiles=16, height_tiles=16)
+    frame = CaptureFrame(numpy.array(pixels, dtype=numpy.uint8))
+
+    assert detect_tile_grid(frame, board_left=0, board_top=0) == detect_tile_grid(
+        FakePixelGrid(pixels),
+        board_left=0,
+        board_top=0,
+    )
+
+
 def test_tile_grid_click_target_clamps_large_insets_inside_tiny_tiles() -> None:
     grid = TileGrid(
         origin_left=10,
@@ -30,3 +30,27 @@ def test_config_frozen() -> None:
 
     with pytest.raises(AttributeError):
         config.width = 50
+
+
+def test_strategy_workers_must_be_positive() -> None:
+    assert GameConfig().strategy_workers == 1
+
+    with pytest.raises(ValueError):
+        GameConfig(strategy_workers=0)
+
+
+def test_max_fps_must_be_positive() -> None:
+    assert GameConfig().max_fps == 60
+
+    with pytest.raises(ValueError):
+        GameConfig(max_fps=0)
+
+
+def test_renderer_and_game_limit_are_validated() -> None:
+    assert GameConfig().renderer == "pygame"
+    assert GameConfig().max_games is None
+
+    with pytest.raises(ValueError, match="renderer"):
+        GameConfig(renderer="curses")
+    with pytest.raises(ValueError, match="max_games"):
+        GameConfig(max_games=0)
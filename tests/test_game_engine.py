@@ -234,3 +234,97 @@ def test_reset_produces_fresh_board() -> None:
         for x in range(2)
         for y in range(2)
     )
+
+
+def test_apply_moves_reports_skipped_moves_and_continues() -> None:
+    game = Game(
+        GameConfig(width=3, height=3, num_mines=1),
+        FixedSampleRandom([Coord(2, 2)]),
+    )
+    game.apply_move(Move(ActionType.REVEAL, Coord(1, 1)))
+
+    batch = game.apply_moves(
+        [
+            Move(ActionType.REVEAL, Coord(1, 1)),
+            Move(ActionType.REVEAL, Coord(0, 0)),
+            Move(ActionType.FLAG, Coord(2, 2)),
+        ]
+    )
+
+    assert [outcome.applied for outcome in batch.outcomes] == [False, True, True]
+    assert batch.outcomes[0].skipped == "Tile is already revealed"
+    assert batch.applied == (
+        Move(ActionType.REVEAL, Coord(0, 0)),
+        Move(ActionType.FLAG, Coord(2, 2)),
+    )
+    assert set(batch.changed) >= {Coord(0, 0), Coord(2, 2)}
+
+
+def test_apply_moves_merges_changed_coords_without_duplicates() -> None:
+    game = Game(
+        GameConfig(width=3, height=3, num_mines=1),
+        FixedSampleRandom([Coord(2, 2)]),
+    )
+
+    batch = game.apply_moves(
+        [
+            Move(ActionType.FLAG, Coord(2, 2)),
+            Move(ActionType.UNFLAG, Coord(2, 2)),
+        ]
+    )
+
+    assert batch.changed == (Coord(2, 2),)
+
+
+def test_apply_moves_checks_win_once_at_end() -> None:
+    game = Game(
+        GameConfig(width=3, height=1, num_mines=1),
+        FixedSampleRandom([Coord(1, 0)]),
+    )
+
+    batch = game.apply_moves(
+        [
+            Move(ActionType.REVEAL, Coord(0, 0)),
+            Move(ActionType.REVEAL, Coord(2, 0)),
+        ]
+    )
+
+    assert len(batch.applied) == 2
+    assert game.phase == GamePhase.WON
+
+
+def test_apply_moves_skips_everything_after_a_loss() -> None:
+    game = Game(
+        GameConfig(width=4, height=1, num_mines=1),
+        FixedSampleRandom([Coord(1, 0)]),
+    )
+    game.apply_move(Move(ActionType.REVEAL, Coord(0, 0)))
+
+    batch = game.apply_moves(
+        [
+            Move(ActionType.REVEAL, Coord(1, 0)),
+            Move(ActionType.REVEAL, Coord(2, 0)),
+        ]
+    )
+
+    assert game.phase == GamePhase.LOST
+    assert batch.applied == (Move(ActionType.REVEAL, Coord(1, 0)),)
+    assert batch.skipped[0].skipped == "Cannot apply moves after the game is over"
+
+
+def test_apply_moves_does_not_lose_a_game_already_won_within_the_batch() -> None:
+    game = Game(
+        GameConfig(width=3, height=1, num_mines=1),
+        FixedSampleRandom([Coord(1, 0)]),
+    )
+    game.apply_move(Move(ActionType.REVEAL, Coord(0, 0)))
+
+    batch = game.apply_moves(
+        [
+            Move(ActionType.REVEAL, Coord(2, 0)),
+            Move(ActionType.REVEAL, Coord(1, 0)),
+        ]
+    )
+
+    assert game.phase == GamePhase.WON
+    assert batch.applied == (Move(ActionType.REVEAL, Coord(2, 0)),)
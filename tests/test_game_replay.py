@@ -0,0 +1,101 @@
+import pytest
+
+from minesweeper.bench.tournament import play_game
+from minesweeper.domain.move import Move
+from minesweeper.domain.types import ActionType, Coord, GameConfig, GamePhase, TileState
+from minesweeper.engine.game import Game
+from minesweeper.engine.replay import GameReplay, RecordedGame, load_recordings, save_recordings
+
+BEGINNER = GameConfig(width=9, height=9, num_mines=10)
+
+
+def _lost_recording() -> RecordedGame:
+    # The first beginner seed the deterministic chain loses after a dozen moves.
+    record = play_game(("PatternDetector", "ProbabilitySolver"), BEGINNER, seed=54)
+    assert not record.won
+    return RecordedGame(9, 9, 10, seed=54, moves=record.played, label="seed 54")
+
+
+def test_recordings_round_trip_through_json_lines(tmp_path) -> None:
+    games = [
+        RecordedGame(9, 9, 10, seed=3, moves=(Move(ActionType.REVEAL, Coord(4, 4)), Move(ActionType.FLAG, Coord(0, 1)))),
+        RecordedGame(30, 16, 99, seed=7, label="fast seed 7"),
+    ]
+    path = tmp_path / "losses.jsonl"
+
+    save_recordings(games, path)
+
+    assert load_recordings(path) == games
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 2
+
+
+def test_recorded_moves_must_be_valid() -> None:
+    payload = RecordedGame(9, 9, 10, seed=0).to_dict()
+    payload["moves"] = [["poke", 1, 1]]
+
+    with pytest.raises(ValueError, match="invalid recorded moves"):
+        RecordedGame.from_dict(payload)
+
+
+def test_replay_reproduces_a_recorded_loss() -> None:
+    recording = _lost_recording()
+    replay = GameReplay(recording)
+
+    replay.seek(replay.length)
+
+    assert replay.phase == GamePhase.LOST
+    assert replay.last_move is not None
+    assert replay.board.tile_at(replay.last_move.coord).state == TileState.EXPLODED
+
+
+def test_seeking_restores_the_nearest_keyframe(monkeypatch) -> None:
+    recording = _lost_recording()
+    assert len(recording.moves) >= 12
+    replay = GameReplay(recording, keyframe_interval=5)
+    applied: list[Move] = []
+    original = Game.apply_move
+
+    def counting_apply_move(game: Game, move: Move):
+        applied.append(move)
+        return original(game, move)
+
+    monkeypatch.setattr(Game, "apply_move", counting_apply_move)
+
+    replay.seek(12)
+    assert len(applied) == 12
+    revealed_at_12 = replay.board.state_counts[TileState.REVEALED]
+
+    replay.seek(7)
+    assert len(applied) == 14
+    assert replay.position == 7
+
+    replay.seek(11)
+    assert len(applied) == 15
+
+    replay.seek(12)
+    assert replay.board.state_counts[TileState.REVEALED] == revealed_at_12
+    assert replay.position == 12
+
+
+def test_seek_clamps_to_the_recording() -> None:
+    replay = GameReplay(RecordedGame(9, 9, 10, seed=0, moves=(Move(ActionType.REVEAL, Coord(4, 4)),)))
+
+    replay.seek(-3)
+    assert replay.position == 0
+    assert replay.phase == GamePhase.NOT_STARTED
+
+    replay.step(10)
+    assert replay.position == 1
+    assert replay.phase != GamePhase.NOT_STARTED
+
+
+@pytest.mark.parametrize(
+    ("key", "value"),
+    [("width", "9"), ("seed", None), ("num_mines", 1.5), ("moves", "reveal 1 1")],
+)
+def test_recordings_need_integer_sizes_and_a_move_list(key: str, value: object) -> None:
+    payload = RecordedGame(9, 9, 10, seed=0).to_dict()
+    payload[key] = value
+
+    with pytest.raises(ValueError, match="needs integer width"):
+        RecordedGame.from_dict(payload)
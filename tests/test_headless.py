@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import io
+
+import minesweeper.ui.input as input_module
+from minesweeper.domain.tile import Tile
+from minesweeper.domain.types import AI_ONLY, Coord, TileState
+from minesweeper.ui.headless import NullRenderer, TextRenderer
+from minesweeper.ui.input import QuitEvent, poll_events
+
+
+class StubBoard:
+    def __init__(self, width: int, height: int, num_mines: int, tiles: list[Tile]) -> None:
+        self.width = width
+        self.height = height
+        self.num_mines = num_mines
+        self._tiles = {tile.coord: tile for tile in tiles}
+
+    def tile_at(self, coord: Coord) -> Tile:
+        return self._tiles[coord]
+
+
+def _board() -> StubBoard:
+    return StubBoard(
+        3,
+        2,
+        2,
+        [
+            Tile(Coord(0, 0), TileState.REVEALED, False, 0),
+            Tile(Coord(1, 0), TileState.REVEALED, False, 2),
+            Tile(Coord(2, 0), TileState.FLAGGED, True),
+            Tile(Coord(0, 1), TileState.HIDDEN, False),
+            Tile(Coord(1, 1), TileState.EXPLODED, True),
+            Tile(Coord(2, 1), TileState.HIDDEN, False),
+        ],
+    )
+
+
+def test_text_renderer_prints_one_character_per_tile() -> None:
+    stream = io.StringIO()
+    renderer = TextRenderer(stream, ansi=False)
+
+    renderer.render(_board(), 0.25, AI_ONLY, True)
+
+    assert stream.getvalue() == "Mines 1 | AI Only • AI On | Win Rate 25.0%\n. 2 F\n# * #\n\n"
+
+
+def test_text_renderer_skips_unchanged_frames_until_invalidated() -> None:
+    stream = io.StringIO()
+    renderer = TextRenderer(stream, ansi=False)
+
+    renderer.render(_board(), 0.0, AI_ONLY, True)
+    renderer.render(_board(), 0.0, AI_ONLY, True)
+    assert stream.getvalue().count("Mines") == 1
+
+    renderer.render(_board(), 0.0, AI_ONLY, False)
+    renderer.invalidate()
+    renderer.render(_board(), 0.0, AI_ONLY, False)
+    assert stream.getvalue().count("Mines") == 3
+
+
+def test_text_renderer_redraws_in_place_with_ansi_colours() -> None:
+    stream = io.StringIO()
+    renderer = TextRenderer(stream, ansi=True)
+
+    renderer.render(_board(), 0.0, AI_ONLY, True)
+
+    output = stream.getvalue()
+    assert output.startswith("\x1b[H\x1b[2J")
+    assert "\x1b[32m2\x1b[0m" in output
+    assert "\x1b[1;31m*\x1b[0m" in output
+
+
+def test_headless_renderers_take_no_input() -> None:
+    for renderer in (NullRenderer(), TextRenderer(io.StringIO())):
+        assert renderer.interactive is False
+        assert renderer.board_coord_from_screen(0, 0) is None
+
+    NullRenderer().render(_board(), 0.0, AI_ONLY, True)
+
+
+def test_poll_events_only_waits_without_a_window(monkeypatch) -> None:
+    waits: list[float] = []
+    monkeypatch.setattr(input_module.time, "sleep", waits.append)
+
+    assert poll_events(AI_ONLY, NullRenderer(), timeout_ms=250) == []
+    assert waits == [0.25]
+
+    def interrupted(_seconds: float) -> None:
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(input_module.time, "sleep", interrupted)
+
+    assert poll_events(AI_ONLY, NullRenderer(), timeout_ms=250) == [QuitEvent()]
@@ -0,0 +1,100 @@
+from minesweeper.ai.analyzer import AnalyzedBoard
+from minesweeper.ai.instrumentation import StrategyProfiler, StrategyStats
+from minesweeper.domain.move import Move
+from minesweeper.domain.types import ActionType, Coord
+
+
+class StubStrategy:
+    def __init__(self, name: str, moves: list[Move]) -> None:
+        self._name = name
+        self._moves = moves
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def find_moves(self, analysis: AnalyzedBoard) -> list[Move]:
+        return self._moves
+
+
+class SteppingClock:
+    """Each measured call appears to take `step` seconds."""
+
+    def __init__(self, *steps: float) -> None:
+        self._steps = list(steps)
+        self._now = 0.0
+        self._started = False
+
+    def __call__(self) -> float:
+        if self._started:
+            self._now += self._steps.pop(0)
+        self._started = not self._started
+        return self._now
+
+
+REVEAL = Move(ActionType.REVEAL, Coord(0, 0))
+FLAG = Move(ActionType.FLAG, Coord(1, 1))
+
+
+def test_measure_returns_strategy_moves_and_records_the_call() -> None:
+    profiler = StrategyProfiler(clock=SteppingClock(0.002))
+    strategy = StubStrategy("Reveal", [REVEAL, FLAG])
+
+    assert profiler.measure(strategy, AnalyzedBoard()) == [REVEAL, FLAG]
+    assert profiler.stats() == [
+        StrategyStats(
+            name="Reveal",
+            calls=1,
+            hits=1,
+            moves=2,
+            total_seconds=0.002,
+            p50_seconds=0.002,
+            p99_seconds=0.002,
+        )
+    ]
+
+
+def test_stats_track_hit_rate_and_latency_percentiles() -> None:
+    profiler = StrategyProfiler()
+    for index in range(100):
+        profiler.record("Solver", (index + 1) / 1000, 1 if index % 4 == 0 else 0)
+
+    [stats] = profiler.stats()
+
+    assert stats.calls == 100
+    assert stats.hits == 25
+    assert stats.hit_rate == 0.25
+    assert stats.moves == 25
+    assert stats.p50_seconds == 0.050
+    assert stats.p99_seconds == 0.099
+
+
+def test_stats_keep_first_measured_order() -> None:
+    profiler = StrategyProfiler()
+    profiler.record("Later", 0.001, 0)
+    profiler.record("Earlier", 0.001, 0)
+    profiler.record("Later", 0.001, 1)
+
+    assert [stats.name for stats in profiler.stats()] == ["Later", "Earlier"]
+
+
+def test_report_lines_describe_each_strategy() -> None:
+    profiler = StrategyProfiler(clock=SteppingClock(0.0015, 0.0005))
+    profiler.measure(StubStrategy("Empty", []), AnalyzedBoard())
+    profiler.measure(StubStrategy("Reveal", [REVEAL]), AnalyzedBoard())
+
+    assert profiler.report_lines() == [
+        "Strategy stats:",
+        "  Empty: 1 calls, 0.0% hit rate, 0 moves, total 1.5 ms, p50 1.500 ms, p99 1.500 ms",
+        "  Reveal: 1 calls, 100.0% hit rate, 1 moves, total 0.5 ms, p50 0.500 ms, p99 0.500 ms",
+    ]
+
+
+def test_empty_profiler_reports_nothing_and_reset_clears() -> None:
+    profiler = StrategyProfiler()
+    assert profiler.report_lines() == []
+
+    profiler.record("Solver", 0.001, 1)
+    profiler.reset()
+
+    assert profiler.stats() == []
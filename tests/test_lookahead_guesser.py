@@ -0,0 +1,85 @@
+from minesweeper.ai.analyzer import AnalyzedBoard
+from minesweeper.ai.strategies import unit_propagation as unit_propagation_module
+from minesweeper.ai.strategies.lookahead_guesser import LookaheadGuesser
+from minesweeper.ai.strategies.probability_solver import ProbabilitySolver
+from minesweeper.domain.types import ActionType, Coord
+
+
+def _open_corner_analysis() -> AnalyzedBoard:
+    grid = {Coord(x, y): AnalyzedBoard.UNKNOWN for x in range(4) for y in range(3)}
+    grid[Coord(0, 0)] = 1
+    return AnalyzedBoard(
+        grid=grid,
+        frontier=[Coord(0, 0)],
+        unknown_coords=frozenset(coord for coord, value in grid.items() if value == AnalyzedBoard.UNKNOWN),
+        flagged_coords=frozenset(),
+        total_mines=3,
+    )
+
+
+def _uniform_probabilities(analysis: AnalyzedBoard, probability: float) -> dict[Coord, float]:
+    return {coord: probability for coord in analysis.unknown_coords}
+
+
+def test_prefers_equally_safe_guess_with_more_follow_on_progress() -> None:
+    analysis = _open_corner_analysis()
+    probabilities = _uniform_probabilities(analysis, 0.25)
+
+    # (0, 1) wins the plain tie-break, but revealing (1, 1) shares unknowns
+    # with the revealed 1 and forces more safe tiles on average.
+    assert LookaheadGuesser(max_candidates=12).choose(analysis, probabilities) == Coord(1, 1)
+
+
+def test_candidate_limit_bounds_the_search() -> None:
+    analysis = _open_corner_analysis()
+    probabilities = _uniform_probabilities(analysis, 0.25)
+
+    assert LookaheadGuesser(max_candidates=1).choose(analysis, probabilities) == Coord(0, 1)
+
+
+def test_risk_margin_excludes_more_dangerous_tiles() -> None:
+    analysis = _open_corner_analysis()
+    probabilities = _uniform_probabilities(analysis, 0.5)
+    probabilities[Coord(2, 2)] = 0.2
+
+    assert LookaheadGuesser(risk_margin=0.05).choose(analysis, probabilities) == Coord(2, 2)
+
+
+def test_exhausted_time_budget_returns_no_guess() -> None:
+    ticks = iter([0.0, 10.0])
+    guesser = LookaheadGuesser(time_budget_ms=1, clock=lambda: next(ticks))
+    analysis = _open_corner_analysis()
+
+    assert guesser.choose(analysis, _uniform_probabilities(analysis, 0.25)) is None
+
+
+def test_repeated_sub_states_are_memoized(monkeypatch) -> None:
+    calls: list[int] = []
+    original_solve = unit_propagation_module.ComponentSearch.solve
+
+    def counting_solve(self):
+        calls.append(1)
+        return original_solve(self)
+
+    monkeypatch.setattr(unit_propagation_module.ComponentSearch, "solve", counting_solve)
+    guesser = LookaheadGuesser()
+    analysis = _open_corner_analysis()
+    probabilities = _uniform_probabilities(analysis, 0.25)
+
+    guesser.choose(analysis, probabilities)
+    first_calls = len(calls)
+    guesser.choose(analysis, probabilities)
+
+    assert first_calls > 0
+    assert len(calls) == first_calls
+
+
+def test_probability_solver_uses_guesser_when_no_move_is_certain() -> None:
+    analysis = _open_corner_analysis()
+
+    plain = ProbabilitySolver().find_moves(analysis)
+    guided = ProbabilitySolver(guesser=LookaheadGuesser(max_candidates=12, risk_margin=0.0)).find_moves(analysis)
+
+    assert plain == [(ActionType.REVEAL, Coord(0, 2))]
+    assert guided[0].action == ActionType.REVEAL
+    assert guided != plain
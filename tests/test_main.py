@@ -7,6 +7,7 @@ from types import ModuleType
 import pytest
 
 import minesweeper.__main__ as main_module
+from minesweeper.ai.registry import CHAINS
 from minesweeper.domain.types import AI_ONLY, HYBRID, PLAYER_ONLY
 
 
@@ -22,7 +23,7 @@ def test_main_builds_app_with_cli_config(monkeypatch) -> None:
     recorded: dict[str, object] = {}
 
     class StubApp:
-        def __init__(self, config, mode) -> None:
+        def __init__(self, config, mode, output=None) -> None:
             recorded["config"] = config
             recorded["mode"] = mode
 
@@ -47,7 +48,7 @@ def test_main_supports_tile_and_font_size_flags(monkeypatch) -> None:
     recorded: dict[str, object] = {}
 
     class StubApp:
-        def __init__(self, config, mode) -> None:
+        def __init__(self, config, mode, output=None) -> None:
             recorded["config"] = config
             recorded["mode"] = mode
 
@@ -67,6 +68,48 @@ def test_main_supports_tile_and_font_size_flags(monkeypatch) -> None:
     assert recorded["ran"] is True
 
 
+def test_main_passes_strategy_workers_into_config(monkeypatch) -> None:
+    recorded: dict[str, object] = {}
+
+    class StubApp:
+        def __init__(self, config, mode, output=None) -> None:
+            recorded["config"] = config
+
+        def run(self) -> None:
+            recorded["ran"] = True
+
+    monkeypatch.setattr(main_module, "App", StubApp)
+
+    exit_code = main_module.main(["--mode", "ai", "--strategy-workers", "3", "--max-fps", "30", "--turbo"])
+
+    assert exit_code == 0
+    assert recorded["config"].strategy_workers == 3
+    assert recorded["config"].max_fps == 30
+    assert recorded["config"].ai_turbo is True
+
+
+def test_main_runs_ai_headless_for_a_number_of_games(monkeypatch) -> None:
+    recorded: dict[str, object] = {}
+
+    class StubApp:
+        def __init__(self, config, mode, output=None) -> None:
+            recorded["config"] = config
+
+        def run(self) -> None:
+            pass
+
+    monkeypatch.setattr(main_module, "App", StubApp)
+
+    assert main_module.main(["--mode", "ai", "--renderer", "null", "--games", "5"]) == 0
+    assert recorded["config"].renderer == "null"
+    assert recorded["config"].max_games == 5
+
+
+def test_main_rejects_headless_renderers_for_player_modes() -> None:
+    with pytest.raises(SystemExit):
+        main_module.main(["--mode", "hybrid", "--renderer", "text"])
+
+
 def test_main_runs_external_mode_via_lazy_imports(monkeypatch) -> None:
     recorded: dict[str, object] = {}
 
@@ -141,8 +184,12 @@ def test_main_passes_debug_capture_dir_to_external_mode(monkeypatch) -> None:
 
     assert exit_code == 0
     assert recorded["debug_capture_dir"] == Path("tmp/debug-captures")
+    assert recorded["classification_memo_dir"] is None
     assert recorded["external_ran"] is True
 
+    assert main_module.main(["--mode", "external", "--classification-memo", "tmp/memo"]) == 0
+    assert recorded["classification_memo_dir"] == Path("tmp/memo")
+
 
 def test_main_surfaces_browser_dom_bridge_bind_failure(monkeypatch, capsys) -> None:
     class UnexpectedApp:
@@ -163,3 +210,68 @@ def test_main_surfaces_browser_dom_bridge_bind_failure(monkeypatch, capsys) -> N
         "browser-dom HTTP bridge could not bind: address already in use"
         in capsys.readouterr().err
     )
+
+
+def test_main_passes_verbose_output_to_local_app(monkeypatch) -> None:
+    recorded: dict[str, object] = {}
+
+    class StubApp:
+        def __init__(self, config, mode, output=None) -> None:
+            recorded["output"] = output
+
+        def run(self) -> None:
+            recorded["ran"] = True
+
+    monkeypatch.setattr(main_module, "App", StubApp)
+
+    assert main_module.main(["--mode", "ai"]) == 0
+    assert recorded["output"] is None
+
+    assert main_module.main(["--mode", "ai", "--verbose"]) == 0
+    assert recorded["output"] is print
+
+
+def test_main_passes_strategy_chain_into_config(monkeypatch, tmp_path: Path) -> None:
+    recorded: dict[str, object] = {}
+
+    class StubApp:
+        def __init__(self, config, mode, output=None) -> None:
+            recorded["config"] = config
+
+        def run(self) -> None:
+            pass
+
+    monkeypatch.setattr(main_module, "App", StubApp)
+
+    assert main_module.main(["--mode", "ai"]) == 0
+    assert recorded["config"].strategies is None
+
+    assert main_module.main(["--mode", "ai", "--strategies", "PatternDetector,ProbabilitySolver"]) == 0
+    assert recorded["config"].strategies == ("PatternDetector", "ProbabilitySolver")
+
+    chain_file = tmp_path / "chain.txt"
+    chain_file.write_text("fast\n")
+    assert main_module.main(["--mode", "ai", "--strategies-file", str(chain_file)]) == 0
+    assert recorded["config"].strategies == CHAINS["fast"]
+
+
+def test_main_rejects_unknown_strategy_names(monkeypatch) -> None:
+    monkeypatch.setattr(main_module, "App", lambda *_args, **_kwargs: None)
+
+    with pytest.raises(SystemExit):
+        main_module.main(["--mode", "ai", "--strategies", "PatternDetector,Nope"])
+
+
+def test_main_passes_strategy_chain_to_external_mode(monkeypatch) -> None:
+    recorded: dict[str, object] = {}
+
+    def stub_run(**kwargs):
+        recorded.update(kwargs)
+        return "no moves available"
+
+    external_module = ModuleType("minesweeper.external")
+    external_module.run = stub_run
+    monkeypatch.setitem(sys.modules, "minesweeper.external", external_module)
+
+    assert main_module.main(["--mode", "external", "--strategies", "fast"]) == 0
+    assert [strategy.name for strategy in recorded["strategies"]] == list(CHAINS["fast"])
@@ -0,0 +1,115 @@
+import random
+from pathlib import Path
+
+from minesweeper.ai.analyzer import AnalyzedBoard
+from minesweeper.ai.opening_book import _ClickTally, _Layouts
+from minesweeper.ai.opening_book import OpeningBook, book_path, build_opening_book, main, state_key
+from minesweeper.domain.move import Move
+from minesweeper.domain.types import ActionType, Coord, GameConfig
+from minesweeper.engine.game import Game
+
+
+def _analysis(width: int, height: int, revealed: dict[Coord, int] | None = None) -> AnalyzedBoard:
+    grid = {Coord(x, y): AnalyzedBoard.UNKNOWN for x in range(width) for y in range(height)}
+    grid.update(revealed or {})
+    return AnalyzedBoard(
+        grid=grid,
+        unknown_coords=frozenset(coord for coord, value in grid.items() if value == AnalyzedBoard.UNKNOWN),
+        total_mines=2,
+        width=width,
+        height=height,
+    )
+
+
+def test_state_key_is_order_independent() -> None:
+    assert state_key([(Coord(2, 0), 1), (Coord(0, 1), 3)]) == state_key(
+        [(Coord(0, 1), 3), (Coord(2, 0), 1)]
+    )
+    assert state_key([]) == ""
+
+
+def test_book_round_trips_through_compact_json(tmp_path: Path) -> None:
+    book = OpeningBook(
+        width=4,
+        height=4,
+        num_mines=2,
+        moves={"": Coord(0, 0), "0,0,1": Coord(3, 3)},
+    )
+    path = book_path(4, 4, 2, tmp_path)
+
+    book.save(path)
+
+    assert " " not in path.read_text(encoding="utf-8")
+    assert OpeningBook.load(path) == book
+
+
+def test_move_for_matches_revealed_state_and_skips_resolved_tiles() -> None:
+    book = OpeningBook(
+        width=4,
+        height=4,
+        num_mines=2,
+        moves={"": Coord(0, 0), "0,0,1": Coord(3, 3)},
+    )
+
+    assert book.move_for(_analysis(4, 4)) == Coord(0, 0)
+    assert book.move_for(_analysis(4, 4, {Coord(0, 0): 1})) == Coord(3, 3)
+    assert book.move_for(_analysis(4, 4, {Coord(0, 0): 2})) is None
+    assert book.move_for(_analysis(4, 4, {Coord(0, 0): 1, Coord(3, 3): 1})) is None
+
+
+def test_build_opening_book_covers_first_click_and_follow_ups() -> None:
+    book = build_opening_book(GameConfig(width=5, height=5, num_mines=3), games=30, min_samples=3)
+
+    first_click = book.moves[""]
+    assert 0 <= first_click.x < 5 and 0 <= first_click.y < 5
+    for key, coord in book.moves.items():
+        if key:
+            assert key.startswith(f"{first_click.x},{first_click.y},")
+            assert coord != first_click
+
+
+def test_simulated_layouts_match_the_engine_including_the_first_click() -> None:
+    config = GameConfig(width=6, height=5, num_mines=9)
+    layouts = _Layouts(config)
+
+    for seed in range(20):
+        for click in (0, 7, 29):
+            game = Game(config, random.Random(seed))
+            game.apply_move(Move(ActionType.REVEAL, layouts.coords[click]))
+            mines = layouts.after_first_click(layouts.mines(seed), click)
+            counts = layouts.counts(mines)
+            for cell, coord in enumerate(layouts.coords):
+                tile = game.board.tile_at(coord)
+                assert tile.is_mine == (cell in mines)
+                if not tile.is_mine:
+                    assert tile.adjacent_mines == counts[cell]
+
+
+def test_lower_bound_prefers_reliable_tiles_over_lucky_ones() -> None:
+    lucky = _ClickTally(samples=3, openings=3)
+    reliable = _ClickTally(samples=1000, openings=600, deaths=200)
+
+    assert lucky.lower_bound() < reliable.lower_bound() < 0.75
+    assert _ClickTally(samples=10).lower_bound() == 0.0
+
+
+def test_build_opening_book_prefers_corners_on_standard_boards() -> None:
+    book = build_opening_book(GameConfig(width=9, height=9, num_mines=10), games=1500)
+
+    corners = {Coord(0, 0), Coord(0, 8), Coord(8, 0), Coord(8, 8)}
+    assert set(book.moves.values()) <= corners
+
+
+def test_build_opening_book_is_deterministic_for_a_seed() -> None:
+    config = GameConfig(width=5, height=5, num_mines=3)
+
+    assert build_opening_book(config, games=10, seed=7) == build_opening_book(config, games=10, seed=7)
+
+
+def test_cli_writes_custom_configuration(tmp_path: Path) -> None:
+    exit_code = main(
+        ["--width", "4", "--height", "4", "--mines", "2", "--games", "5", "--output-dir", str(tmp_path)]
+    )
+
+    assert exit_code == 0
+    assert OpeningBook.load(book_path(4, 4, 2, tmp_path)).width == 4
@@ -0,0 +1,61 @@
+import random
+from pathlib import Path
+
+from minesweeper.ai.analyzer import AnalyzedBoard
+from minesweeper.ai.opening_book import OpeningBook
+from minesweeper.ai.strategies.opening_book_explorer import OpeningBookExplorer
+from minesweeper.ai.strategies.random_explorer import RandomExplorer
+from minesweeper.domain.types import ActionType, Coord
+
+
+def _fresh_analysis() -> AnalyzedBoard:
+    unknowns = frozenset(Coord(x, y) for x in range(3) for y in range(3))
+    return AnalyzedBoard(
+        grid={coord: AnalyzedBoard.UNKNOWN for coord in unknowns},
+        unknown_coords=unknowns,
+        total_mines=1,
+        width=3,
+        height=3,
+    )
+
+
+def test_uses_book_move_when_state_is_known() -> None:
+    book = OpeningBook(width=3, height=3, num_mines=1, moves={"": Coord(2, 2)})
+    explorer = OpeningBookExplorer(random.Random(0), loader=lambda *_args: book)
+
+    assert explorer.find_moves(_fresh_analysis()) == [(ActionType.REVEAL, Coord(2, 2))]
+
+
+def test_falls_back_to_random_exploration_without_a_book() -> None:
+    explorer = OpeningBookExplorer(random.Random(0), loader=lambda *_args: None)
+
+    moves = explorer.find_moves(_fresh_analysis())
+
+    assert len(moves) == 1
+    assert moves[0].coord in _fresh_analysis().unknown_coords
+
+
+def test_loads_each_book_lazily_once() -> None:
+    calls: list[tuple[int, int, int, Path]] = []
+
+    def loader(width: int, height: int, num_mines: int, root: Path) -> None:
+        calls.append((width, height, num_mines, root))
+        return None
+
+    explorer = OpeningBookExplorer(random.Random(0), book_dir=Path("books"), loader=loader)
+    assert calls == []
+
+    explorer.find_moves(_fresh_analysis())
+    explorer.find_moves(_fresh_analysis())
+
+    assert calls == [(3, 3, 1, Path("books"))]
+
+
+def test_missing_book_file_is_treated_as_no_book(tmp_path: Path) -> None:
+    explorer = OpeningBookExplorer(random.Random(0), book_dir=tmp_path)
+
+    assert len(explorer.find_moves(_fresh_analysis())) == 1
+
+
+def test_is_still_an_opening_phase_explorer() -> None:
+    assert isinstance(OpeningBookExplorer(), RandomExplorer)
@@ -0,0 +1,158 @@
+from pathlib import Path
+
+import pytest
+
+import minesweeper.ai.strategies.pattern_table_matcher as matcher_module
+from minesweeper.ai.analyzer import AnalyzedBoard
+from minesweeper.ai.pattern_table import (
+    CLEAR,
+    UNKNOWN,
+    PatternTable,
+    WindowDeduction,
+    WindowShape,
+    decode_window,
+    encode_window,
+    solve_window,
+)
+from minesweeper.ai.strategies.pattern_table_matcher import PatternTableMatcher
+from minesweeper.domain.types import ActionType, Coord
+
+
+def _one_two_one() -> AnalyzedBoard:
+    # ? ? ?
+    # 1 2 1
+    unknowns = frozenset({Coord(0, 0), Coord(1, 0), Coord(2, 0)})
+    grid = {coord: AnalyzedBoard.UNKNOWN for coord in unknowns}
+    grid.update({Coord(0, 1): 1, Coord(1, 1): 2, Coord(2, 1): 1})
+    return AnalyzedBoard(
+        grid=grid,
+        frontier=[Coord(0, 1), Coord(1, 1), Coord(2, 1)],
+        unknown_coords=unknowns,
+        total_mines=2,
+        width=3,
+        height=2,
+    )
+
+
+def _empty_table(_path: Path) -> PatternTable:
+    return PatternTable()
+
+
+def test_encode_window_collapses_ring_numbers_and_off_board_cells() -> None:
+    shape = WindowShape(3, 3)
+    analysis = _one_two_one()
+
+    symbols = decode_window(shape, encode_window(analysis, shape, Coord(1, 1)))
+
+    assert symbols == [
+        UNKNOWN, UNKNOWN, UNKNOWN,
+        CLEAR, 2, CLEAR,
+        CLEAR, CLEAR, CLEAR,
+    ]
+
+
+def test_solve_window_finds_forced_cells_from_interior_numbers() -> None:
+    shape = WindowShape(5, 3)
+    analysis = _one_two_one()
+
+    deduction = solve_window(shape, encode_window(analysis, shape, Coord(0, 1)))
+
+    # Window origin is (-1, 0): the row of unknowns sits at indices 1..3.
+    assert deduction == WindowDeduction(safe_mask=1 << 2, mine_mask=(1 << 1) | (1 << 3))
+
+
+def test_table_round_trips_through_binary_file(tmp_path: Path) -> None:
+    table = PatternTable()
+    table.add(WindowShape(4, 4), 0xDEADBEEF, WindowDeduction(0b101, 0b10))
+    table.add(WindowShape(3, 5), 7, WindowDeduction(0, 0))
+    path = tmp_path / "patterns.bin"
+
+    table.save(path)
+    loaded = PatternTable.load(path)
+
+    assert len(loaded) == 2
+    assert loaded.lookup(WindowShape(4, 4), 0xDEADBEEF) == WindowDeduction(0b101, 0b10)
+    assert loaded.lookup(WindowShape(3, 5), 7) == WindowDeduction(0, 0)
+    assert loaded.lookup(WindowShape(5, 3), 7) is None
+
+
+def test_load_rejects_files_that_are_not_pattern_tables(tmp_path: Path) -> None:
+    path = tmp_path / "patterns.bin"
+    path.write_bytes(b"nope")
+
+    with pytest.raises(ValueError):
+        PatternTable.load(path)
+
+
+def test_matcher_solves_the_one_two_one_pattern() -> None:
+    matcher = PatternTableMatcher(loader=_empty_table)
+
+    assert matcher.find_moves(_one_two_one()) == [
+        (ActionType.FLAG, Coord(0, 0)),
+        (ActionType.FLAG, Coord(2, 0)),
+        (ActionType.REVEAL, Coord(1, 0)),
+    ]
+
+
+def test_matcher_trusts_table_entries_without_solving(monkeypatch: pytest.MonkeyPatch) -> None:
+    shape = WindowShape(4, 4)
+    analysis = _one_two_one()
+    table = PatternTable({shape: {}})
+    for anchor in analysis.frontier:
+        table.add(shape, encode_window(analysis, shape, anchor), WindowDeduction(0, 0))
+    table.add(shape, encode_window(analysis, shape, Coord(0, 1)), WindowDeduction(1 << 2, 0))
+
+    def fail(*_args: object) -> WindowDeduction:
+        raise AssertionError("table hits must not be solved")
+
+    monkeypatch.setattr(matcher_module, "WINDOW_SHAPES", (shape,))
+    monkeypatch.setattr(matcher_module, "solve_window", fail)
+    matcher = PatternTableMatcher(loader=lambda _path: table)
+
+    assert matcher.find_moves(analysis) == [(ActionType.REVEAL, Coord(1, 0))]
+
+
+def test_matcher_memoises_windows_missing_from_the_table(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[int] = []
+
+    def counting_solve(shape: WindowShape, key: int) -> WindowDeduction:
+        calls.append(key)
+        return solve_window(shape, key)
+
+    monkeypatch.setattr(matcher_module, "solve_window", counting_solve)
+    matcher = PatternTableMatcher(loader=_empty_table)
+
+    matcher.find_moves(_one_two_one())
+    first_pass = len(calls)
+    matcher.find_moves(_one_two_one())
+
+    assert first_pass > 0
+    assert len(calls) == first_pass
+
+
+def test_matcher_loads_the_table_lazily_once() -> None:
+    loads: list[Path] = []
+
+    def loader(path: Path) -> PatternTable:
+        loads.append(path)
+        return PatternTable()
+
+    matcher = PatternTableMatcher(table_path=Path("patterns.bin"), loader=loader)
+    assert loads == []
+
+    matcher.find_moves(_one_two_one())
+    matcher.find_moves(_one_two_one())
+
+    assert loads == [Path("patterns.bin")]
+
+
+def test_matcher_returns_nothing_without_a_frontier() -> None:
+    matcher = PatternTableMatcher(loader=_empty_table)
+
+    assert matcher.find_moves(AnalyzedBoard()) == []
+
+
+def test_shipped_table_loads() -> None:
+    table = PatternTable.load(matcher_module.TABLE_PATH)
+
+    assert len(table) > 0
@@ -0,0 +1,77 @@
+import pytest
+
+from minesweeper.ai.analyzer import AnalyzedBoard
+from minesweeper.ai.probability import ProbabilityMap, compute_probability_map
+from minesweeper.domain.types import Coord
+
+
+def _analysis(rows: list[str], total_mines: int) -> AnalyzedBoard:
+    """`#` is unknown, `F` a flag and digits are revealed numbers."""
+    grid: dict[Coord, int] = {}
+    for y, row in enumerate(rows):
+        for x, symbol in enumerate(row):
+            if symbol == "#":
+                grid[Coord(x, y)] = AnalyzedBoard.UNKNOWN
+            elif symbol == "F":
+                grid[Coord(x, y)] = AnalyzedBoard.FLAGGED
+            else:
+                grid[Coord(x, y)] = int(symbol)
+
+    return AnalyzedBoard(
+        grid=grid,
+        frontier=[coord for coord, value in grid.items() if value > 0],
+        unknown_coords=frozenset(coord for coord, value in grid.items() if value == AnalyzedBoard.UNKNOWN),
+        flagged_coords=frozenset(coord for coord, value in grid.items() if value == AnalyzedBoard.FLAGGED),
+        total_mines=total_mines,
+        width=len(rows[0]),
+        height=len(rows),
+    )
+
+
+def test_enumerates_every_unknown_including_unconstrained_tiles() -> None:
+    probability_map = compute_probability_map(_analysis(["#1##"], total_mines=1))
+
+    assert probability_map.enumerated
+    assert probability_map.probabilities == {
+        Coord(0, 0): pytest.approx(0.5),
+        Coord(2, 0): pytest.approx(0.5),
+        Coord(3, 0): pytest.approx(0.0),
+    }
+    assert probability_map.safest() == Coord(3, 0)
+
+
+def test_falls_back_to_global_density_without_constraints() -> None:
+    probability_map = compute_probability_map(_analysis(["##", "F#"], total_mines=2))
+
+    assert not probability_map.enumerated
+    assert probability_map.probabilities == {
+        Coord(0, 0): pytest.approx(1 / 3),
+        Coord(1, 0): pytest.approx(1 / 3),
+        Coord(1, 1): pytest.approx(1 / 3),
+    }
+
+
+def test_falls_back_to_global_density_for_large_regions() -> None:
+    probability_map = compute_probability_map(_analysis(["#1##"], total_mines=1), max_exact_tiles=1)
+
+    assert not probability_map.enumerated
+    assert list(probability_map.probabilities.values()) == pytest.approx([1 / 3] * 3)
+
+
+def test_grid_view_marks_known_tiles_as_none() -> None:
+    probability_map = compute_probability_map(_analysis(["#1", "11"], total_mines=1))
+
+    assert probability_map.as_grid(2, 2) == [[1.0, None], [None, None]]
+    assert probability_map.get(Coord(1, 1)) is None
+
+
+def test_empty_board_has_empty_map() -> None:
+    assert compute_probability_map(AnalyzedBoard()) == ProbabilityMap()
+    assert ProbabilityMap().safest() is None
+
+
+def test_analysis_computes_its_map_once() -> None:
+    analysis = _analysis(["#1##"], total_mines=1)
+
+    assert analysis.probability_map is analysis.probability_map
+    assert analysis.probability_map.probabilities[Coord(3, 0)] == pytest.approx(0.0)
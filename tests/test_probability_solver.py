@@ -1,7 +1,7 @@
 import itertools
 
 from minesweeper.ai.analyzer import AnalyzedBoard
-from minesweeper.ai.strategies import probability_solver as probability_solver_module
+from minesweeper.ai import probability as probability_module
 from minesweeper.ai.strategies.probability_solver import ProbabilitySolver
 from minesweeper.domain.types import ActionType, Coord
 
@@ -167,7 +167,7 @@ def test_does_not_enumerate_unconstrained_unknowns(monkeypatch) -> None:
             raise AssertionError("solver tried to enumerate unconstrained tiles")
         return original_combinations(items, r)
 
-    monkeypatch.setattr(probability_solver_module, "combinations", guarded_combinations)
+    monkeypatch.setattr(probability_module, "combinations", guarded_combinations)
 
     assert ProbabilitySolver().find_moves(analysis) == [
         (ActionType.REVEAL, Coord(10, 10)),
@@ -191,7 +191,7 @@ def test_large_constrained_region_falls_back_without_exact_enumeration(monkeypat
             raise AssertionError("solver tried to exact-enumerate a large constrained region")
         return itertools.combinations(items, r)
 
-    monkeypatch.setattr(probability_solver_module, "combinations", guarded_combinations)
+    monkeypatch.setattr(probability_module, "combinations", guarded_combinations)
 
     assert ProbabilitySolver().find_moves(analysis) == [
         (ActionType.FLAG, Coord(0, 1)),
@@ -0,0 +1,105 @@
+import random
+from pathlib import Path
+
+import pytest
+
+import minesweeper.ai.registry as registry_module
+from minesweeper.ai.registry import (
+    CHAINS,
+    DEFAULT_CHAIN,
+    STRATEGIES,
+    StrategyRegistry,
+    StrategySpec,
+    load_chain,
+    parse_chain,
+)
+from minesweeper.ai.strategies.pattern_detector import PatternDetector
+
+
+class RecordingImports:
+    def __init__(self) -> None:
+        self.modules: list[str] = []
+
+    def __call__(self, name: str) -> object:
+        self.modules.append(name)
+        return __import__(name, fromlist=["_"])
+
+
+def test_every_registered_strategy_reports_its_registry_name() -> None:
+    registry = StrategyRegistry(random.Random(0))
+
+    assert [strategy.name for strategy in registry.chain(list(STRATEGIES))] == list(STRATEGIES)
+
+
+def test_default_chain_is_the_default_preset() -> None:
+    assert parse_chain("default") == DEFAULT_CHAIN
+    assert [strategy.name for strategy in StrategyRegistry().chain()] == list(DEFAULT_CHAIN)
+
+
+def test_parse_chain_accepts_presets_lists_and_comments() -> None:
+    assert parse_chain("fast") == CHAINS["fast"]
+    assert parse_chain("PatternDetector, ProbabilitySolver") == ("PatternDetector", "ProbabilitySolver")
+    assert parse_chain("# cheap chain\nPatternDetector\nProbabilitySolver  # guesses\n") == (
+        "PatternDetector",
+        "ProbabilitySolver",
+    )
+
+
+@pytest.mark.parametrize(
+    "text, message",
+    [
+        ("PatternDetector,Nope", "unknown strategies: Nope"),
+        ("PatternDetector,PatternDetector", "more than once"),
+        ("  # nothing\n", "at least one"),
+    ],
+)
+def test_parse_chain_rejects_bad_chains(text: str, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        parse_chain(text)
+
+
+def test_load_chain_reads_a_file(tmp_path: Path) -> None:
+    path = tmp_path / "chain.txt"
+    path.write_text("PatternDetector\nProbabilitySolver\n")
+
+    assert load_chain(path) == ("PatternDetector", "ProbabilitySolver")
+
+
+def test_registry_constructs_each_strategy_once() -> None:
+    registry = StrategyRegistry()
+
+    first = registry.chain(["PatternDetector", "ProbabilitySolver"])
+    second = registry.chain(["ProbabilitySolver", "PatternDetector"])
+
+    assert isinstance(first[0], PatternDetector)
+    assert first[0] is second[1]
+    assert first[1] is second[0]
+
+
+def test_registry_imports_only_the_modules_a_chain_uses(monkeypatch: pytest.MonkeyPatch) -> None:
+    imports = RecordingImports()
+    monkeypatch.setattr(registry_module.importlib, "import_module", imports)
+
+    StrategyRegistry().chain(["PatternDetector"])
+
+    assert imports.modules == ["minesweeper.ai.strategies.pattern_detector"]
+
+
+def test_registry_passes_its_rng_to_strategies_that_take_one(monkeypatch: pytest.MonkeyPatch) -> None:
+    received: list[object] = []
+
+    class Explorer:
+        def __init__(self, rng: random.Random) -> None:
+            received.append(rng)
+
+    class Module:
+        pass
+
+    Module.Explorer = Explorer  # type: ignore[attr-defined]
+    monkeypatch.setitem(STRATEGIES, "Explorer", StrategySpec("fake.module", "Explorer", takes_rng=True))
+    monkeypatch.setattr(registry_module.importlib, "import_module", lambda _name: Module)
+    rng = random.Random(3)
+
+    StrategyRegistry(rng).get("Explorer")
+
+    assert received == [rng]
@@ -4,7 +4,8 @@ import pygame
 import pytest
 
 from minesweeper.domain.tile import Tile
-from minesweeper.domain.types import Coord, GameConfig, GameMode, TileState
+from minesweeper.domain.types import PLAYER_ONLY, Coord, GameConfig, GameMode, TileState
+from minesweeper.ui.input import RedrawEvent, poll_events
 from minesweeper.ui.renderer import PygameRenderer
 
 
@@ -19,6 +20,18 @@ class StubBoard:
         return self._tiles[coord]
 
 
+def _render_tile(renderer: PygameRenderer, tile: Tile) -> None:
+    """Render a board whose other tiles are hidden, so `tile` goes through the atlas blit path."""
+    config = renderer._config
+    hidden = [
+        Tile(Coord(x, y), TileState.HIDDEN, False)
+        for x in range(config.width)
+        for y in range(config.height)
+        if Coord(x, y) != tile.coord
+    ]
+    renderer.render(StubBoard(config.width, config.height, config.num_mines, [tile, *hidden]), 0.0, PLAYER_ONLY, False)
+
+
 @pytest.fixture(autouse=True)
 def pygame_dummy_display(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
@@ -76,10 +89,10 @@ def test_board_coord_from_screen_unchanged_by_sprite_support() -> None:
     ) == Coord(1, 0)
 
 
-def test_draw_tile_renders_flag_without_external_assets() -> None:
+def test_render_draws_flag_without_external_assets() -> None:
     renderer = PygameRenderer(GameConfig(tile_size_px=24))
     tile = Tile(coord=Coord(0, 0), state=TileState.FLAGGED, is_mine=False)
-    renderer._draw_tile(tile)
+    _render_tile(renderer, tile)
 
     center = (
         renderer._board_rect.left + renderer._config.tile_size_px // 2,
@@ -88,10 +101,10 @@ def test_draw_tile_renders_flag_without_external_assets() -> None:
     assert renderer._surface.get_at(center)[:3] != renderer._theme.flagged_tile
 
 
-def test_draw_tile_renders_exploded_mine_without_external_assets() -> None:
+def test_render_draws_exploded_mine_without_external_assets() -> None:
     renderer = PygameRenderer(GameConfig(tile_size_px=24))
     tile = Tile(coord=Coord(0, 0), state=TileState.EXPLODED, is_mine=True)
-    renderer._draw_tile(tile)
+    _render_tile(renderer, tile)
 
     center = (
         renderer._board_rect.left + renderer._config.tile_size_px // 2,
@@ -171,7 +184,7 @@ def test_hidden_tile_uses_lighter_top_left_edge_for_depth() -> None:
     renderer = PygameRenderer(GameConfig(tile_size_px=24))
     tile = Tile(coord=Coord(0, 0), state=TileState.HIDDEN, is_mine=False)
 
-    renderer._draw_tile(tile)
+    _render_tile(renderer, tile)
 
     edge = renderer._surface.get_at((renderer._board_rect.left + 1, renderer._board_rect.top + 1))[:3]
     center = renderer._surface.get_at(
@@ -187,7 +200,7 @@ def test_revealed_zero_uses_distinct_background() -> None:
     renderer = PygameRenderer(GameConfig(tile_size_px=24))
     tile = Tile(coord=Coord(0, 0), state=TileState.REVEALED, is_mine=False, adjacent_mines=0)
 
-    renderer._draw_tile(tile)
+    _render_tile(renderer, tile)
 
     center = renderer._surface.get_at(
         (
@@ -275,3 +288,245 @@ def test_header_accent_uses_danger_for_exploded_board() -> None:
     )
 
     assert renderer._header_accent(board) == renderer._theme.exploded_tile
+
+
+class VersionedBoard(StubBoard):
+    def __init__(self, width: int, height: int, num_mines: int, tiles: list[Tile]) -> None:
+        super().__init__(width, height, num_mines, tiles)
+        self.version = 0
+        self.lookups = 0
+
+    def tile_at(self, coord: Coord) -> Tile:
+        self.lookups += 1
+        return super().tile_at(coord)
+
+    def set_tile(self, tile: Tile) -> None:
+        self._tiles[tile.coord] = tile
+        self.version += 1
+
+
+def _hidden_board(board_type: type[StubBoard] = StubBoard) -> StubBoard:
+    return board_type(
+        2,
+        2,
+        1,
+        [Tile(Coord(x, y), TileState.HIDDEN, False) for x in range(2) for y in range(2)],
+    )
+
+
+def _record_display_updates(monkeypatch: pytest.MonkeyPatch) -> list[list[pygame.Rect]]:
+    updates: list[list[pygame.Rect]] = []
+    monkeypatch.setattr(pygame.display, "update", lambda rects: updates.append(list(rects)))
+    return updates
+
+
+AI_WATCH = GameMode("AI Only", False, True)
+PLAYER = GameMode("Player Only", True, False)
+
+
+def test_render_pushes_only_changed_tiles_after_first_frame(monkeypatch: pytest.MonkeyPatch) -> None:
+    renderer = PygameRenderer(GameConfig(width=2, height=2, num_mines=1, tile_size_px=24))
+    board = _hidden_board()
+    updates = _record_display_updates(monkeypatch)
+
+    renderer.render(board, 0.0, AI_WATCH, True)
+    renderer.render(board, 0.0, AI_WATCH, True)
+    board._tiles[Coord(1, 1)] = Tile(Coord(1, 1), TileState.REVEALED, False, adjacent_mines=1)
+    renderer.render(board, 0.0, AI_WATCH, True)
+
+    assert updates == [[renderer._tile_rect(Coord(1, 1))]]
+
+
+def test_render_redraws_header_only_when_its_labels_change(monkeypatch: pytest.MonkeyPatch) -> None:
+    renderer = PygameRenderer(GameConfig(width=2, height=2, num_mines=1, tile_size_px=24))
+    board = _hidden_board()
+    updates = _record_display_updates(monkeypatch)
+
+    renderer.render(board, 0.0, AI_WATCH, True)
+    renderer.render(board, 0.5, AI_WATCH, True)
+
+    assert updates == [[renderer._header_rect()]]
+
+
+def test_render_redraws_previous_and_new_hovered_tiles(monkeypatch: pytest.MonkeyPatch) -> None:
+    renderer = PygameRenderer(GameConfig(width=2, height=2, num_mines=1, tile_size_px=24))
+    board = _hidden_board(VersionedBoard)
+    updates = _record_display_updates(monkeypatch)
+    tile = renderer._config.tile_size_px
+    mouse = [(renderer._board_rect.left + 5, renderer._board_rect.top + 5)]
+    monkeypatch.setattr(pygame.mouse, "get_pos", lambda: mouse[0])
+
+    renderer.render(board, 0.0, PLAYER, False)
+    mouse[0] = (renderer._board_rect.left + tile + 5, renderer._board_rect.top + 5)
+    renderer.render(board, 0.0, PLAYER, False)
+
+    assert len(updates) == 1
+    assert sorted(map(tuple, updates[0])) == sorted(
+        tuple(renderer._tile_rect(coord)) for coord in (Coord(0, 0), Coord(1, 0))
+    )
+
+
+def test_render_skips_tile_scan_while_board_version_is_unchanged(monkeypatch: pytest.MonkeyPatch) -> None:
+    renderer = PygameRenderer(GameConfig(width=2, height=2, num_mines=1, tile_size_px=24))
+    board = _hidden_board(VersionedBoard)
+    updates = _record_display_updates(monkeypatch)
+
+    renderer.render(board, 0.0, AI_WATCH, True)
+    lookups = board.lookups
+    renderer.render(board, 0.0, AI_WATCH, True)
+
+    assert board.lookups == lookups
+    assert updates == []
+
+    board.set_tile(Tile(Coord(0, 1), TileState.FLAGGED, True))
+    renderer.render(board, 0.0, AI_WATCH, True)
+
+    assert updates == [[renderer._header_rect(), renderer._tile_rect(Coord(0, 1))]]
+
+
+def test_invalidate_forces_a_full_flip(monkeypatch: pytest.MonkeyPatch) -> None:
+    renderer = PygameRenderer(GameConfig(width=2, height=2, num_mines=1, tile_size_px=24))
+    board = _hidden_board()
+    updates = _record_display_updates(monkeypatch)
+    flips: list[None] = []
+    monkeypatch.setattr(pygame.display, "flip", lambda: flips.append(None))
+
+    renderer.render(board, 0.0, AI_WATCH, True)
+    renderer.invalidate()
+    renderer.render(board, 0.0, AI_WATCH, True)
+
+    assert len(flips) == 2
+    assert updates == []
+
+
+def test_tile_atlas_holds_one_sprite_per_visual_variant() -> None:
+    renderer = PygameRenderer(GameConfig(tile_size_px=24))
+
+    # hidden, flagged (each with a hovered look), revealed 0-8 and exploded
+    assert len(renderer._atlas_areas) == 14
+    assert renderer._atlas.get_width() == 14 * 24
+    assert len({tuple(area) for area in renderer._atlas_areas.values()}) == 14
+
+
+def test_render_copies_tiles_from_the_atlas() -> None:
+    renderer = PygameRenderer(GameConfig(width=2, height=2, num_mines=1, tile_size_px=24))
+    board = StubBoard(
+        2,
+        2,
+        1,
+        [
+            Tile(Coord(0, 0), TileState.HIDDEN, False),
+            Tile(Coord(1, 0), TileState.FLAGGED, False),
+            Tile(Coord(0, 1), TileState.REVEALED, False, adjacent_mines=3),
+            Tile(Coord(1, 1), TileState.EXPLODED, True),
+        ],
+    )
+
+    renderer.render(board, 0.0, GameMode("AI Only", False, True), True)
+
+    for coord in (Coord(0, 0), Coord(1, 0), Coord(0, 1), Coord(1, 1)):
+        tile = board.tile_at(coord)
+        area = renderer._atlas_areas[renderer._tile_key(tile, hovered=False)]
+        rect = renderer._tile_rect(coord)
+        for dx, dy in ((1, 1), (12, 12), (20, 5)):
+            assert renderer._surface.get_at((rect.left + dx, rect.top + dy)) == renderer._atlas.get_at(
+                (area.left + dx, area.top + dy)
+            )
+
+
+def _large_board(width: int, height: int) -> VersionedBoard:
+    tiles = [Tile(Coord(x, y), TileState.HIDDEN, False) for x in range(width) for y in range(height)]
+    board = VersionedBoard(width, height, 1, tiles)
+    board.set_tile(Tile(Coord(0, 0), TileState.REVEALED, False, adjacent_mines=0))
+    board.set_tile(Tile(Coord(1, 0), TileState.FLAGGED, True))
+    return board
+
+
+def test_large_board_starts_zoomed_out_to_fit_the_capped_window() -> None:
+    renderer = PygameRenderer(GameConfig(width=100, height=50, num_mines=10, tile_size_px=20))
+
+    assert renderer._board_rect.size == (1200, 720)
+    assert renderer._tile_size == 10
+    assert renderer._visible_span() == (100, 50)
+
+
+def test_viewport_draws_only_visible_tiles_and_maps_clicks_through_the_offset() -> None:
+    renderer = PygameRenderer(GameConfig(width=100, height=50, num_mines=10, tile_size_px=20))
+    board = _large_board(100, 50)
+    renderer.zoom(1)
+    renderer.scroll(1, 1)
+
+    renderer.render(board, 0.0, AI_WATCH, True)
+
+    assert renderer._tile_size == 20
+    # Zooming in keeps the board centre, then one step scrolls a quarter view.
+    assert renderer._view_origin == Coord(35, 14)
+    assert set(renderer._drawn_tiles) == {Coord(x, y) for x in range(35, 95) for y in range(14, 50)}
+    left, top = renderer._board_rect.topleft
+    assert renderer.board_coord_from_screen(left + 5, top + 45) == Coord(35, 16)
+    assert renderer.board_coord_from_screen(left + 60 * 20 + 1, top) is None
+
+
+def test_scrolling_stops_at_the_board_edge() -> None:
+    renderer = PygameRenderer(GameConfig(width=100, height=50, num_mines=10, tile_size_px=20))
+    renderer.zoom(1)
+
+    for _ in range(10):
+        renderer.scroll(1, 1)
+
+    assert renderer._view_origin == Coord(40, 14)
+
+
+def test_zoom_keeps_the_viewport_centre() -> None:
+    renderer = PygameRenderer(GameConfig(width=100, height=50, num_mines=10, tile_size_px=20))
+    renderer.zoom(1)
+    renderer.scroll(1, 1)
+    renderer.zoom(1)
+
+    assert renderer._tile_size == 40
+    assert renderer._visible_span() == (30, 18)
+    assert renderer._view_origin == Coord(50, 23)
+
+
+def test_minimap_draws_one_pixel_per_tile() -> None:
+    renderer = PygameRenderer(GameConfig(width=100, height=50, num_mines=10, tile_size_px=20))
+    board = _large_board(100, 50)
+    renderer.zoom(-2)
+
+    renderer.render(board, 0.0, AI_WATCH, True)
+
+    assert renderer._tile_size == 1
+    assert renderer._drawn_tiles == {}
+    left, top = renderer._board_rect.topleft
+    assert renderer._surface.get_at((left, top))[:3] == renderer._theme.revealed_zero
+    assert renderer._surface.get_at((left + 1, top))[:3] == renderer._theme.flagged_tile
+    assert renderer._surface.get_at((left + 2, top))[:3] == renderer._theme.hidden_tile
+    assert renderer.board_coord_from_screen(left + 7, top + 3) == Coord(7, 3)
+
+
+def test_minimap_without_numpy_matches_surfarray_output() -> None:
+    pytest.importorskip("numpy")
+    renderer = PygameRenderer(GameConfig(width=3, height=2, num_mines=1, tile_size_px=20))
+    states = bytes([0, 1, 2, 3, 4, 0])
+
+    with_numpy = renderer._minimap_surface(states, 3, 2)
+    renderer._numpy = None
+    without_numpy = renderer._minimap_surface(states, 3, 2)
+
+    for x in range(3):
+        for y in range(2):
+            assert with_numpy.get_at((x, y)) == without_numpy.get_at((x, y))
+    assert with_numpy.get_at((1, 0))[:3] == renderer._theme.flagged_tile
+
+
+def test_arrow_keys_and_wheel_move_the_viewport() -> None:
+    renderer = PygameRenderer(GameConfig(width=100, height=50, num_mines=10, tile_size_px=20))
+    pygame.event.clear()
+    pygame.event.post(pygame.event.Event(pygame.MOUSEWHEEL, x=0, y=1))
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RIGHT))
+
+    events = poll_events(PLAYER, renderer)
+
+    assert events == [RedrawEvent(), RedrawEvent()]
+    assert renderer._tile_size == 20
+    assert renderer._view_origin == Coord(35, 7)
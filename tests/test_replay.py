@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import pygame
+import pytest
+
+from minesweeper.domain.move import Move
+from minesweeper.domain.types import ActionType, Coord
+from minesweeper.engine.replay import RecordedGame, save_recordings
+from minesweeper.replay import ReplayViewer, main
+
+
+@pytest.fixture(autouse=True)
+def pygame_dummy_display(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    pygame.quit()
+    yield
+    pygame.quit()
+
+
+def _recording(label: str = "fast seed 1") -> RecordedGame:
+    moves = tuple(Move(ActionType.FLAG, Coord(x, 0)) for x in range(9)) + tuple(
+        Move(ActionType.FLAG, Coord(x, 1)) for x in range(9)
+    )
+    return RecordedGame(9, 9, 10, seed=1, moves=moves, label=label)
+
+
+def test_advance_plays_moves_at_the_chosen_speed() -> None:
+    viewer = ReplayViewer([_recording()], speed=8)
+
+    assert viewer.advance(100) is False
+    assert viewer.advance(150) is True
+    assert viewer.replay.position == 2
+
+    viewer.advance(10_000)
+    assert viewer.replay.position == 18
+    assert viewer.playing is False
+
+
+def test_keys_step_jump_and_change_speed() -> None:
+    viewer = ReplayViewer([_recording()], speed=8)
+
+    viewer.handle_key(pygame.K_PERIOD)
+    assert (viewer.playing, viewer.replay.position) == (False, 1)
+
+    viewer.handle_key(pygame.K_5)
+    assert viewer.replay.position == 9
+    viewer.handle_key(pygame.K_COMMA)
+    assert viewer.replay.position == 8
+
+    viewer.handle_key(pygame.K_END)
+    assert viewer.replay.position == 18
+    viewer.handle_key(pygame.K_SPACE)
+    assert (viewer.playing, viewer.replay.position) == (True, 0)
+
+    viewer.handle_key(pygame.K_RIGHTBRACKET)
+    assert viewer.speed == 16
+    assert viewer.status() == ("fast seed 1 • move 0/18", "16 moves/s")
+
+
+def test_switching_recordings_keeps_each_position() -> None:
+    viewer = ReplayViewer([_recording("first"), _recording("second")], start_move=4)
+
+    viewer.handle_key(pygame.K_n)
+    assert viewer.status()[0] == "second • move 0/18"
+
+    viewer.handle_key(pygame.K_p)
+    assert viewer.status()[0] == "first • move 4/18"
+
+
+def test_render_shows_the_replayed_board() -> None:
+    viewer = ReplayViewer([_recording()], start_move=1)
+
+    viewer._render()
+
+    assert viewer._view.speed_label == "8 moves/s"
+    assert viewer._view._drawn_tiles[Coord(0, 0)][0].name == "FLAGGED"
+
+
+def test_main_lists_recorded_games(tmp_path, capsys) -> None:
+    path = tmp_path / "losses.jsonl"
+    save_recordings([_recording()], path)
+
+    assert main([str(path), "--list"]) == 0
+
+    assert capsys.readouterr().out == "1: fast seed 1 (9x9, 10 mines, seed 1, 18 moves)\n"
+
+
+def test_main_rejects_unknown_games(tmp_path) -> None:
+    path = tmp_path / "losses.jsonl"
+    save_recordings([_recording()], path)
+
+    with pytest.raises(SystemExit):
+        main([str(path), "--game", "2"])
+
+
+def test_main_reports_malformed_recordings(tmp_path, capsys) -> None:
+    path = tmp_path / "losses.jsonl"
+    path.write_text('{"width": "9", "height": 9, "num_mines": 10, "seed": 1, "moves": []}\n', encoding="utf-8")
+
+    with pytest.raises(SystemExit):
+        main([str(path), "--list"])
+
+    assert "needs integer width" in capsys.readouterr().err
@@ -0,0 +1,249 @@
+import threading
+import time
+
+import pytest
+
+from minesweeper.ai.analyzer import AnalyzedBoard
+from minesweeper.ai.cancellation import StrategyCancelled, raise_if_cancelled
+from minesweeper.ai.instrumentation import StrategyProfiler
+from minesweeper.ai.runner import StrategyRunner
+from minesweeper.domain.move import Move
+from minesweeper.domain.types import ActionType, Coord
+
+
+class StubStrategy:
+    def __init__(self, name: str, moves: list[Move], wait_for: threading.Event | None = None) -> None:
+        self._name = name
+        self._moves = moves
+        self._wait_for = wait_for
+        self.calls = 0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def find_moves(self, analysis: AnalyzedBoard) -> list[Move]:
+        self.calls += 1
+        if self._wait_for is not None:
+            self._wait_for.wait(timeout=1)
+        return self._moves
+
+
+class SignallingStrategy(StubStrategy):
+    def __init__(self, name: str, moves: list[Move], done: threading.Event) -> None:
+        super().__init__(name, moves)
+        self._done = done
+
+    def find_moves(self, analysis: AnalyzedBoard) -> list[Move]:
+        moves = super().find_moves(analysis)
+        self._done.set()
+        return moves
+
+
+class SleepingStrategy(StubStrategy):
+    def __init__(self, name: str, moves: list[Move], seconds: float) -> None:
+        super().__init__(name, moves)
+        self._seconds = seconds
+
+    def find_moves(self, analysis: AnalyzedBoard) -> list[Move]:
+        time.sleep(self._seconds)
+        return super().find_moves(analysis)
+
+
+class CooperativeStrategy(StubStrategy):
+    def __init__(self, name: str, moves: list[Move], seconds: float) -> None:
+        super().__init__(name, moves)
+        self._seconds = seconds
+        self.started = threading.Event()
+        self.cancelled = threading.Event()
+
+    def find_moves(self, analysis: AnalyzedBoard) -> list[Move]:
+        self.started.set()
+        deadline = time.monotonic() + self._seconds
+        try:
+            while time.monotonic() < deadline:
+                raise_if_cancelled()
+                time.sleep(0.001)
+        except StrategyCancelled:
+            self.cancelled.set()
+            raise
+        return super().find_moves(analysis)
+
+
+REVEAL = Move(ActionType.REVEAL, Coord(0, 0))
+FLAG = Move(ActionType.FLAG, Coord(1, 1))
+
+
+def test_sequential_runner_stops_at_first_non_empty_strategy() -> None:
+    empty = StubStrategy("empty", [])
+    first = StubStrategy("first", [REVEAL])
+    later = StubStrategy("later", [FLAG])
+
+    result = StrategyRunner().first_result([empty, first, later], AnalyzedBoard())
+
+    assert result is not None
+    assert result.strategy is first
+    assert result.moves == [REVEAL]
+    assert later.calls == 0
+
+
+def test_runner_returns_none_when_every_strategy_is_empty() -> None:
+    strategies = [StubStrategy("a", []), StubStrategy("b", [])]
+
+    assert StrategyRunner().first_result(strategies, AnalyzedBoard()) is None
+    assert StrategyRunner(max_workers=2).first_result(strategies, AnalyzedBoard()) is None
+
+
+def test_speculative_runner_keeps_chain_priority_when_lower_strategy_finishes_first() -> None:
+    lower_done = threading.Event()
+    higher = StubStrategy("higher", [REVEAL], wait_for=lower_done)
+    lower = SignallingStrategy("lower", [FLAG], lower_done)
+    runner = StrategyRunner(max_workers=2)
+
+    try:
+        result = runner.first_result([higher, lower], AnalyzedBoard())
+    finally:
+        runner.close()
+
+    assert result is not None
+    assert result.strategy is higher
+    assert lower.calls == 1
+
+
+def test_speculative_runner_falls_through_empty_higher_priority_results() -> None:
+    runner = StrategyRunner(max_workers=3)
+    fallback = StubStrategy("fallback", [FLAG])
+
+    try:
+        result = runner.first_result(
+            [StubStrategy("a", []), StubStrategy("b", []), fallback],
+            AnalyzedBoard(),
+        )
+    finally:
+        runner.close()
+
+    assert result is not None
+    assert result.strategy is fallback
+
+
+class ReentrancyCheckingStrategy(StubStrategy):
+    def __init__(self, name: str, moves: list[Move], started: threading.Event, release: threading.Event) -> None:
+        super().__init__(name, moves, wait_for=release)
+        self._started = started
+        self._lock = threading.Lock()
+        self.overlapped = False
+
+    def find_moves(self, analysis: AnalyzedBoard) -> list[Move]:
+        if not self._lock.acquire(blocking=False):
+            self.overlapped = True
+            return self._moves
+        try:
+            self._started.set()
+            return super().find_moves(analysis)
+        finally:
+            self._lock.release()
+
+
+def test_speculative_runner_never_overlaps_calls_to_one_strategy() -> None:
+    started = threading.Event()
+    release = threading.Event()
+    winner = StubStrategy("winner", [REVEAL], wait_for=started)
+    slow = ReentrancyCheckingStrategy("slow", [FLAG], started, release)
+    runner = StrategyRunner(max_workers=3)
+    timer = threading.Timer(0.05, release.set)
+
+    try:
+        first = runner.first_result([winner, slow], AnalyzedBoard())
+        timer.start()
+        second = runner.first_result([StubStrategy("empty", []), slow], AnalyzedBoard())
+    finally:
+        timer.cancel()
+        runner.close()
+
+    assert first is not None and first.strategy is winner
+    assert second is not None and second.strategy is slow
+    assert slow.calls == 2
+    assert not slow.overlapped
+
+
+def test_speculative_runner_cancels_running_calls_once_a_result_is_found() -> None:
+    stale = CooperativeStrategy("stale", [FLAG], seconds=5)
+    winner = StubStrategy("winner", [REVEAL], wait_for=stale.started)
+    runner = StrategyRunner(max_workers=2)
+
+    try:
+        result = runner.first_result([winner, stale], AnalyzedBoard())
+        assert stale.cancelled.wait(timeout=1)
+    finally:
+        runner.close()
+
+    assert result is not None and result.strategy is winner
+    assert stale.calls == 0
+
+
+def test_raise_if_cancelled_is_a_no_op_outside_a_runner() -> None:
+    raise_if_cancelled()
+
+
+def test_speculative_runner_is_not_slower_than_sequential() -> None:
+    def play(max_workers: int) -> float:
+        strategies = [
+            SleepingStrategy("empty", [], seconds=0.03),
+            SleepingStrategy("hit", [REVEAL], seconds=0.03),
+            CooperativeStrategy("stale", [FLAG], seconds=0.5),
+        ]
+        runner = StrategyRunner(max_workers=max_workers)
+        start = time.perf_counter()
+        try:
+            for _ in range(10):
+                result = runner.first_result(strategies, AnalyzedBoard())
+                assert result is not None and result.strategy is strategies[1]
+        finally:
+            runner.close()
+        return time.perf_counter() - start
+
+    assert play(max_workers=3) < play(max_workers=1)
+
+
+def test_accept_filter_can_reject_a_result() -> None:
+    rejected = StubStrategy("rejected", [FLAG])
+    accepted = StubStrategy("accepted", [REVEAL])
+
+    result = StrategyRunner().first_result(
+        [rejected, accepted],
+        AnalyzedBoard(),
+        accept=lambda moves: [move for move in moves if move.action == ActionType.REVEAL],
+    )
+
+    assert result is not None
+    assert result.strategy is accepted
+
+
+def test_runner_requires_a_worker() -> None:
+    with pytest.raises(ValueError):
+        StrategyRunner(max_workers=0)
+
+
+def test_runner_records_every_strategy_call_with_a_profiler() -> None:
+    profiler = StrategyProfiler()
+    runner = StrategyRunner(profiler=profiler)
+
+    runner.first_result(
+        [StubStrategy("empty", []), StubStrategy("first", [REVEAL, FLAG]), StubStrategy("later", [FLAG])],
+        AnalyzedBoard(),
+    )
+
+    assert [(stats.name, stats.calls, stats.hits, stats.moves) for stats in runner.strategy_stats()] == [
+        ("empty", 1, 0, 0),
+        ("first", 1, 1, 2),
+    ]
+    assert runner.report_lines()[0] == "Strategy stats:"
+
+
+def test_runner_without_profiler_reports_nothing() -> None:
+    runner = StrategyRunner()
+    runner.first_result([StubStrategy("first", [REVEAL])], AnalyzedBoard())
+
+    assert runner.profiler is None
+    assert runner.strategy_stats() == []
+    assert runner.report_lines() == []
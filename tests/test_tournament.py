@@ -0,0 +1,142 @@
+import random
+
+import pytest
+
+import minesweeper.bench.tournament as tournament_module
+from minesweeper.bench.__main__ import main
+from minesweeper.bench.tournament import (
+    GameRecord,
+    PairedComparison,
+    TournamentResult,
+    mcnemar_p_value,
+    play_game,
+    run_tournament,
+)
+from minesweeper.domain.types import GameConfig
+from minesweeper.engine.board_impl import Board
+from minesweeper.engine.replay import RecordedGame, load_recordings
+
+BEGINNER = GameConfig(width=9, height=9, num_mines=10)
+
+
+def test_mcnemar_p_value_only_counts_discordant_pairs() -> None:
+    assert mcnemar_p_value(0, 0) == 1.0
+    assert mcnemar_p_value(0, 5) == pytest.approx(2 / 32)
+    assert mcnemar_p_value(9, 1) == pytest.approx(2 * 11 / 1024)
+    assert mcnemar_p_value(3, 3) == 1.0
+
+
+def test_paired_comparison_reports_win_rate_difference() -> None:
+    comparison = PairedComparison("base", "new", games=20, baseline_only_wins=1, challenger_only_wins=5)
+
+    assert comparison.win_rate_difference == pytest.approx(0.2)
+    assert comparison.describe().startswith("new vs base: +20.0% win rate")
+
+
+def test_play_game_is_deterministic_per_seed() -> None:
+    first = play_game(("PatternDetector", "ProbabilitySolver"), BEGINNER, seed=3)
+    second = play_game(("PatternDetector", "ProbabilitySolver"), BEGINNER, seed=3)
+
+    assert (first.won, first.moves, first.is_evaluable) == (second.won, second.moves, second.is_evaluable)
+    assert first.moves == len(first.played) > 0
+    assert first.played == second.played
+
+
+def test_play_game_draws_random_clicks_independently_of_the_board() -> None:
+    expert = GameConfig(width=30, height=16, num_mines=99)
+    first_clicks = [play_game(("RandomExplorer",), expert, seed).played[0].coord for seed in range(20)]
+
+    on_mines = sum(
+        Board(expert, random.Random(seed)).tile_at(coord).is_mine
+        for seed, coord in enumerate(first_clicks)
+    )
+    assert on_mines < 10
+
+
+def test_run_tournament_pairs_chains_on_the_same_seeds(monkeypatch) -> None:
+    played: list[tuple[tuple[str, ...], int]] = []
+
+    def stub_play_game(names, config, seed) -> GameRecord:
+        played.append((tuple(names), seed))
+        won = seed % 2 == 0 if names == ("PatternDetector",) else seed < 3
+        return GameRecord(seed=seed, won=won, is_evaluable=seed > 0, seconds=0.5, moves=seed)
+
+    monkeypatch.setattr(tournament_module, "play_game", stub_play_game)
+
+    result = run_tournament(["PatternDetector", "ProbabilitySolver"], BEGINNER, games=4, workers=1)
+
+    assert sorted(played) == [
+        (("PatternDetector",), seed) for seed in range(4)
+    ] + [(("ProbabilitySolver",), seed) for seed in range(4)]
+    baseline, challenger = result.summaries
+    assert (baseline.wins, challenger.wins) == (2, 3)
+    assert baseline.evaluable_win_rate == pytest.approx(1 / 3)
+    assert challenger.mean_seconds == pytest.approx(0.5)
+    assert challenger.mean_moves == pytest.approx(1.5)
+    assert result.comparisons == (
+        PairedComparison("PatternDetector", "ProbabilitySolver", 4, baseline_only_wins=0, challenger_only_wins=1),
+    )
+    assert [loss.label for loss in result.losses] == [
+        "PatternDetector seed 1",
+        "PatternDetector seed 3",
+        "ProbabilitySolver seed 3",
+    ]
+
+
+def test_run_tournament_matches_serial_results_across_processes() -> None:
+    chains = ["PatternDetector,ProbabilitySolver", "UnitPropagationSolver,ProbabilitySolver"]
+
+    serial = run_tournament(chains, BEGINNER, games=3, workers=1)
+    parallel = run_tournament(chains, BEGINNER, games=3, workers=2)
+
+    assert [(summary.wins, summary.mean_moves) for summary in parallel.summaries] == [
+        (summary.wins, summary.mean_moves) for summary in serial.summaries
+    ]
+    assert parallel.comparisons == serial.comparisons
+
+
+def test_run_tournament_needs_two_chains() -> None:
+    with pytest.raises(ValueError, match="two chains"):
+        run_tournament(["fast"], BEGINNER, games=1, workers=1)
+
+
+def test_tournament_command_prints_report(monkeypatch, capsys) -> None:
+    received: dict[str, object] = {}
+
+    def stub_run_tournament(chains, config, games, seed, workers, progress) -> TournamentResult:
+        received.update(chains=chains, config=config, games=games, seed=seed, workers=workers)
+        return TournamentResult(
+            summaries=(),
+            comparisons=(PairedComparison("default", "fast", 10, 2, 2),),
+        )
+
+    monkeypatch.setattr("minesweeper.bench.__main__.run_tournament", stub_run_tournament)
+
+    assert main(["tournament", "--chain", "default", "--chain", "fast", "--preset", "beginner", "--games", "10"]) == 0
+
+    assert received == {
+        "chains": ["default", "fast"],
+        "config": BEGINNER,
+        "games": 10,
+        "seed": 0,
+        "workers": None,
+    }
+    assert "fast vs default: +0.0% win rate" in capsys.readouterr().out
+
+
+def test_tournament_command_rejects_unknown_chains() -> None:
+    with pytest.raises(SystemExit):
+        main(["tournament", "--chain", "default", "--chain", "Nope"])
+
+
+def test_tournament_command_writes_lost_games(monkeypatch, tmp_path) -> None:
+    loss = RecordedGame(9, 9, 10, seed=4, label="fast seed 4")
+    monkeypatch.setattr(
+        "minesweeper.bench.__main__.run_tournament",
+        lambda *_args, **_kwargs: TournamentResult(summaries=(), comparisons=(), losses=(loss,)),
+    )
+    path = tmp_path / "losses.jsonl"
+
+    assert main(["tournament", "--chain", "default", "--chain", "fast", "--record-losses", str(path)]) == 0
+
+    assert load_recordings(path) == [loss]
@@ -0,0 +1,117 @@
+from minesweeper.ai.analyzer import AnalyzedBoard
+from minesweeper.ai.strategies import unit_propagation as unit_propagation_module
+from minesweeper.ai.strategies.unit_propagation import UnitPropagationSolver
+from minesweeper.domain.types import ActionType, Coord
+
+
+def _one_two_one_analysis() -> AnalyzedBoard:
+    return AnalyzedBoard(
+        grid={Coord(0, 1): 1, Coord(1, 1): 2, Coord(2, 1): 1},
+        frontier=[Coord(0, 1), Coord(1, 1), Coord(2, 1)],
+        unknown_coords=frozenset({Coord(0, 0), Coord(1, 0), Coord(2, 0)}),
+        flagged_coords=frozenset(),
+        total_mines=2,
+    )
+
+
+def test_single_constraint_flags_mine() -> None:
+    frontier = Coord(1, 1)
+    target = Coord(0, 0)
+    analysis = AnalyzedBoard(
+        grid={frontier: 1},
+        frontier=[frontier],
+        unknown_coords=frozenset({target}),
+        flagged_coords=frozenset(),
+        total_mines=1,
+    )
+
+    assert UnitPropagationSolver().find_moves(analysis) == [
+        (ActionType.FLAG, target),
+    ]
+
+
+def test_conflict_learning_solves_one_two_one() -> None:
+    assert UnitPropagationSolver().find_moves(_one_two_one_analysis()) == [
+        (ActionType.FLAG, Coord(0, 0)),
+        (ActionType.FLAG, Coord(2, 0)),
+        (ActionType.REVEAL, Coord(1, 0)),
+    ]
+
+
+def test_accounts_for_flagged_neighbors() -> None:
+    frontier = Coord(1, 1)
+    analysis = AnalyzedBoard(
+        grid={frontier: 1},
+        frontier=[frontier],
+        unknown_coords=frozenset({Coord(0, 0), Coord(1, 0)}),
+        flagged_coords=frozenset({Coord(2, 2)}),
+        total_mines=1,
+    )
+
+    assert UnitPropagationSolver().find_moves(analysis) == [
+        (ActionType.REVEAL, Coord(0, 0)),
+        (ActionType.REVEAL, Coord(1, 0)),
+    ]
+
+
+def test_undetermined_component_returns_no_moves() -> None:
+    frontier = Coord(1, 1)
+    analysis = AnalyzedBoard(
+        grid={frontier: 1},
+        frontier=[frontier],
+        unknown_coords=frozenset({Coord(0, 0), Coord(1, 0)}),
+        flagged_coords=frozenset(),
+        total_mines=1,
+    )
+
+    assert UnitPropagationSolver().find_moves(analysis) == []
+
+
+def test_exhausted_search_budget_claims_nothing() -> None:
+    assert UnitPropagationSolver(max_search_nodes=0).find_moves(_one_two_one_analysis()) == []
+
+
+def test_unchanged_components_reuse_cached_deductions(monkeypatch) -> None:
+    calls: list[int] = []
+    original_solve = unit_propagation_module.ComponentSearch.solve
+
+    def counting_solve(self):
+        calls.append(1)
+        return original_solve(self)
+
+    monkeypatch.setattr(unit_propagation_module.ComponentSearch, "solve", counting_solve)
+    solver = UnitPropagationSolver()
+    analysis = _one_two_one_analysis()
+
+    first = solver.find_moves(analysis)
+    second = solver.find_moves(analysis)
+
+    assert first == second
+    assert len(calls) == 1
+
+
+def test_changed_component_is_solved_again(monkeypatch) -> None:
+    calls: list[int] = []
+    original_solve = unit_propagation_module.ComponentSearch.solve
+
+    def counting_solve(self):
+        calls.append(1)
+        return original_solve(self)
+
+    monkeypatch.setattr(unit_propagation_module.ComponentSearch, "solve", counting_solve)
+    solver = UnitPropagationSolver()
+    solver.find_moves(_one_two_one_analysis())
+
+    changed = AnalyzedBoard(
+        grid={Coord(0, 1): 1, Coord(1, 1): 2, Coord(2, 1): 1},
+        frontier=[Coord(0, 1), Coord(1, 1), Coord(2, 1)],
+        unknown_coords=frozenset({Coord(1, 0), Coord(2, 0)}),
+        flagged_coords=frozenset({Coord(0, 0)}),
+        total_mines=2,
+    )
+
+    assert solver.find_moves(changed) == [
+        (ActionType.FLAG, Coord(2, 0)),
+        (ActionType.REVEAL, Coord(1, 0)),
+    ]
+    assert len(calls) == 2